@@ -0,0 +1,84 @@
+"""
+Generators of realistic DemoConfigManager configs, sized in config nodes.
+
+A node is a key of a dict or an item of a list, so that shapes of the same
+size hold roughly the same amount of raw data:
+- wide: many top-level sections of scalars, built as undefined options
+- deep: a binary tree of nested children, log2(nodes) levels deep
+- children: one long ChildrenConfigOption list of small children
+
+Generators are deterministic, configs of the same shape and size are equal.
+"""
+
+from __future__ import annotations
+
+import os
+from typing import Any
+
+# Sizes of the scale benchmarks, larger ones take minutes and gigabytes.
+SCALE_SIZES = [1_000, 10_000, 100_000, 1_000_000]
+
+# Largest size run, override with WEXAMPLE_CONFIG_BENCHMARK_MAX_NODES=1000000.
+SCALE_MAX_NODES = int(os.environ.get("WEXAMPLE_CONFIG_BENCHMARK_MAX_NODES", 10_000))
+
+SHAPES = ["wide", "deep", "children"]
+
+_SECTION_KEYS = 10
+
+
+def children_config(nodes: int) -> dict[str, Any]:
+    """One list of children with a name and no children, 3 nodes each."""
+    return {
+        "children": [
+            {"name": f"child_{i}", "children": []} for i in range(max(1, nodes // 3))
+        ]
+    }
+
+
+def config_with_change(shape: str, config: dict[str, Any]) -> dict[str, Any]:
+    """Copy of a generated config with a single leaf changed."""
+    import copy
+
+    changed = copy.deepcopy(config)
+    if shape == "wide":
+        changed["section_0"]["key_0"] = -1
+    elif shape == "deep":
+        node = changed
+        while node["children"]:
+            node = node["children"][-1]
+        node["name"] = "changed"
+    else:
+        changed["children"][-1]["name"] = "changed"
+
+    return changed
+
+
+def deep_config(nodes: int) -> dict[str, Any]:
+    """A binary tree of children with a name each, 3 nodes per child."""
+    count = max(1, nodes // 3)
+    tree = [{"name": f"node_{i}", "children": []} for i in range(count)]
+
+    # Children of node i are nodes 2i + 1 and 2i + 2, breadth first.
+    for i in range(1, count):
+        tree[(i - 1) // 2]["children"].append(tree[i])
+
+    return tree[0]
+
+
+def generate_config(shape: str, nodes: int) -> dict[str, Any]:
+    generators = {
+        "children": children_config,
+        "deep": deep_config,
+        "wide": wide_config,
+    }
+    return generators[shape](nodes)
+
+
+def wide_config(nodes: int) -> dict[str, Any]:
+    """Sections of scalars, 11 nodes per section."""
+    return {
+        f"section_{i}": {
+            f"key_{j}": i * _SECTION_KEYS + j for j in range(_SECTION_KEYS)
+        }
+        for i in range(max(1, nodes // (_SECTION_KEYS + 1)))
+    }
@@ -13,8 +13,10 @@ Notes:
 
 from __future__ import annotations
 
+from wexample_config.classes.config_path import ConfigPath
 from wexample_config.config_value.config_value import ConfigValue
 from wexample_config.config_value.config_value_collection import ConfigValueCollection
+from wexample_config.config_value.custom_type_config_value import CustomTypeConfigValue
 from wexample_config.config_value.nested_config_value import NestedConfigValue
 
 # ---------------------------------------------------------------------------
@@ -49,6 +51,7 @@ _LARGE_NESTED_RAW = {
 _SHALLOW = NestedConfigValue(raw=dict(_SHALLOW_RAW))
 _DEEP = NestedConfigValue(raw=dict(_DEEP_RAW))
 _LARGE_NESTED = NestedConfigValue(raw=dict(_LARGE_NESTED_RAW))
+_DEEP_INDEXED = NestedConfigValue.indexed(dict(_DEEP_RAW))
 
 _CV_NONE = ConfigValue(raw=None)
 _CV_EMPTY_STR = ConfigValue(raw="")
@@ -74,6 +77,10 @@ _COLLECTION_100 = ConfigValueCollection.from_raw_values(list(range(100)))
 _COLLECTION_STR_100 = ConfigValueCollection.from_raw_values(
     [f"item_{i}" for i in range(100)]
 )
+# Numeric tuning table, one entry out of 100 missing.
+_COLLECTION_FLOAT_100K = ConfigValueCollection.from_raw_values(
+    [None if i % 100 == 0 else i * 0.5 for i in range(100_000)]
+)
 
 # ---------------------------------------------------------------------------
 # NestedConfigValue._wrap  — entry point for all wrapping; called at init
@@ -134,6 +141,26 @@ def test_nested_init_large_nested(benchmark):
     benchmark(_init_large_nested)
 
 
+def _init_large_nested_lazy() -> NestedConfigValue:
+    return NestedConfigValue(raw=dict(_LARGE_NESTED_RAW), lazy=True)
+
+
+def _init_large_nested_lazy_read_one() -> ConfigValue:
+    return NestedConfigValue(raw=dict(_LARGE_NESTED_RAW), lazy=True).search(
+        "section_5.opt_5"
+    )
+
+
+def test_nested_init_large_nested_lazy(benchmark):
+    """Construct lazily from a 10×10 nested dict — no child is wrapped."""
+    benchmark(_init_large_nested_lazy)
+
+
+def test_nested_init_large_nested_lazy_read_one(benchmark):
+    """Lazy construction plus one deep read — only the touched path is wrapped."""
+    benchmark(_init_large_nested_lazy_read_one)
+
+
 # ---------------------------------------------------------------------------
 # NestedConfigValue.search  — dot-path traversal; called on every config read
 # ---------------------------------------------------------------------------
@@ -154,6 +181,26 @@ def test_search_five_levels(benchmark):
     benchmark(_DEEP.search, "app.server.ssl.enabled")
 
 
+def test_search_five_levels_compiled(benchmark):
+    """Traverse a 5-segment path compiled once ahead of time."""
+    path = ConfigPath.from_string("app.server.ssl.enabled")
+    benchmark(_DEEP.search, path)
+
+
+def test_search_five_levels_mapped(benchmark, tmp_path):
+    """Traverse a 5-segment path of a memory-mapped config file."""
+    from wexample_config.config_value.mapped_config_value import MappedConfigValue
+
+    path = str(tmp_path / "config.bin")
+    MappedConfigValue.write_file(_DEEP_RAW, path)
+    benchmark(MappedConfigValue.open(path).search, "app.server.ssl.enabled")
+
+
+def test_search_five_levels_indexed(benchmark):
+    """Resolve a 5-segment leaf path through the flat index."""
+    benchmark(_DEEP_INDEXED.search, "app.server.ssl.enabled")
+
+
 def test_search_missing_key(benchmark):
     """Path that does not exist — exercises the early-exit / default branch."""
     benchmark(_DEEP.search, "app.nonexistent.key")
@@ -221,6 +268,36 @@ def test_set_by_path_deep(benchmark):
     benchmark(target.set_by_path, "app.server.port", 443)
 
 
+def test_set_by_path_deep_indexed(benchmark):
+    """Set a value at depth 3 while keeping the flat index in sync."""
+    target = NestedConfigValue.indexed(dict(_DEEP_RAW))
+    benchmark(target.set_by_path, "app.server.port", 443)
+
+
+def test_set_by_path_deep_10k_subscribers(benchmark):
+    """Set a value at depth 3, one of 10k subscribed paths matching it."""
+    target = NestedConfigValue(raw=dict(_DEEP_RAW))
+    for i in range(10_000):
+        target.subscribe(f"app.section_{i}", lambda paths: None)
+    target.subscribe("app.server", lambda paths: None)
+    benchmark(target.set_by_path, "app.server.port", 443)
+
+
+# ---------------------------------------------------------------------------
+# ConfigValue construction  — one per leaf when wrapping a config
+# ---------------------------------------------------------------------------
+
+
+def test_config_value_init_any(benchmark):
+    """Construct a ConfigValue allowing Any — validation is skipped."""
+    benchmark(ConfigValue, raw="value")
+
+
+def test_config_value_init_typed(benchmark):
+    """Construct a ConfigValue subclass restricted to str — validated."""
+    benchmark(CustomTypeConfigValue, raw="value")
+
+
 # ---------------------------------------------------------------------------
 # ConfigValue._resolve_nested  — unwrap a chain of nested ConfigValue wrappers
 # ---------------------------------------------------------------------------
@@ -241,6 +318,11 @@ def test_resolve_nested_depth_10(benchmark):
     benchmark(_CHAIN_10._resolve_nested)
 
 
+def test_get_str_depth_10(benchmark):
+    """Typed getter through a 10-deep wrapper chain, same cost as depth 1."""
+    benchmark(_CHAIN_10.get_str)
+
+
 # ---------------------------------------------------------------------------
 # ConfigValue.is_empty  — multi-branch emptiness check; called on every access
 # ---------------------------------------------------------------------------
@@ -283,6 +365,28 @@ def test_collection_get_str_collection(benchmark):
     benchmark(_COLLECTION_STR_100.get_str_collection)
 
 
+def test_collection_get_float_or_none_collection_100k(benchmark):
+    """Per item get_float_or_none() on 100k values, reference for the array."""
+    benchmark(_COLLECTION_FLOAT_100K.get_float_or_none_collection)
+
+
+def test_collection_get_float_or_none_collection_100k_columnar(benchmark):
+    """Same as above on values stored in columns instead of ConfigValue items."""
+    from wexample_config.config_value.columnar_config_value_collection import (
+        ColumnarConfigValueCollection,
+    )
+
+    collection = ColumnarConfigValueCollection.from_raw_values(
+        [item.raw for item in _COLLECTION_FLOAT_100K]
+    )
+    benchmark(collection.get_float_or_none_collection)
+
+
+def test_collection_get_float_array_100k(benchmark):
+    """Bulk get_float_array() on 100k values: one type check pass, compact buffer."""
+    benchmark(_COLLECTION_FLOAT_100K.get_float_array)
+
+
 # ---------------------------------------------------------------------------
 # DemoConfigManager.set_value  — full config processing pipeline
 # pedantic + setup ensures a fresh manager instance for every round so we
@@ -336,3 +440,184 @@ def test_config_manager_get_allowed_options_registry(benchmark):
 
     manager = DemoConfigManager()
     benchmark(manager.get_allowed_options_registry)
+
+
+def test_options_registry_match_1k_names_1k_patterns(benchmark):
+    """Resolve 1k distinct names against 1k pattern names, memo cleared each round."""
+    from wexample_config.classes.options_registry import OptionsRegistry
+
+    registry = OptionsRegistry(
+        {f"family_{i}_*": ConfigValue for i in range(1_000)},
+    )
+    names = [f"family_{i}_item" for i in range(1_000)]
+
+    def _match_all():
+        registry._matches.clear()
+        return [registry.match(name) for name in names]
+
+    benchmark(_match_all)
+
+
+# ---------------------------------------------------------------------------
+# aset_value — 200 children named by callbacks waiting on I/O for 1ms each
+# ---------------------------------------------------------------------------
+
+
+async def _async_name(option) -> str:
+    import asyncio
+
+    await asyncio.sleep(0.001)
+    return "child"
+
+
+def _sync_name(option) -> str:
+    import time
+
+    time.sleep(0.001)
+    return "child"
+
+
+def _callback_children_config(callback) -> dict:
+    return {"children": [{"name": callback} for _ in range(200)]}
+
+
+def test_config_manager_set_value_200_callback_names(benchmark):
+    """Serial build, every callback waits in turn."""
+    from wexample_config.demo.demo_config_manager import DemoConfigManager
+
+    benchmark.pedantic(
+        lambda: DemoConfigManager().set_value(_callback_children_config(_sync_name)),
+        rounds=3,
+    )
+
+
+def test_config_manager_set_value_200_memoized_callback_names(benchmark):
+    """Serial build of callbacks declaring their dependencies, rendered once."""
+    from wexample_config.config_value.callback_render_config_value import (
+        CallbackRenderConfigValue,
+    )
+    from wexample_config.demo.demo_config_manager import DemoConfigManager
+
+    benchmark.pedantic(
+        lambda: DemoConfigManager().set_value(
+            _callback_children_config(
+                CallbackRenderConfigValue(raw=_sync_name, dependencies=[])
+            )
+        ),
+        rounds=3,
+    )
+
+
+def test_config_manager_aset_value_200_callback_names(benchmark):
+    """Async build, callbacks of sibling options wait concurrently."""
+    import asyncio
+
+    from wexample_config.demo.demo_config_manager import DemoConfigManager
+
+    benchmark.pedantic(
+        lambda: asyncio.run(
+            DemoConfigManager().aset_value(_callback_children_config(_async_name))
+        ),
+        rounds=3,
+    )
+
+
+# ---------------------------------------------------------------------------
+# Reload — diff-and-patch against a 10k options manager, one changed key
+# ---------------------------------------------------------------------------
+
+_RELOAD_CONFIG = {f"key_{i}": f"value_{i}" for i in range(10_000)}
+_RELOAD_CONFIG_CHANGED = {**_RELOAD_CONFIG, "key_5000": "changed"}
+
+
+def _reload_manager():
+    from wexample_config.demo.demo_config_manager import DemoConfigManager
+
+    manager = DemoConfigManager(allow_undefined_keys=True)
+    manager.set_value(dict(_RELOAD_CONFIG))
+    return manager
+
+
+def test_config_manager_rebuild_10k(benchmark):
+    """Full rebuild of a 10k options manager with a single changed key."""
+    from wexample_config.demo.demo_config_manager import DemoConfigManager
+
+    def setup():
+        return (DemoConfigManager(allow_undefined_keys=True),), {}
+
+    benchmark.pedantic(
+        lambda m: m.set_value(dict(_RELOAD_CONFIG_CHANGED)),
+        setup=setup,
+        rounds=5,
+    )
+
+
+def test_config_manager_reload_10k(benchmark):
+    """reload() of a 10k options manager with a single changed key."""
+
+    def setup():
+        return (_reload_manager(),), {}
+
+    benchmark.pedantic(
+        lambda m: m.reload(dict(_RELOAD_CONFIG_CHANGED)),
+        setup=setup,
+        rounds=5,
+    )
+
+
+# ---------------------------------------------------------------------------
+# Snapshot — warm start of a 1k children manager, restored vs rebuilt
+# ---------------------------------------------------------------------------
+
+_SNAPSHOT_CONFIG = {"children": [{"name": f"child_{i}"} for i in range(1_000)]}
+
+
+def test_config_manager_build_1k_children(benchmark):
+    """Cold start: build the option tree from the source config."""
+    from wexample_config.demo.demo_config_manager import DemoConfigManager
+
+    def setup():
+        return (DemoConfigManager(),), {}
+
+    benchmark.pedantic(
+        lambda m: m.set_value(_SNAPSHOT_CONFIG), setup=setup, rounds=10
+    )
+
+
+def test_config_manager_build_1k_children_traced(benchmark):
+    """Same build recording spans of every option class and phase."""
+    from wexample_config.classes.config_build_tracer import ConfigBuildTracer
+    from wexample_config.demo.demo_config_manager import DemoConfigManager
+
+    def setup():
+        return (DemoConfigManager(tracer=ConfigBuildTracer()),), {}
+
+    benchmark.pedantic(
+        lambda m: m.set_value(_SNAPSHOT_CONFIG), setup=setup, rounds=10
+    )
+
+
+def test_config_manager_build_many_1k_tenants(benchmark):
+    """Build a manager per tenant config with a single batch."""
+    from wexample_config.demo.demo_config_manager import DemoConfigManager
+
+    configs = [
+        {"name": f"tenant_{i % 10}", "children": [{"name": "worker"}]}
+        for i in range(1_000)
+    ]
+
+    batch = benchmark(DemoConfigManager.build_many, configs)
+    assert not batch.has_errors()
+    assert len(batch.managers) == 1_000
+
+
+def test_config_manager_snapshot_load_1k_children(benchmark, tmp_path):
+    """Warm start: restore the option tree from its binary snapshot."""
+    from wexample_config.classes.config_snapshot import ConfigSnapshot
+    from wexample_config.demo.demo_config_manager import DemoConfigManager
+
+    snapshot = ConfigSnapshot(path=str(tmp_path / "config.snapshot"))
+    snapshot.load_or_build(DemoConfigManager, _SNAPSHOT_CONFIG)
+
+    manager = benchmark(snapshot.load_or_build, DemoConfigManager, _SNAPSHOT_CONFIG)
+    assert len(manager.get_option("children").children) == 1_000
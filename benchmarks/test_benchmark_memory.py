@@ -0,0 +1,219 @@
+"""
+Memory benchmarks for wexample_config value trees.
+
+Run with:
+    pytest benchmarks/test_benchmark_memory.py --benchmark-only
+
+Each benchmark builds a tree of _LEAVES_COUNT primitive leaves under tracemalloc
+and stores the measured bytes per leaf in the benchmark "extra_info".
+"""
+
+from __future__ import annotations
+
+import tracemalloc
+from typing import Any
+
+from wexample_config.config_value.compact_nested_config_value import (
+    CompactNestedConfigValue,
+)
+from wexample_config.config_value.nested_config_value import NestedConfigValue
+
+_LEAVES_COUNT = 10_000
+
+_RAW = {
+    f"section_{i}": {f"opt_{j}": j for j in range(100)}
+    for i in range(_LEAVES_COUNT // 100)
+}
+
+
+def _fresh_raw() -> dict[str, Any]:
+    return {key: dict(section) for key, section in _RAW.items()}
+
+
+def _bytes_per_leaf(value_class: type[NestedConfigValue]) -> float:
+    raw = _fresh_raw()
+    tracemalloc.start()
+    try:
+        value = value_class(raw=raw)
+        size, _peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    assert value.search("section_0.opt_0").get_int() == 0
+    return size / _LEAVES_COUNT
+
+
+def _run(benchmark, value_class: type[NestedConfigValue]) -> float:
+    bytes_per_leaf = benchmark.pedantic(
+        _bytes_per_leaf, args=(value_class,), rounds=3, iterations=1
+    )
+    benchmark.extra_info["bytes_per_leaf"] = round(bytes_per_leaf, 1)
+    return bytes_per_leaf
+
+
+def test_memory_nested_config_value(benchmark):
+    """Bytes per leaf of a NestedConfigValue (attrs ConfigValue leaves)."""
+    _run(benchmark, NestedConfigValue)
+
+
+def test_memory_compact_nested_config_value(benchmark):
+    """Bytes per leaf of a CompactNestedConfigValue (slotted leaves)."""
+    compact = _run(benchmark, CompactNestedConfigValue)
+
+    assert compact < _bytes_per_leaf(NestedConfigValue)
+
+
+_TENANTS_COUNT = 1_000
+
+
+def _bytes_per_tenant(derive: bool) -> float:
+    base = NestedConfigValue(raw=_fresh_raw())
+    tenants = []
+    tracemalloc.start()
+    try:
+        for i in range(_TENANTS_COUNT):
+            overrides = {"section_0": {"opt_0": i}, "section_1": {"opt_1": i}}
+            if derive:
+                tenants.append(base.derive(overrides))
+            else:
+                tenant = NestedConfigValue(raw=_fresh_raw())
+                tenant.update_nested(overrides)
+                tenants.append(tenant)
+        size, _peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    assert tenants[-1].search("section_0.opt_0").get_int() == _TENANTS_COUNT - 1
+    return size / _TENANTS_COUNT
+
+
+def test_memory_tenants_derive(benchmark):
+    """Bytes per tenant derived from a shared base with two overridden keys."""
+    bytes_per_tenant = benchmark.pedantic(
+        _bytes_per_tenant, args=(True,), rounds=1, iterations=1
+    )
+    benchmark.extra_info["bytes_per_tenant"] = round(bytes_per_tenant, 1)
+
+    # Roughly the overridden sections, far from a whole base copy.
+    assert bytes_per_tenant * 10 < _bytes_per_leaf(NestedConfigValue) * _LEAVES_COUNT
+
+
+def _peak_bytes_load_json(streaming: bool) -> int:
+    import io
+    import json
+
+    from wexample_config.classes.config_value_loader import ConfigValueLoader
+
+    stream = io.StringIO(json.dumps(_RAW))
+    tracemalloc.start()
+    try:
+        if streaming:
+            value = ConfigValueLoader().load_json(stream)
+        else:
+            value = NestedConfigValue(raw=json.load(stream))
+        _size, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    assert value.search("section_0.opt_0").get_int() == 0
+    return peak
+
+
+def test_memory_load_json_streaming(benchmark):
+    """Peak bytes of loading a JSON config through ConfigValueLoader events."""
+    peak = benchmark.pedantic(
+        _peak_bytes_load_json, args=(True,), rounds=1, iterations=1
+    )
+    benchmark.extra_info["peak_bytes"] = peak
+
+    # Without the intermediate dict and the whole document text.
+    assert peak < _peak_bytes_load_json(False)
+
+
+_COLLECTION_COUNT = 100_000
+
+
+def _bytes_per_collection_item(columnar: bool) -> float:
+    from wexample_config.config_value.columnar_config_value_collection import (
+        ColumnarConfigValueCollection,
+    )
+    from wexample_config.config_value.config_value import ConfigValue
+    from wexample_config.config_value.config_value_collection import (
+        ConfigValueCollection,
+    )
+
+    raw_values = [i * 0.5 for i in range(_COLLECTION_COUNT)]
+    tracemalloc.start()
+    try:
+        if columnar:
+            collection = ColumnarConfigValueCollection.from_raw_values(raw_values)
+        else:
+            collection = ConfigValueCollection.from_config_values(
+                [ConfigValue(raw=value) for value in raw_values]
+            )
+        size, _peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    assert collection[-1].get_float() == (_COLLECTION_COUNT - 1) * 0.5
+    return size / _COLLECTION_COUNT
+
+
+def test_memory_collection_columnar(benchmark):
+    """Bytes per item of a homogeneous collection stored column-wise."""
+    bytes_per_item = benchmark.pedantic(
+        _bytes_per_collection_item, args=(True,), rounds=1, iterations=1
+    )
+    benchmark.extra_info["bytes_per_item"] = round(bytes_per_item, 1)
+
+    assert bytes_per_item * 5 < _bytes_per_collection_item(False)
+
+
+_PLUGIN_TENANTS_COUNT = 2_000
+
+
+def _retained_bytes_plugin_tenants() -> int:
+    import gc
+
+    from wexample_config.config_option.abstract_nested_config_option import (
+        BUILD_PLAN_CACHE_SIZE,
+        AbstractNestedConfigOption,
+    )
+    from wexample_config.demo.demo_config_manager import DemoConfigManager
+    from wexample_config.demo.option_provider.demo_options_provider import (
+        DemoOptionsProvider,
+    )
+
+    def _tenant(i: int) -> None:
+        # Providers created per tenant by a plugin system.
+        provider = type(f"TenantProvider{i}", (DemoOptionsProvider,), {})
+        manager = DemoConfigManager(options_providers=[provider])
+        manager.get_options_providers = lambda: [provider]
+        manager.set_value({"name": f"tenant_{i}"})
+
+    # Imports and class-level caches are warmed up outside of the measure.
+    _tenant(-1)
+    gc.collect()
+    tracemalloc.start()
+    try:
+        for i in range(_PLUGIN_TENANTS_COUNT):
+            _tenant(i)
+        gc.collect()
+        size, _peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    stats = AbstractNestedConfigOption.get_cache_stats()["build_plan"]
+    assert stats["size"] <= BUILD_PLAN_CACHE_SIZE
+    return size
+
+
+def test_memory_registry_cache_plugin_tenants(benchmark):
+    """Bytes retained after building managers with per-tenant provider classes."""
+    retained = benchmark.pedantic(
+        _retained_bytes_plugin_tenants, rounds=1, iterations=1
+    )
+    benchmark.extra_info["retained_bytes"] = retained
+
+    # Build plans of collected providers are dropped, nothing grows per tenant.
+    assert retained < _PLUGIN_TENANTS_COUNT * 10
@@ -0,0 +1,45 @@
+"""
+Benchmarks of ChildrenConfigOption builds, serial vs parallel.
+
+Run with:
+    pytest benchmarks/test_benchmark_parallel.py --benchmark-only
+
+Parallel builds use a ThreadPoolExecutor, they only scale on free-threaded
+Python builds; with the GIL they measure the scheduling overhead.
+"""
+
+from __future__ import annotations
+
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from wexample_config.demo.demo_config_manager import DemoConfigManager
+
+_CHILDREN_COUNTS = [1_000, 10_000, 100_000]
+_WORKERS = min(8, os.cpu_count() or 1)
+
+
+def _children(count: int) -> list[dict]:
+    return [{"name": f"child_{i}", "children": []} for i in range(count)]
+
+
+def _build(children: list[dict], executor: ThreadPoolExecutor | None) -> None:
+    DemoConfigManager(build_executor=executor).set_value({"children": children})
+
+
+@pytest.mark.parametrize("count", _CHILDREN_COUNTS)
+def test_children_build_serial(benchmark, count):
+    """Build count nested children one after the other."""
+    children = _children(count)
+    benchmark.pedantic(_build, args=(children, None), rounds=1, iterations=1)
+
+
+@pytest.mark.parametrize("count", _CHILDREN_COUNTS)
+def test_children_build_parallel(benchmark, count):
+    """Build count nested children across a thread pool."""
+    children = _children(count)
+    with ThreadPoolExecutor(max_workers=_WORKERS) as executor:
+        benchmark.pedantic(_build, args=(children, executor), rounds=1, iterations=1)
+    benchmark.extra_info["workers"] = _WORKERS
@@ -0,0 +1,243 @@
+"""
+End-to-end DemoConfigManager benchmarks at scale, on the shapes generated by
+config_generators (wide, deep and list-heavy children), from 1k to 1M nodes.
+
+Run with:
+    pytest benchmarks/test_benchmark_scale.py --benchmark-only
+
+Sizes above 10k nodes are skipped unless enabled:
+    WEXAMPLE_CONFIG_BENCHMARK_MAX_NODES=1000000 pytest benchmarks/test_benchmark_scale.py
+
+Compare against a stored baseline with pytest-benchmark, e.g. before a change:
+    pytest benchmarks --benchmark-only --benchmark-save=baseline
+then after it, failing on regressions of the mean above 10%:
+    pytest benchmarks --benchmark-only --benchmark-compare \\
+        --benchmark-compare-fail=mean:10%
+
+Memory and import time are stored in the benchmark "extra_info", saved along
+with timings in .benchmarks. Imports are also checked not to load the heavy
+dependencies deferred to their first use.
+"""
+
+from __future__ import annotations
+
+import tracemalloc
+from time import perf_counter
+from typing import Any
+
+import pytest
+from config_generators import (
+    SCALE_MAX_NODES,
+    SCALE_SIZES,
+    SHAPES,
+    config_with_change,
+    generate_config,
+)
+
+from wexample_config.demo.demo_config_manager import DemoConfigManager
+
+_SIZES = [
+    pytest.param(
+        size,
+        marks=pytest.mark.skipif(
+            size > SCALE_MAX_NODES,
+            reason="set WEXAMPLE_CONFIG_BENCHMARK_MAX_NODES to run larger sizes",
+        ),
+    )
+    for size in SCALE_SIZES
+]
+
+
+def _rounds(nodes: int) -> int:
+    return 5 if nodes <= 10_000 else 1
+
+
+def _manager() -> DemoConfigManager:
+    # Wide configs are made of sections no option is declared for.
+    return DemoConfigManager(allow_undefined_keys=True)
+
+
+def _built_manager(config: dict[str, Any]) -> DemoConfigManager:
+    manager = _manager()
+    manager.set_value(config)
+    return manager
+
+
+def _best_seconds(run, setup, rounds: int = 3) -> float:
+    """Shortest duration of run(setup()), outside of the benchmark timer."""
+    durations = []
+    for _ in range(rounds):
+        argument = setup()
+        start = perf_counter()
+        run(argument)
+        durations.append(perf_counter() - start)
+    return min(durations)
+
+
+@pytest.mark.parametrize("nodes", _SIZES)
+@pytest.mark.parametrize("shape", SHAPES)
+def test_scale_build(benchmark, shape, nodes):
+    """Build a manager from a generated config."""
+    config = generate_config(shape, nodes)
+
+    def setup():
+        return (_manager(),), {}
+
+    benchmark.pedantic(
+        lambda manager: manager.set_value(config),
+        setup=setup,
+        rounds=_rounds(nodes),
+    )
+    benchmark.extra_info["nodes"] = nodes
+
+
+@pytest.mark.parametrize("nodes", _SIZES)
+@pytest.mark.parametrize("shape", SHAPES)
+def test_scale_reload_unchanged(benchmark, shape, nodes):
+    """Reload a built manager with an equal config, nothing is rebuilt."""
+    config = generate_config(shape, nodes)
+    same_config = generate_config(shape, nodes)
+
+    def setup():
+        return (_built_manager(config),), {}
+
+    change_set = benchmark.pedantic(
+        lambda manager: manager.reload(same_config),
+        setup=setup,
+        rounds=_rounds(nodes),
+    )
+    assert not change_set.has_changes()
+
+
+@pytest.mark.parametrize("nodes", _SIZES)
+@pytest.mark.parametrize("shape", SHAPES)
+def test_scale_reload_one_change(benchmark, shape, nodes):
+    """Reload a built manager with a config differing by a single leaf."""
+    config = generate_config(shape, nodes)
+    changed_config = config_with_change(shape, config)
+
+    def setup():
+        return (_built_manager(config),), {}
+
+    change_set = benchmark.pedantic(
+        lambda manager: manager.reload(changed_config),
+        setup=setup,
+        rounds=_rounds(nodes),
+    )
+    assert change_set.has_changes()
+
+    # Only the changed leaf is rebuilt, whatever the shape of the tree.
+    build_seconds = _best_seconds(_built_manager, lambda: config)
+    reload_seconds = _best_seconds(
+        lambda manager: manager.reload(changed_config),
+        lambda: _built_manager(config),
+    )
+    benchmark.extra_info["build_seconds"] = build_seconds
+    assert reload_seconds < build_seconds / 3
+
+
+@pytest.mark.parametrize("nodes", _SIZES)
+@pytest.mark.parametrize("shape", SHAPES)
+def test_scale_dump_round_trip(benchmark, shape, nodes):
+    """Dump a built manager and build another one from the dump."""
+    manager = _built_manager(generate_config(shape, nodes))
+
+    def round_trip():
+        dumped = manager.dump()
+        return _built_manager(dumped), dumped
+
+    rebuilt, dumped = benchmark.pedantic(round_trip, rounds=_rounds(nodes))
+    assert rebuilt.dump() == dumped
+
+
+def _peak_bytes_build(config: dict[str, Any]) -> int:
+    tracemalloc.start()
+    try:
+        _built_manager(config)
+        _size, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return peak
+
+
+@pytest.mark.parametrize("nodes", _SIZES)
+@pytest.mark.parametrize("shape", SHAPES)
+def test_scale_build_peak_memory(benchmark, shape, nodes):
+    """Peak bytes allocated by a build, per node of the config."""
+    config = generate_config(shape, nodes)
+    # Imports and class-level caches are warmed up outside of the measure.
+    _built_manager(generate_config(shape, 100))
+
+    peak = benchmark.pedantic(_peak_bytes_build, args=(config,), rounds=1)
+    benchmark.extra_info["peak_bytes"] = peak
+    benchmark.extra_info["peak_bytes_per_node"] = round(peak / nodes, 1)
+
+
+# Dependencies loaded on first use only, never by importing the module.
+_DEFERRED_IMPORTS = {
+    "wexample_config": ["attr", "wexample_helpers"],
+    "wexample_config.demo.demo_config_manager": [
+        "asyncio",
+        "concurrent.futures",
+        "pydantic",
+        "wexample_helpers.exception.not_allowed_variable_type_exception",
+        "yaml",
+    ],
+}
+
+
+def _import_times(module: str) -> dict[str, int]:
+    """Cumulative import time of every module loaded by importing module in a
+    fresh interpreter, from -X importtime."""
+    import os
+    import subprocess
+    import sys
+
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        check=True,
+        # Finds the package as this process does, e.g. from src.
+        env={**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)},
+        text=True,
+    )
+
+    # Lines are "import time: self [us] | cumulative | imported package".
+    times = {}
+    for line in result.stderr.splitlines():
+        fields = line.split("|")
+        if len(fields) == 3 and fields[1].strip().isdigit():
+            times[fields[2].strip()] = int(fields[1])
+
+    return times
+
+
+def _import_microseconds(module: str) -> int:
+    times = _import_times(module)
+    if module not in times:
+        raise AssertionError(f"No import time reported for {module}")
+
+    return times[module]
+
+
+@pytest.mark.parametrize("module", list(_DEFERRED_IMPORTS))
+def test_scale_import_deferred(module):
+    """Heavy dependencies stay out of the import of the package."""
+    loaded = _import_times(module)
+    assert module in loaded
+    assert [
+        name
+        for name in loaded
+        for deferred in _DEFERRED_IMPORTS[module]
+        if name == deferred or name.startswith(f"{deferred}.")
+    ] == []
+
+
+@pytest.mark.parametrize("module", list(_DEFERRED_IMPORTS))
+def test_scale_import_time(benchmark, module):
+    """Import time of the package, as paid by every short-lived CLI call."""
+    microseconds = benchmark.pedantic(
+        _import_microseconds, args=(module,), rounds=3, iterations=1
+    )
+    benchmark.extra_info["import_us"] = microseconds
@@ -1,12 +1,191 @@
 from __future__ import annotations
 
+from typing import TYPE_CHECKING, Any, ClassVar
+
+from wexample_helpers.classes.field import public_field
+from wexample_helpers.classes.private_field import private_field
 from wexample_helpers.decorator.base_class import base_class
 
+from wexample_config.config_option.abstract_list_config_option import (
+    AbstractListConfigOption,
+)
 from wexample_config.config_option.abstract_nested_config_option import (
     AbstractNestedConfigOption,
 )
+from wexample_config.config_value.config_value import ConfigValue
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from wexample_config.classes.config_build_batch import ConfigBuildBatch
+    from wexample_config.classes.config_build_tracer import ConfigBuildTracer
+    from wexample_config.classes.config_change_set import ConfigChangeSet
+    from wexample_config.classes.config_subscriptions import (
+        ConfigChangeCallback,
+        ConfigSubscriptions,
+    )
+    from wexample_config.config_option.abstract_config_option import (
+        AbstractConfigOption,
+    )
+    from wexample_config.const.types import DictConfig
+
+
+# Types of the raw values shared by the leaf values of a batch, immutable ones
+# only. Floats are left out, as -0.0 equals 0.0.
+_SHAREABLE_RAW_TYPES = frozenset({bool, bytes, int, str, type(None)})
 
 
 @base_class
 class AbstractConfigManager(AbstractNestedConfigOption):
-    pass
+    # Managers are never attached to a parent, options below memoize them.
+    is_tree_root: ClassVar[bool] = True
+
+    tracer: ConfigBuildTracer | None = public_field(
+        description="Records counts and durations of the build of the tree, "
+        "by option class and phase",
+        default=None,
+        eq=False,
+        repr=False,
+    )
+    _subscriptions: ConfigSubscriptions | None = private_field(
+        description="Subscribers notified of rebuilt options, "
+        "None until the first subscription",
+        default=None,
+    )
+
+    def __getstate__(self) -> dict[str, Any]:
+        # Subscribers and tracers belong to the running process.
+        state = super().__getstate__()
+        state["tracer"] = None
+        state["_subscriptions"] = None
+        return state
+
+    @classmethod
+    def build_many(
+        cls,
+        configs: Iterable[Any],
+        share_leaf_values: bool = False,
+        **kwargs: Any,
+    ) -> ConfigBuildBatch:
+        """
+        Build one manager per config, e.g. one per tenant, with kwargs passed
+        to every manager. Exceptions raised building a config are reported in
+        the batch errors, other configs are built anyway.
+
+        Managers share the build plans compiled by the first one. With
+        share_leaf_values, equal scalar leaf values are a single ConfigValue
+        shared by every manager of the batch, to save memory on read-only
+        managers: changing one with set_*() changes it in every manager.
+        """
+        from wexample_config.classes.config_build_batch import ConfigBuildBatch
+
+        batch = ConfigBuildBatch()
+        shared_values: dict[tuple[type, Any], ConfigValue] | None = (
+            {} if share_leaf_values else None
+        )
+
+        for index, config in enumerate(configs):
+            manager = cls(**kwargs)
+            try:
+                manager.set_value(config)
+            except Exception as e:
+                batch.errors[index] = e
+                batch.managers.append(None)
+                continue
+
+            if shared_values is not None:
+                batch.shared_values += _share_leaf_values(manager, shared_values)
+            batch.managers.append(manager)
+
+        return batch
+
+    def get_build_report(self) -> list[dict[str, Any]]:
+        """
+        Count and cumulative seconds of the build of the tree by option class
+        and phase, slowest first, see ConfigBuildTracer. Empty without tracer.
+        """
+        tracer = self.get_tracer()
+        return tracer.get_report() if tracer is not None else []
+
+    def get_subscriptions(self) -> ConfigSubscriptions:
+        """
+        Subscribers notified with the keys of options built by set_value() and
+        with the paths of the change set of reload(), once per call.
+        """
+        from wexample_config.classes.config_subscriptions import (
+            ConfigSubscriptions,
+        )
+
+        if self._subscriptions is None:
+            self._subscriptions = ConfigSubscriptions()
+        return self._subscriptions
+
+    def reload(self, raw_value: Any) -> ConfigChangeSet:
+        change_set = super().reload(raw_value)
+
+        if self._subscriptions is not None and change_set.has_changes():
+            self._subscriptions.notify(
+                change_set.added + change_set.modified + change_set.removed
+            )
+
+        return change_set
+
+    def subscribe(self, path: str, callback: ConfigChangeCallback) -> None:
+        """Call callback with changed paths matching path, see ConfigSubscriptions."""
+        self.get_subscriptions().subscribe(path, callback)
+
+    def unsubscribe(self, path: str, callback: ConfigChangeCallback) -> None:
+        self.get_subscriptions().unsubscribe(path, callback)
+
+    async def _acreate_options(
+        self, config: DictConfig | set[type[AbstractConfigOption]]
+    ) -> list[AbstractConfigOption]:
+        new_options = await super()._acreate_options(config)
+        self._notify_options(new_options)
+
+        return new_options
+
+    def _create_options(
+        self, config: DictConfig | set[type[AbstractConfigOption]]
+    ) -> list[AbstractConfigOption]:
+        new_options = super()._create_options(config)
+        self._notify_options(new_options)
+
+        return new_options
+
+    def _notify_options(self, options: list[AbstractConfigOption]) -> None:
+        if self._subscriptions is not None and options:
+            self._subscriptions.notify(option.get_key() for option in options)
+
+
+def _share_leaf_values(
+    option: AbstractConfigOption, shared_values: dict[tuple[type, Any], ConfigValue]
+) -> int:
+    """Replace leaf values of the tree by equal ones of shared_values, if any."""
+    count = 0
+    options = [option]
+
+    while options:
+        option = options.pop()
+        if isinstance(option, AbstractNestedConfigOption):
+            options.extend(option.options.values())
+            if isinstance(option, AbstractListConfigOption):
+                options.extend(option.children)
+            continue
+
+        # Subclasses of ConfigValue may hold more than their raw value.
+        config_value = option.config_value
+        if (
+            type(config_value) is not ConfigValue
+            or type(config_value.raw) not in _SHAREABLE_RAW_TYPES
+        ):
+            continue
+
+        shared_value = shared_values.setdefault(
+            (type(config_value.raw), config_value.raw), config_value
+        )
+        if shared_value is not config_value:
+            option.config_value = shared_value
+            count += 1
+
+    return count
@@ -0,0 +1,41 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from wexample_helpers.classes.base_class import BaseClass
+from wexample_helpers.classes.field import public_field
+from wexample_helpers.decorator.base_class import base_class
+
+if TYPE_CHECKING:
+    from wexample_config.classes.abstract_config_manager import (
+        AbstractConfigManager,
+    )
+
+
+@base_class
+class ConfigBuildBatch(BaseClass):
+    """
+    Managers built by AbstractConfigManager.build_many(), in the order of
+    their configs. Configs failing to build leave None in managers and their
+    exception in errors, under the same index, the others are built anyway.
+    """
+
+    errors: dict[int, Exception] = public_field(
+        description="Exceptions raised building a config, by index of the config",
+        factory=dict,
+    )
+    managers: list[AbstractConfigManager | None] = public_field(
+        description="Built managers by index of their config, None on errors",
+        factory=list,
+    )
+    shared_values: int = public_field(
+        description="Leaf values replaced by an equal value of a previous manager",
+        default=0,
+    )
+
+    def get_managers(self) -> list[AbstractConfigManager]:
+        """Managers built without errors."""
+        return [manager for manager in self.managers if manager is not None]
+
+    def has_errors(self) -> bool:
+        return bool(self.errors)
@@ -0,0 +1,118 @@
+from __future__ import annotations
+
+import threading
+from time import perf_counter
+from typing import TYPE_CHECKING, Any
+
+from wexample_helpers.classes.base_class import BaseClass
+from wexample_helpers.classes.private_field import private_field
+from wexample_helpers.decorator.base_class import base_class
+
+if TYPE_CHECKING:
+    from wexample_config.config_option.abstract_config_option import (
+        AbstractConfigOption,
+    )
+
+
+@base_class
+class ConfigBuildTracer(BaseClass):
+    """
+    Counts and cumulative durations of the build of an option tree, by option
+    class and phase. Set it on the root option to trace the whole tree.
+
+    Phases are:
+        create: building an option, including its own children
+        validate: checking the raw value against the allowed types
+        prepare: preparing the config of a nested option, including hooks
+        resolve: running the resolve_config() hook of an option class
+        render: rendering the callback configuring an option
+
+    Durations of a phase include the nested phases, e.g. "create" of a nested
+    option includes the "create" of its children. Override record() to send
+    spans elsewhere.
+
+    Examples:
+        manager = DemoConfigManager(tracer=ConfigBuildTracer())
+        manager.set_value(config)
+        print(manager.get_tracer().format_report())
+    """
+
+    _lock: threading.Lock = private_field(
+        description="Guards the stats updated by parallel builds",
+        factory=threading.Lock,
+    )
+    _stats: dict[tuple[type[AbstractConfigOption], str], list[Any]] = private_field(
+        description="Count and cumulative seconds by option class and phase",
+        factory=dict,
+    )
+
+    def format_report(self, limit: int | None = 20) -> str:
+        """Report as text, slowest entries first."""
+        lines = [f"{'seconds':>10} {'count':>8}  {'phase':<9} option"]
+        for entry in self.get_report()[:limit]:
+            option_class = entry["option_class"]
+            lines.append(
+                f"{entry['seconds']:>10.6f} {entry['count']:>8}  "
+                f"{entry['phase']:<9} "
+                f"{option_class.__module__}.{option_class.__qualname__}"
+            )
+
+        return "\n".join(lines)
+
+    def get_report(self) -> list[dict[str, Any]]:
+        """Count and cumulative seconds by option class and phase, slowest first."""
+        with self._lock:
+            report = [
+                {
+                    "option_class": option_class,
+                    "phase": phase,
+                    "count": count,
+                    "seconds": seconds,
+                }
+                for (option_class, phase), (count, seconds) in self._stats.items()
+            ]
+
+        return sorted(report, key=lambda entry: entry["seconds"], reverse=True)
+
+    def record(
+        self, option_class: type[AbstractConfigOption], phase: str, seconds: float
+    ) -> None:
+        key = (option_class, phase)
+        with self._lock:
+            stats = self._stats.get(key)
+            if stats is None:
+                self._stats[key] = [1, seconds]
+            else:
+                stats[0] += 1
+                stats[1] += seconds
+
+    def reset(self) -> None:
+        with self._lock:
+            self._stats.clear()
+
+    def span(
+        self, option_class: type[AbstractConfigOption], phase: str
+    ) -> _ConfigBuildSpan:
+        """Context manager recording the duration of its block."""
+        return _ConfigBuildSpan(self, option_class, phase)
+
+
+class _ConfigBuildSpan:
+    __slots__ = ("option_class", "phase", "start", "tracer")
+
+    def __init__(
+        self,
+        tracer: ConfigBuildTracer,
+        option_class: type[AbstractConfigOption],
+        phase: str,
+    ) -> None:
+        self.option_class = option_class
+        self.phase = phase
+        self.start = 0.0
+        self.tracer = tracer
+
+    def __enter__(self) -> None:
+        self.start = perf_counter()
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.tracer.record(self.option_class, self.phase, perf_counter() - self.start)
@@ -0,0 +1,44 @@
+from __future__ import annotations
+
+from wexample_helpers.classes.base_class import BaseClass
+from wexample_helpers.classes.field import public_field
+from wexample_helpers.decorator.base_class import base_class
+from wexample_helpers.helper.dict import DICT_PATH_SEPARATOR_DEFAULT
+
+
+@base_class
+class ConfigChangeSet(BaseClass):
+    """
+    Keys changed by a reload, as separated paths from the reloaded option
+    (e.g. "demo_nested.name"). Changes inside nested options are reported
+    with their full path instead of the key of the nested option itself.
+    """
+
+    added: list[str] = public_field(
+        description="Paths of the options created by the reload",
+        factory=list,
+    )
+    modified: list[str] = public_field(
+        description="Paths of the options rebuilt with a different config",
+        factory=list,
+    )
+    removed: list[str] = public_field(
+        description="Paths of the options no longer present in the config",
+        factory=list,
+    )
+
+    def has_changes(self) -> bool:
+        return bool(self.added or self.modified or self.removed)
+
+    def merge(
+        self,
+        other: ConfigChangeSet,
+        prefix: str | None = None,
+        separator: str = DICT_PATH_SEPARATOR_DEFAULT,
+    ) -> None:
+        """Add changes of other, with paths prefixed when given (e.g. a child key)."""
+        path_prefix = f"{prefix}{separator}" if prefix is not None else ""
+
+        self.added.extend(f"{path_prefix}{path}" for path in other.added)
+        self.modified.extend(f"{path_prefix}{path}" for path in other.modified)
+        self.removed.extend(f"{path_prefix}{path}" for path in other.removed)
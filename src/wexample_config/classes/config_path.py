@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+from functools import lru_cache
+
+from wexample_helpers.classes.base_class import BaseClass
+from wexample_helpers.classes.field import public_field
+from wexample_helpers.decorator.base_class import base_class
+from wexample_helpers.helper.dict import DICT_PATH_SEPARATOR_DEFAULT
+
+# Maximum number of distinct (path, separator) pairs kept compiled.
+CONFIG_PATH_CACHE_SIZE = 4096
+
+
+@base_class
+class ConfigPath(BaseClass):
+    """
+    A separated path (e.g. "app.servers.0.host") parsed once into typed segments.
+
+    Each segment keeps its string key, used for dict lookups, and its integer
+    index (or None), used for list/tuple lookups, so traversing a path never
+    splits strings or parses numbers again. Use from_string() to share
+    compiled paths through an LRU cache keyed by (path, separator).
+    """
+
+    keys: tuple[str, ...] = public_field(
+        description="The string keys of every segment, in order",
+        factory=tuple,
+    )
+    path: str = public_field(
+        description="The original separated path",
+        default="",
+    )
+    segments: tuple[tuple[str, int | None], ...] = public_field(
+        description="Pairs of (key, index) where index is None for non-numeric keys",
+        factory=tuple,
+    )
+    separator: str = public_field(
+        description="The separator used to split the path",
+        default=DICT_PATH_SEPARATOR_DEFAULT,
+    )
+
+    def __len__(self) -> int:
+        return len(self.segments)
+
+    @classmethod
+    def from_string(
+        cls, path: str, separator: str = DICT_PATH_SEPARATOR_DEFAULT
+    ) -> ConfigPath:
+        # Positional call so that every caller hits the same cache entry.
+        return cls._compile(path, separator)
+
+    @staticmethod
+    @lru_cache(maxsize=CONFIG_PATH_CACHE_SIZE)
+    def parse_index(key: str) -> int | None:
+        """Return key as a list index ("0", "-1") or None if it is not numeric."""
+        if key.isdigit() or (key.startswith("-") and key[1:].isdigit()):
+            return int(key)
+        return None
+
+    @classmethod
+    @lru_cache(maxsize=CONFIG_PATH_CACHE_SIZE)
+    def _compile(cls, path: str, separator: str) -> ConfigPath:
+        keys = tuple(path.split(separator)) if path else ()
+
+        return cls(
+            keys=keys,
+            path=path,
+            segments=tuple((key, cls.parse_index(key)) for key in keys),
+            separator=separator,
+        )
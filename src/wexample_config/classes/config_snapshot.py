@@ -0,0 +1,200 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import mmap
+import os
+import pickle
+import struct
+import tempfile
+from contextlib import suppress
+from typing import TYPE_CHECKING, Any
+
+from wexample_helpers.classes.base_class import BaseClass
+from wexample_helpers.classes.field import public_field
+from wexample_helpers.decorator.base_class import base_class
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from wexample_config.config_option.abstract_nested_config_option import (
+        AbstractNestedConfigOption,
+    )
+
+# File header: magic bytes, format version and sha256 key of the snapshot.
+CONFIG_SNAPSHOT_MAGIC = b"WXCFGSNP"
+CONFIG_SNAPSHOT_VERSION = 1
+_HEADER = struct.Struct(f"<{len(CONFIG_SNAPSHOT_MAGIC)}sH32s")
+
+
+@base_class
+class ConfigSnapshot(BaseClass):
+    """
+    A binary file holding a fully built option tree, so that new processes
+    restore it instead of creating every option again.
+
+    The snapshot is keyed by a hash of the source config, of the option
+    classes allowed by the root option and of the salt: any change of them
+    makes load() ignore the file. Callbacks are identified by their name,
+    compiled code, closure values and defaults. As option classes are
+    identified by name, use the salt (e.g. a release version) to invalidate snapshots when their
+    code changes. The tree is serialized with pickle, so callbacks and custom
+    values must be importable, and snapshots must only be read from trusted
+    locations.
+
+    Examples:
+        snapshot = ConfigSnapshot(path="/var/cache/app/config.snapshot")
+        manager = snapshot.load_or_build(DemoConfigManager, config)
+    """
+
+    path: str = public_field(description="Path of the snapshot file")
+    salt: str = public_field(
+        description="Extra value mixed in the key, e.g. the application version",
+        default="",
+    )
+
+    def get_key(self, option: AbstractNestedConfigOption, config: Any) -> bytes:
+        """Key of the snapshot of option built from config."""
+        option_classes = sorted(
+            _snapshot_qualified_name(option_class)
+            for option_class in option.get_allowed_options_registry().values()
+        )
+        source = json.dumps(
+            [
+                self.salt,
+                _snapshot_qualified_name(type(option)),
+                option_classes,
+                config,
+            ],
+            default=_snapshot_json_default,
+            sort_keys=True,
+        )
+
+        return hashlib.sha256(source.encode()).digest()
+
+    def load(self, key: bytes) -> AbstractNestedConfigOption | None:
+        """
+        Restore the snapshotted tree, None if missing, stored under another key
+        or unreadable, e.g. empty or truncated by a crash while writing it.
+        """
+        try:
+            with open(self.path, "rb") as file:
+                with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                    if len(mapped) < _HEADER.size:
+                        return None
+
+                    magic, version, stored_key = _HEADER.unpack_from(mapped)
+                    if (
+                        magic != CONFIG_SNAPSHOT_MAGIC
+                        or version != CONFIG_SNAPSHOT_VERSION
+                        or stored_key != key
+                    ):
+                        return None
+
+                    with memoryview(mapped) as view, view[_HEADER.size :] as payload:
+                        return pickle.loads(payload)
+        except (EOFError, FileNotFoundError, ValueError, pickle.UnpicklingError):
+            return None
+
+    def load_or_build(
+        self,
+        option_factory: Callable[[], AbstractNestedConfigOption],
+        config: Any,
+    ) -> AbstractNestedConfigOption:
+        """
+        Restore the option tree built from config, or create it with
+        option_factory() then set_value(config) and write its snapshot.
+        """
+        option = option_factory()
+        key = self.get_key(option, config)
+
+        restored = self.load(key)
+        if restored is not None:
+            return restored
+
+        option.set_value(config)
+        self.write(option, key)
+
+        return option
+
+    def write(self, option: AbstractNestedConfigOption, key: bytes) -> None:
+        """Write the snapshot atomically, concurrent readers never see a partial file."""
+        directory, name = os.path.split(os.path.abspath(self.path))
+
+        # Unique per writer, including threads of a process, and removed on errors.
+        with tempfile.NamedTemporaryFile(
+            dir=directory, prefix=f"{name}.", suffix=".tmp", delete=False
+        ) as file:
+            temporary_path = file.name
+        try:
+            with open(temporary_path, "wb") as file:
+                file.write(
+                    _HEADER.pack(CONFIG_SNAPSHOT_MAGIC, CONFIG_SNAPSHOT_VERSION, key)
+                )
+                pickle.dump(option, file, protocol=pickle.HIGHEST_PROTOCOL)
+
+            os.replace(temporary_path, self.path)
+        finally:
+            with suppress(FileNotFoundError):
+                os.unlink(temporary_path)
+
+
+def _snapshot_json_default(value: Any) -> Any:
+    """Stable representation of config values that JSON can't serialize."""
+    from wexample_config.classes.mixin.config_value_mixin import ConfigValueMixin
+
+    if isinstance(value, (set, frozenset)):
+        return sorted(
+            json.dumps(item, default=_snapshot_json_default, sort_keys=True)
+            for item in value
+        )
+    if isinstance(value, ConfigValueMixin):
+        return [_snapshot_qualified_name(type(value)), value.raw]
+    if hasattr(value, "__code__"):
+        return _snapshot_callable_identity(value)
+    if hasattr(value, "__qualname__"):
+        return _snapshot_qualified_name(value)
+
+    return repr(value)
+
+
+def _snapshot_callable_identity(function: Any, with_closure: bool = True) -> list:
+    """
+    Functions and methods by name, compiled code, closure values, defaults
+    and bound instance, as different lambdas share the same name.
+    """
+    import marshal
+
+    identity = [
+        _snapshot_qualified_name(function),
+        hashlib.sha256(marshal.dumps(function.__code__)).hexdigest(),
+        function.__defaults__,
+        getattr(function, "__self__", None),
+    ]
+    if with_closure:
+        # Functions in closures are identified without their own closure,
+        # which may refer back to the function.
+        identity.append(
+            [
+                (
+                    _snapshot_callable_identity(cell_value, with_closure=False)
+                    if hasattr(cell_value, "__code__")
+                    else cell_value
+                )
+                for cell_value in map(_snapshot_cell_value, function.__closure__ or ())
+            ]
+        )
+
+    return identity
+
+
+def _snapshot_cell_value(cell: Any) -> Any:
+    try:
+        return cell.cell_contents
+    except ValueError:
+        # Closure variables not assigned yet.
+        return None
+
+
+def _snapshot_qualified_name(value: Any) -> str:
+    return f"{value.__module__}.{value.__qualname__}"
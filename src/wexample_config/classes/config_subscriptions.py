@@ -0,0 +1,141 @@
+from __future__ import annotations
+
+from contextlib import contextmanager
+from typing import TYPE_CHECKING
+
+from wexample_helpers.classes.base_class import BaseClass
+from wexample_helpers.classes.field import public_field
+from wexample_helpers.classes.private_field import private_field
+from wexample_helpers.decorator.base_class import base_class
+from wexample_helpers.helper.dict import DICT_PATH_SEPARATOR_DEFAULT
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Iterator
+
+    ConfigChangeCallback = Callable[[list[str]], None]
+
+
+@base_class
+class ConfigSubscriptions(BaseClass):
+    """
+    Callbacks subscribed to config changes under path prefixes.
+
+    A subscriber of "app.server" is notified of changes of "app.server",
+    of any path below it (e.g. "app.server.port") and of any path above it
+    (e.g. "app", replacing the whole subtree). Subscribers are stored in a
+    path trie, so dispatching a change only visits the matching ones.
+
+    Changes notified inside batch() are coalesced: every subscriber is
+    called once at the end of the batch, with the list of changed paths it
+    matches.
+
+    Examples:
+        subscriptions.subscribe("app.server", lambda paths: restart())
+        with subscriptions.batch():
+            subscriptions.notify(["app.server.host", "app.server.port"])
+    """
+
+    separator: str = public_field(
+        description="Separator of the subscribed and notified paths",
+        default=DICT_PATH_SEPARATOR_DEFAULT,
+    )
+    _batch_depth: int = private_field(
+        description="Number of nested batch() blocks being executed",
+        default=0,
+    )
+    _pending: dict[str, None] = private_field(
+        description="Changed paths waiting for the end of the batch, in order",
+        factory=dict,
+    )
+    _root: _SubscriptionNode = private_field(
+        description="Root node of the subscribers trie",
+        factory=lambda: _SubscriptionNode(),
+    )
+
+    @contextmanager
+    def batch(self) -> Iterator[None]:
+        """Coalesce the changes notified in this block, dispatched when it ends."""
+        self._batch_depth += 1
+        try:
+            yield
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0 and self._pending:
+                paths = list(self._pending)
+                self._pending.clear()
+                self.dispatch(paths)
+
+    def dispatch(self, paths: Iterable[str]) -> None:
+        """Call every matching subscriber once with the paths it matches."""
+        matches: dict[ConfigChangeCallback, list[str]] = {}
+
+        for path in paths:
+            node = self._root
+            callbacks = list(node.callbacks)
+
+            for key in path.split(self.separator) if path else ():
+                node = node.children.get(key)
+                if node is None:
+                    break
+                callbacks.extend(node.callbacks)
+            else:
+                # The whole subtree below the changed path changed as well.
+                stack = list(node.children.values())
+                while stack:
+                    child = stack.pop()
+                    callbacks.extend(child.callbacks)
+                    stack.extend(child.children.values())
+
+            for callback in callbacks:
+                callback_paths = matches.setdefault(callback, [])
+                if not callback_paths or callback_paths[-1] != path:
+                    callback_paths.append(path)
+
+        for callback, callback_paths in matches.items():
+            callback(callback_paths)
+
+    def has_subscribers(self) -> bool:
+        return bool(self._root.callbacks or self._root.children)
+
+    def notify(self, paths: Iterable[str]) -> None:
+        """Dispatch changed paths, or queue them until the end of the current batch."""
+        if self._batch_depth:
+            self._pending.update(dict.fromkeys(paths))
+        else:
+            self.dispatch(dict.fromkeys(paths))
+
+    def subscribe(self, path: str, callback: ConfigChangeCallback) -> None:
+        """Call callback with the changed paths matching path, "" for every change."""
+        node = self._root
+        for key in path.split(self.separator) if path else ():
+            node = node.children.setdefault(key, _SubscriptionNode())
+
+        node.callbacks.append(callback)
+
+    def unsubscribe(self, path: str, callback: ConfigChangeCallback) -> None:
+        nodes = [self._root]
+        keys = path.split(self.separator) if path else []
+        for key in keys:
+            node = nodes[-1].children.get(key)
+            if node is None:
+                return
+            nodes.append(node)
+
+        if callback in nodes[-1].callbacks:
+            nodes[-1].callbacks.remove(callback)
+
+        # Drop nodes left without subscribers, from the deepest one.
+        for key, parent, node in zip(
+            reversed(keys), reversed(nodes[:-1]), reversed(nodes[1:])
+        ):
+            if node.callbacks or node.children:
+                break
+            del parent.children[key]
+
+
+class _SubscriptionNode:
+    __slots__ = ("callbacks", "children")
+
+    def __init__(self) -> None:
+        self.callbacks: list[ConfigChangeCallback] = []
+        self.children: dict[str, _SubscriptionNode] = {}
@@ -0,0 +1,202 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from wexample_helpers.classes.base_class import BaseClass
+from wexample_helpers.classes.field import public_field
+from wexample_helpers.classes.private_field import private_field
+from wexample_helpers.decorator.base_class import base_class
+from wexample_helpers.helper.dict import DICT_PATH_SEPARATOR_DEFAULT
+
+from wexample_config.classes.config_path import ConfigPath
+from wexample_config.config_value.nested_config_value import NestedConfigValue
+from wexample_config.const.loader import (
+    LOADER_EVENT_END_ARRAY,
+    LOADER_EVENT_END_MAP,
+    LOADER_EVENT_MAP_KEY,
+    LOADER_EVENT_START_ARRAY,
+    LOADER_EVENT_START_MAP,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+    from pathlib import Path
+    from typing import TextIO
+
+# Returned by _load_child() for filtered out values.
+_SKIPPED = object()
+
+
+@base_class
+class ConfigValueLoader(BaseClass):
+    """
+    Build a wrapped NestedConfigValue tree from a stream of parser events
+    (see const.loader), in a single pass and without an intermediate dict.
+
+    Subtrees can be filtered out while parsing: only the requested paths
+    and their ancestors are materialized, and keys deeper than max_depth are
+    skipped (containers at that depth are loaded empty). Array items keep
+    their source index in paths, e.g. "handlers.1" selects the second item,
+    and skipped items before a loaded one are kept as None placeholders so
+    loaded items stay at their source position.
+
+    Examples:
+        loader = ConfigValueLoader(paths=["services.api"])
+        config = loader.load_json_file("config.json")
+    """
+
+    max_depth: int | None = public_field(
+        description="Maximal depth of loaded keys, top level keys being at depth 1",
+        default=None,
+    )
+    paths: list[str] | None = public_field(
+        description="Paths of the subtrees to load, everything when None",
+        default=None,
+    )
+    separator: str = public_field(
+        description="Separator of the filtered paths",
+        default=DICT_PATH_SEPARATOR_DEFAULT,
+    )
+    value_class: type[NestedConfigValue] = public_field(
+        description="Class of the built nodes, leaves use its leaf class type",
+        default=NestedConfigValue,
+    )
+    _selected_paths: frozenset[tuple[str, ...]] | None = private_field(
+        description="Filtered paths split into keys",
+        default=None,
+    )
+    _selected_prefixes: frozenset[tuple[str, ...]] | None = private_field(
+        description="Every ancestor path of the filtered paths, including themselves",
+        default=None,
+    )
+
+    def __attrs_post_init__(self) -> None:
+        if self.paths is None:
+            return
+
+        self._selected_paths = frozenset(
+            ConfigPath.from_string(path, self.separator).keys for path in self.paths
+        )
+        self._selected_prefixes = frozenset(
+            keys[:i] for keys in self._selected_paths for i in range(1, len(keys) + 1)
+        )
+
+    def load_events(self, events: Iterable[tuple[str, Any]]) -> NestedConfigValue:
+        """Build the tree of the first value of events, which must be a container."""
+        events = iter(events)
+        first = next(events, None)
+
+        if first is None:
+            return self.value_class.from_wrapped({})
+
+        event, value = first
+        if event not in (LOADER_EVENT_START_MAP, LOADER_EVENT_START_ARRAY):
+            raise ValueError("Configuration root must be a mapping or an array")
+
+        root = self._load_value(events, event, value, (), self.paths is None)
+        # Consume the end of the stream, so parsers report trailing data.
+        if next(events, None) is not None:
+            raise ValueError("Unexpected configuration events after the root value")
+
+        return root
+
+    def load_json(self, stream: TextIO) -> NestedConfigValue:
+        from wexample_config.helper.json import json_iter_events
+
+        return self.load_events(json_iter_events(stream))
+
+    def load_json_file(self, path: str | Path) -> NestedConfigValue:
+        with open(path, encoding="utf-8") as stream:
+            return self.load_json(stream)
+
+    def load_yaml(self, stream: TextIO) -> NestedConfigValue:
+        from wexample_config.helper.yaml import yaml_iter_events
+
+        return self.load_events(yaml_iter_events(stream))
+
+    def load_yaml_file(self, path: str | Path) -> NestedConfigValue:
+        with open(path, encoding="utf-8") as stream:
+            return self.load_yaml(stream)
+
+    def _load_value(
+        self,
+        events: Iterator[tuple[str, Any]],
+        event: str,
+        value: Any,
+        parts: tuple[str, ...],
+        selected: bool,
+    ) -> Any:
+        """
+        Build the value starting with event. Children of selected values are all
+        loaded, others are filtered against the requested paths.
+        """
+        if event == LOADER_EVENT_START_MAP:
+            raw: dict[str, Any] = {}
+            for event, key in events:
+                if event == LOADER_EVENT_END_MAP:
+                    return self.value_class.from_wrapped(raw)
+
+                assert event == LOADER_EVENT_MAP_KEY
+                child_parts = parts + (str(key),)
+                event, value = next(events)
+                child = self._load_child(events, event, value, child_parts, selected)
+                if child is not _SKIPPED:
+                    raw[key] = child
+
+        elif event == LOADER_EVENT_START_ARRAY:
+            items: list[Any] = []
+            index = 0
+            for event, value in events:
+                if event == LOADER_EVENT_END_ARRAY:
+                    return self.value_class.from_wrapped(items)
+
+                item = self._load_child(
+                    events, event, value, parts + (str(index),), selected
+                )
+                if item is not _SKIPPED:
+                    # Keep the source position of the item.
+                    while len(items) < index:
+                        items.append(self.value_class.get_leaf_class_type()(raw=None))
+                    items.append(item)
+                index += 1
+        else:
+            return self.value_class.get_leaf_class_type()(raw=value)
+
+        raise ValueError("Unexpected end of configuration events")
+
+    def _load_child(
+        self,
+        events: Iterator[tuple[str, Any]],
+        event: str,
+        value: Any,
+        parts: tuple[str, ...],
+        selected: bool,
+    ) -> Any:
+        if (self.max_depth is None or len(parts) <= self.max_depth) and (
+            selected or parts in self._selected_prefixes
+        ):
+            return self._load_value(
+                events,
+                event,
+                value,
+                parts,
+                selected or parts in self._selected_paths,
+            )
+
+        self._skip_value(events, event)
+        return _SKIPPED
+
+    @staticmethod
+    def _skip_value(events: Iterator[tuple[str, Any]], event: str) -> None:
+        """Consume the events of a value without building it."""
+        if event not in (LOADER_EVENT_START_MAP, LOADER_EVENT_START_ARRAY):
+            return
+
+        depth = 1
+        for event, _value in events:
+            if event in (LOADER_EVENT_START_MAP, LOADER_EVENT_START_ARRAY):
+                depth += 1
+            elif event in (LOADER_EVENT_END_MAP, LOADER_EVENT_END_ARRAY):
+                depth -= 1
+                if depth == 0:
+                    return
@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Set
+
+    from wexample_config.classes.options_registry import OptionsRegistry
+    from wexample_config.config_option.abstract_config_option import (
+        AbstractConfigOption,
+    )
+
+
+class OptionsBuildPlan:
+    """
+    Static part of building the options of a nested option, compiled once per
+    option type and providers, then executed by every build of that schema:
+    - resolve_hooks: option classes overriding resolve_config() or
+      aresolve_config(), in declaration order, others keep the base no-op
+    - async_resolve_hooks: the ones overriding aresolve_config() only, which
+      sync builds cannot run and refuse
+    - constructors: option classes by exact name, a plain dict lookup per key,
+      names matching a pattern fall back to the registry
+
+    Raw values are validated by each option class with the validator it
+    compiles once (see AbstractConfigOption._get_raw_value_validator()).
+    Whether undefined keys are allowed is an option field, applied by the
+    option to get_unknown_names(). Plans are shared, they must not be modified.
+
+    Examples:
+        plan = OptionsBuildPlan(OptionsRegistry.from_options(options))
+        plan.get_constructor("name")  # NameConfigOption
+    """
+
+    __slots__ = ("async_resolve_hooks", "constructors", "registry", "resolve_hooks")
+
+    def __init__(self, registry: OptionsRegistry) -> None:
+        from wexample_config.config_option.abstract_config_option import (
+            AbstractConfigOption,
+        )
+
+        self.constructors: dict[str, type[AbstractConfigOption]] = dict(registry)
+        self.registry = registry
+        self.resolve_hooks: tuple[type[AbstractConfigOption], ...] = tuple(
+            option_class
+            for option_class in registry.values()
+            if option_class.resolve_config is not AbstractConfigOption.resolve_config
+            or option_class.aresolve_config.__func__
+            is not AbstractConfigOption.aresolve_config.__func__
+        )
+        self.async_resolve_hooks: tuple[type[AbstractConfigOption], ...] = tuple(
+            option_class
+            for option_class in self.resolve_hooks
+            if option_class.resolve_config is AbstractConfigOption.resolve_config
+        )
+
+    def get_constructor(self, name: str) -> type[AbstractConfigOption] | None:
+        """Option class building the config key name, None for undefined keys."""
+        constructor = self.constructors.get(name)
+        if constructor is None and self.registry.has_patterns():
+            return self.registry.match(name)
+
+        return constructor
+
+    def get_unknown_names(self, names: Set[str]) -> Set[str]:
+        return self.registry.get_unknown_names(names)
@@ -0,0 +1,145 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    import re
+    from collections.abc import Iterable, Set
+
+    from wexample_config.config_option.abstract_config_option import (
+        AbstractConfigOption,
+    )
+
+# Maximum number of option names resolved against patterns memoized by a registry.
+OPTIONS_REGISTRY_MATCH_CACHE_SIZE = 4096
+
+# Characters making an option name a fnmatch pattern.
+_PATTERN_CHARS = frozenset("*?[")
+
+
+class OptionsRegistry(dict):
+    """
+    Option classes by option name, where names may be fnmatch patterns.
+
+    Options returning a pattern from get_name(), e.g. "cache_*", accept every
+    matching config key. Patterns are stored in a trie of their literal prefix,
+    so matching a key only tests the patterns its prefix leads to, and the most
+    specific pattern (longest literal prefix, then first declared) wins.
+
+    Exact names are plain dict items, patterns as well, so that keys() and
+    values() list every declared option; item access, "in" and get() also
+    resolve names matching a pattern. Resolved names are memoized, up to
+    OPTIONS_REGISTRY_MATCH_CACHE_SIZE. Registries are shared by every option
+    of a type, they must not be modified once built.
+
+    Examples:
+        registry = OptionsRegistry.from_options([NameConfigOption, CacheConfigOption])
+        registry["cache_redis"]  # CacheConfigOption, named "cache_*"
+    """
+
+    __slots__ = ("_matches", "_patterns")
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self._matches: dict[str, type[AbstractConfigOption] | None] = {}
+        self._patterns = _PatternNode()
+
+        for order, name in enumerate(self):
+            if _PATTERN_CHARS.isdisjoint(name):
+                continue
+            self._add_pattern(name, order)
+
+    def __contains__(self, name: object) -> bool:
+        return dict.__contains__(self, name) or (
+            isinstance(name, str) and self.match(name) is not None
+        )
+
+    def __missing__(self, name: str) -> type[AbstractConfigOption]:
+        option_class = self.match(name) if isinstance(name, str) else None
+        if option_class is None:
+            raise KeyError(name)
+        return option_class
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        # Compiled patterns are rebuilt from the items.
+        return self.__class__, (dict(self),)
+
+    @classmethod
+    def from_options(
+        cls, options: Iterable[type[AbstractConfigOption]]
+    ) -> OptionsRegistry:
+        return cls((option.get_name(), option) for option in options)
+
+    def get(self, name: str, default: Any = None) -> Any:
+        try:
+            return self[name]
+        except KeyError:
+            return default
+
+    def get_unknown_names(self, names: Set[str]) -> Set[str]:
+        """Names matching neither an option name nor a pattern."""
+        unknown_names = names - self.keys()
+        if unknown_names and self.has_patterns():
+            unknown_names = {name for name in unknown_names if self.match(name) is None}
+
+        return unknown_names
+
+    def has_patterns(self) -> bool:
+        return bool(self._patterns.entries or self._patterns.children)
+
+    def match(self, name: str) -> type[AbstractConfigOption] | None:
+        """Option class of the most specific pattern matching name, if any."""
+        if not self.has_patterns():
+            return None
+
+        try:
+            return self._matches[name]
+        except KeyError:
+            pass
+
+        candidates = list(self._patterns.entries)
+        node = self._patterns
+        for char in name:
+            node = node.children.get(char)
+            if node is None:
+                break
+            candidates.extend(node.entries)
+
+        option_class = None
+        # Deepest nodes hold the longest literal prefixes.
+        for _order, compiled, pattern_class in reversed(candidates):
+            if compiled.match(name):
+                option_class = pattern_class
+                break
+
+        if len(self._matches) >= OPTIONS_REGISTRY_MATCH_CACHE_SIZE:
+            # Dicts keep insertion order, drop the oldest name.
+            del self._matches[next(iter(self._matches))]
+        self._matches[name] = option_class
+
+        return option_class
+
+    def _add_pattern(self, pattern: str, order: int) -> None:
+        import fnmatch
+        import re
+
+        # Options are case-sensitive, unlike fnmatch() on some platforms.
+        compiled = re.compile(fnmatch.translate(pattern))
+        node = self._patterns
+        for char in pattern:
+            if char in _PATTERN_CHARS:
+                break
+            node = node.children.setdefault(char, _PatternNode())
+
+        node.entries.append((order, compiled, dict.__getitem__(self, pattern)))
+        # Nodes list their entries in reverse declaration order, so that once
+        # the candidates list is reversed the first declared pattern wins.
+        node.entries.sort(key=lambda entry: -entry[0])
+
+
+class _PatternNode:
+    __slots__ = ("children", "entries")
+
+    def __init__(self) -> None:
+        self.children: dict[str, _PatternNode] = {}
+        self.entries: list[tuple[int, re.Pattern[str], type[AbstractConfigOption]]] = []
@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+import weakref
+from collections import OrderedDict
+from typing import Any
+
+# Default of pops telling missing entries apart from cached None values.
+_MISSING = object()
+
+
+class WeakLruCache:
+    """
+    Least recently used cache keyed by classes, or tuples of classes, without
+    keeping them alive.
+
+    Keys are stored as weak references: an entry is dropped as soon as one of
+    its classes is collected, e.g. when a plugin unloads its providers. At
+    most max_size entries are kept, the least recently used one is evicted
+    first. Values must not reference their key classes, or they would never
+    be collected.
+
+    Examples:
+        cache = WeakLruCache(max_size=256)
+        cache.set((ManagerClass, ProviderClass), registry)
+        cache.get((ManagerClass, ProviderClass))
+    """
+
+    __slots__ = (
+        "__weakref__",
+        "_callback",
+        "_entries",
+        "collections",
+        "evictions",
+        "hits",
+        "max_size",
+        "misses",
+    )
+
+    def __init__(self, max_size: int) -> None:
+        self._callback = _weak_lru_cache_callback(self)
+        self._entries: OrderedDict[Any, Any] = OrderedDict()
+        self.collections = 0
+        self.evictions = 0
+        self.hits = 0
+        self.max_size = max_size
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def get(self, key: type | tuple[type, ...], default: Any = None) -> Any:
+        # Weak references to a living class compare and hash as the class.
+        ref_key = (
+            tuple(map(weakref.ref, key)) if isinstance(key, tuple) else weakref.ref(key)
+        )
+        try:
+            value = self._entries[ref_key]
+            self._entries.move_to_end(ref_key)
+        except KeyError:
+            self.misses += 1
+            return default
+
+        self.hits += 1
+        return value
+
+    def get_stats(self) -> dict[str, int]:
+        """Counters since creation, collections count entries of collected classes."""
+        return {
+            "collections": self.collections,
+            "evictions": self.evictions,
+            "hits": self.hits,
+            "max_size": self.max_size,
+            "misses": self.misses,
+            "size": len(self._entries),
+        }
+
+    def set(self, key: type | tuple[type, ...], value: Any) -> None:
+        # Stored references call back when their class is collected.
+        ref_key = (
+            tuple(weakref.ref(item, self._callback) for item in key)
+            if isinstance(key, tuple)
+            else weakref.ref(key, self._callback)
+        )
+
+        self._entries[ref_key] = value
+        self._entries.move_to_end(ref_key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def _evict_ref(self, ref: weakref.ref) -> None:
+        for ref_key in list(self._entries):
+            if ref_key is ref or (isinstance(ref_key, tuple) and ref in ref_key):
+                if self._entries.pop(ref_key, _MISSING) is not _MISSING:
+                    self.collections += 1
+
+
+def _weak_lru_cache_callback(cache: WeakLruCache) -> Any:
+    # Only holds the cache weakly, the cache holds the callback.
+    cache_ref = weakref.ref(cache)
+
+    def _callback(ref: weakref.ref) -> None:
+        cache = cache_ref()
+        if cache is not None:
+            cache._evict_ref(ref)
+
+    return _callback
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, ClassVar
 
 from wexample_helpers.classes.abstract_method import abstract_method
 from wexample_helpers.classes.base_class import BaseClass
@@ -12,8 +12,13 @@ from wexample_helpers.classes.mixin.has_snake_short_class_name_class_mixin impor
 from wexample_helpers.classes.private_field import private_field
 from wexample_helpers.decorator.base_class import base_class
 
+from wexample_config.classes.mixin.config_value_mixin import ConfigValueMixin
+from wexample_config.config_value.config_value import ConfigValue
+
 if TYPE_CHECKING:
-    from wexample_config.config_value.config_value import ConfigValue
+    from collections.abc import Callable
+
+    from wexample_config.classes.config_build_tracer import ConfigBuildTracer
     from wexample_config.const.types import DictConfig
 
 
@@ -21,7 +26,7 @@ if TYPE_CHECKING:
 class AbstractConfigOption(
     HasSnakeShortClassNameClassMixin, HasSimpleReprMixin, BaseClass
 ):
-    config_value: ConfigValue | None = public_field(
+    config_value: ConfigValueMixin | None = public_field(
         description="The value object associated with this config option",
         default=None,
     )
@@ -38,18 +43,60 @@ class AbstractConfigOption(
         default=None,
     )
     _root: AbstractConfigOption | None = private_field(
-        description="Memoized result of get_root(); None means uncached. "
-        "Invariant for the lifetime of the option (parent is set once at "
-        "construction time and never reparented).",
+        description="Memoized result of get_root(), None means uncached. "
+        "Only set below roots that are never attached to a parent, see "
+        "is_tree_root.",
         default=None,
     )
 
+    # Whether options of this type are always the root of their tree (config
+    # managers). get_root() is memoized below such roots only, options built
+    # detached (e.g. returned by render callbacks) are attached afterwards.
+    is_tree_root: ClassVar[bool] = False
+    # Tracer recording the build of the tree, only set on config managers
+    # (see AbstractConfigManager.tracer) and read from the root option.
+    tracer: ClassVar[ConfigBuildTracer | None] = None
+
     def __attrs_post_init__(self) -> None:
         self.key = self.key or self.get_name()
-        self.set_value(self.value)
+        tracer = self.get_tracer()
+        # Options built by acreate() are traced once their value is set.
+        if tracer is None or self.value is None:
+            self.set_value(self.value)
+        else:
+            with tracer.span(type(self), "create"):
+                self.set_value(self.value)
         if self.parent:
             self.parent.add_child(self)
 
+    @classmethod
+    async def acreate(cls, **kwargs: Any) -> AbstractConfigOption:
+        """
+        Async counterpart of the constructor, the value is applied with
+        aset_value() so that nested options build their children concurrently.
+        As with the constructor, the parent is notified once the value is set.
+        """
+        value = kwargs.pop("value", None)
+        parent = kwargs.pop("parent", None)
+        option = cls(**kwargs)
+        option.parent = parent
+        option.value = value
+        tracer = option.get_tracer()
+        if tracer is None:
+            await option.aset_value(value)
+        else:
+            with tracer.span(cls, "create"):
+                await option.aset_value(value)
+        if parent:
+            parent.add_child(option)
+
+        return option
+
+    @classmethod
+    async def aresolve_config(cls, config: DictConfig) -> DictConfig:
+        """Async counterpart of resolve_config(), override it for hooks doing I/O."""
+        return cls.resolve_config(config)
+
     @classmethod
     def get_class_name_suffix(cls) -> str | None:
         return "ConfigOption"
@@ -65,6 +112,10 @@ class AbstractConfigOption(
     def add_child(self, child: AbstractConfigOption) -> None:
         """Do stuff with this new child"""
 
+    async def aset_value(self, raw_value: Any) -> Any:
+        """Async counterpart of set_value(), used when building with acreate()."""
+        return self.set_value(raw_value)
+
     def dump(self) -> Any:
         return self.get_value().raw
 
@@ -81,42 +132,33 @@ class AbstractConfigOption(
         return self.parent
 
     def get_root(self) -> AbstractConfigOption:
-        if self._root is not None:
-            return self._root
-        if self.parent is not None:
-            self._root = self.parent.get_root()
-        else:
-            self._root = self
-        return self._root
-
-    def get_value(self) -> ConfigValue:
-        from wexample_config.config_value.config_value import ConfigValue
-
+        root = self._root
+        if root is None:
+            root = self.parent.get_root() if self.parent is not None else self
+            # Called for every option built, bypass attrs hooks.
+            if root.is_tree_root:
+                self.__dict__["_root"] = root
+        return root
+
+    def get_tracer(self) -> ConfigBuildTracer | None:
+        return self.get_root().tracer
+
+    def get_value(self) -> ConfigValueMixin:
         if self.config_value is None:
             self.config_value = ConfigValue(raw=None)
         return self.config_value
 
     def get_value_class_type(self) -> type[ConfigValue]:
-        from wexample_config.config_value.config_value import ConfigValue
-
         return ConfigValue
 
     def prepare_value(self, raw_value: Any) -> Any:
-        from wexample_config.config_value.config_value import ConfigValue
-
-        # Allow config option
-        if isinstance(raw_value, ConfigValue):
+        # Allow config values, attrs based or compact ones.
+        if isinstance(raw_value, ConfigValueMixin):
             return raw_value.to_option_raw_value()
 
         return raw_value
 
     def set_value(self, raw_value: Any) -> Any:
-        from wexample_helpers.exception.not_allowed_variable_type_exception import (
-            NotAllowedVariableTypeException,
-        )
-
-        from wexample_config.config_value.config_value import ConfigValue
-
         if raw_value is None:
             return
 
@@ -125,10 +167,24 @@ class AbstractConfigOption(
         try:
             # Check if value is valid for the config option,
             # reuse same method to validate types.
-            config_value_class.validate_value_type(
-                raw_value=raw_value, allowed_type=self.get_raw_value_allowed_type()
+            validator = self._get_raw_value_validator(config_value_class)
+            if validator is not None:
+                tracer = self.get_tracer()
+                if tracer is None:
+                    validator(raw_value)
+                else:
+                    with tracer.span(type(self), "validate"):
+                        validator(raw_value)
+        except Exception as e:
+            # Imported on failures only, the exception module loads string and
+            # crypto helpers that a valid config never needs.
+            from wexample_helpers.exception.not_allowed_variable_type_exception import (
+                NotAllowedVariableTypeException,
             )
-        except NotAllowedVariableTypeException as e:
+
+            if not isinstance(e, NotAllowedVariableTypeException):
+                raise
+
             # Add context about the option class that caused the error
             # Create a new exception with enhanced context
             enhanced_exception = NotAllowedVariableTypeException(
@@ -145,8 +201,24 @@ class AbstractConfigOption(
 
         self.config_value = (
             config_value_class(raw=raw_value)
-            if not isinstance(raw_value, ConfigValue)
+            if not isinstance(raw_value, ConfigValueMixin)
             else raw_value
         )
 
         return raw_value
+
+    @classmethod
+    def _get_raw_value_validator(
+        cls, config_value_class: type[ConfigValue]
+    ) -> Callable[[Any], None] | None:
+        """Validator of get_raw_value_allowed_type(), compiled once per option class."""
+        cached = cls.__dict__.get("_raw_value_validator")
+        if cached is None or cached[0] is not config_value_class:
+            cached = (
+                config_value_class,
+                config_value_class.compile_type_validator(
+                    cls.get_raw_value_allowed_type()
+                ),
+            )
+            setattr(cls, "_raw_value_validator", cached)
+        return cached[1]
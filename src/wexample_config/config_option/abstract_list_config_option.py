@@ -1,19 +1,26 @@
 from __future__ import annotations
 
+import threading
+from functools import partial
 from types import UnionType
-from typing import TYPE_CHECKING, Any
+from typing import Any
 
 from wexample_helpers.classes.field import public_field
+from wexample_helpers.classes.private_field import private_field
 from wexample_helpers.decorator.base_class import base_class
 
+from wexample_config.classes.config_change_set import ConfigChangeSet
+from wexample_config.config_option.abstract_config_option import AbstractConfigOption
 from wexample_config.config_option.abstract_nested_config_option import (
     AbstractNestedConfigOption,
 )
 
-if TYPE_CHECKING:
-    from wexample_config.config_option.abstract_config_option import (
-        AbstractConfigOption,
-    )
+# Number of children built by each task of a parallel build, lists that fit
+# in a single chunk are built serially.
+LIST_PARALLEL_BUILD_CHUNK_SIZE = 64
+
+# Marks threads building a child for a parallel build.
+_BUILD_STATE = threading.local()
 
 
 @base_class
@@ -21,6 +28,11 @@ class AbstractListConfigOption(AbstractNestedConfigOption):
     children: list[AbstractConfigOption] = public_field(
         factory=list, description="The list of children"
     )
+    _applied_children: list[Any] | None = private_field(
+        description="Config of every child when it was built, compared by "
+        "reload() to find which children changed; None until children are created",
+        default=None,
+    )
 
     @staticmethod
     def get_allowed_types() -> type | UnionType:
@@ -30,24 +42,134 @@ class AbstractListConfigOption(AbstractNestedConfigOption):
     def get_raw_value_allowed_type() -> Any:
         return list[dict[str, Any]]
 
-    def get_item_class_type(self) -> type | UnionType:
-        from wexample_config.config_option.abstract_config_option import (
-            AbstractConfigOption,
+    async def aset_value(self, raw_value: Any) -> None:
+        import asyncio
+
+        if type(self).set_value is not AbstractListConfigOption.set_value:
+            self.set_value(raw_value)
+            return
+
+        # Skip direct parent which creates only one item.
+        AbstractConfigOption.set_value(self, raw_value)
+
+        if raw_value is None:
+            return
+
+        self._applied_children = list(raw_value)
+        item_class_type = self.get_item_class_type()
+        # Children are built concurrently, gather() keeps their order.
+        self.children.extend(
+            await asyncio.gather(
+                *(
+                    item_class_type.acreate(value=child_config, parent=self)
+                    for child_config in raw_value
+                )
+            )
         )
 
+    def get_item_class_type(self) -> type | UnionType:
         return AbstractConfigOption
 
-    def set_value(self, raw_value: Any) -> None:
-        from wexample_config.config_option.abstract_config_option import (
-            AbstractConfigOption,
+    def reload(self, raw_value: Any) -> ConfigChangeSet:
+        """
+        Apply a new list of children, compared by index with the previous one:
+        unchanged children are kept, changed ones are reloaded in place when
+        possible, and changes are reported under the index of the child
+        (e.g. "1.name").
+        """
+        change_set = ConfigChangeSet()
+        AbstractConfigOption.set_value(self, raw_value)
+
+        if raw_value is None:
+            return change_set
+
+        item_class_type = self.get_item_class_type()
+        previous_children = self.children
+        previous_applied = self._applied_children or []
+        children = []
+
+        for index, child_config in enumerate(raw_value):
+            path = str(index)
+            if index >= len(previous_children):
+                child = item_class_type(value=child_config, parent=self)
+                change_set.added.append(path)
+            else:
+                child = previous_children[index]
+                if not (
+                    index < len(previous_applied)
+                    and previous_applied[index] == child_config
+                ) or self._has_stale_renders(path, child):
+                    child_changes = self._reload_option(child, child_config)
+
+                    if child_changes is None:
+                        child = item_class_type(value=child_config, parent=self)
+                        change_set.modified.append(path)
+                    elif child_changes.has_changes():
+                        change_set.merge(child_changes, prefix=path)
+
+            children.append(child)
+
+        change_set.removed.extend(
+            str(index) for index in range(len(raw_value), len(previous_children))
         )
 
+        self._applied_children = list(raw_value)
+        self.children = children
+
+        return change_set
+
+    def set_value(self, raw_value: Any) -> None:
         # Skip direct parent which creates only one item.
         AbstractConfigOption.set_value(self, raw_value)
 
         if raw_value is None:
             return
 
+        self._applied_children = list(raw_value)
         item_class_type = self.get_item_class_type()
-        for child_config in raw_value:
-            self.children.append(item_class_type(value=child_config, parent=self))
+        executor = self.get_build_executor()
+
+        # Children built by workers never submit their own children to the
+        # executor, waiting for them could exhaust the pool.
+        if (
+            executor is None
+            or len(raw_value) <= LIST_PARALLEL_BUILD_CHUNK_SIZE
+            or getattr(_BUILD_STATE, "in_worker", False)
+        ):
+            for child_config in raw_value:
+                self.children.append(item_class_type(value=child_config, parent=self))
+            return
+
+        # Workers build chunks of children, map keeps chunks order and raises
+        # the first error in this order.
+        chunks = (
+            raw_value[start : start + LIST_PARALLEL_BUILD_CHUNK_SIZE]
+            for start in range(0, len(raw_value), LIST_PARALLEL_BUILD_CHUNK_SIZE)
+        )
+        for children in executor.map(
+            partial(self._build_children_in_worker, item_class_type), chunks
+        ):
+            self.children.extend(children)
+
+    def _build_children_in_worker(
+        self, item_class_type: type[AbstractConfigOption], children_config: list[Any]
+    ) -> list[AbstractConfigOption]:
+        _BUILD_STATE.in_worker = True
+        try:
+            return [
+                item_class_type(value=child_config, parent=self)
+                for child_config in children_config
+            ]
+        finally:
+            _BUILD_STATE.in_worker = False
+
+    def _can_reload(self, raw_value: Any) -> bool:
+        return (
+            self._applied_children is not None
+            and isinstance(raw_value, list)
+            # Lists with their own set_value() may build more than children.
+            and type(self).set_value is AbstractListConfigOption.set_value
+        )
+
+    def _get_child_options(self) -> list[AbstractConfigOption]:
+        return [*self.options.values(), *self.children]
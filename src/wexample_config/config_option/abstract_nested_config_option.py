@@ -1,22 +1,43 @@
 from __future__ import annotations
 
+from contextlib import nullcontext
 from typing import TYPE_CHECKING, Any, Union, cast
 
-# Keyed by tuple of provider classes (types are hashable and stable).
-# The registry only depends on which providers are active, never on instance state.
-_REGISTRY_CACHE: dict[tuple, dict] = {}
+from wexample_config.classes.weak_lru_cache import WeakLruCache
 
-# Cache which option classes have a custom resolve_config (not the base no-op).
-# Populated lazily on first encounter of each class.
-_HAS_CUSTOM_RESOLVE: dict[type, bool] = {}
+# Maximum number of build plans cached, by option type and providers.
+BUILD_PLAN_CACHE_SIZE = 1024
+
+# Keyed by the option type and its provider classes, without keeping them alive:
+# entries are dropped when a provider class is unloaded. The plan only
+# depends on which providers are active, never on instance state.
+_BUILD_PLAN_CACHE = WeakLruCache(max_size=BUILD_PLAN_CACHE_SIZE)
+
+# Marks keys without a previously applied config, as None is a valid config.
+_MISSING = object()
+
+# Reusable context of the phases traced without tracer.
+_NO_SPAN = nullcontext()
 
 from wexample_helpers.classes.field import public_field
+from wexample_helpers.classes.private_field import private_field
 from wexample_helpers.decorator.base_class import base_class
 
+from wexample_config.classes.config_change_set import ConfigChangeSet
+from wexample_config.classes.options_build_plan import OptionsBuildPlan
+from wexample_config.classes.options_registry import OptionsRegistry
 from wexample_config.config_option.abstract_config_option import AbstractConfigOption
+from wexample_config.config_option.config_option import ConfigOption
+from wexample_config.config_value.callback_render_config_value import (
+    CallbackRenderConfigValue,
+)
+from wexample_config.config_value.config_value import ConfigValue
 
 if TYPE_CHECKING:
-    from wexample_config.config_value.config_value import ConfigValue
+    from collections.abc import Hashable
+    from concurrent.futures import Executor
+
+    from wexample_config.classes.mixin.config_value_mixin import ConfigValueMixin
     from wexample_config.const.types import DictConfig
     from wexample_config.options_provider.abstract_options_provider import (
         AbstractOptionsProvider,
@@ -37,11 +58,60 @@ class AbstractNestedConfigOption(AbstractConfigOption):
         description="Providers that can add additional options",
         default=None,
     )
+    build_executor: Executor | None = public_field(
+        description="Thread based executor used to build large lists of children "
+        "in parallel, inherited from the parent option when not set. Children "
+        "hold references to their parent, so they can't be built by processes.",
+        default=None,
+    )
+    _applied_config: dict[str, Any] | None = private_field(
+        description="Config of every option when it was built, compared by reload() "
+        "to find which options changed; None until options are created",
+        default=None,
+    )
+    _render_cache: dict[Hashable, Any] | None = private_field(
+        description="Results of callbacks declaring their dependencies, "
+        "memoized by the root option for the whole tree",
+        default=None,
+    )
+
+    def __getstate__(self) -> dict[str, Any]:
+        # Executors hold threads and locks, they never follow pickled options.
+        state = dict(self.__dict__)
+        state["build_executor"] = None
+        state["_render_cache"] = None
+        return state
+
+    @staticmethod
+    def get_cache_stats() -> dict[str, dict[str, int]]:
+        """Counters of the class-level caches shared by every nested option."""
+        return {
+            "build_plan": _BUILD_PLAN_CACHE.get_stats(),
+        }
 
     @staticmethod
     def get_raw_value_allowed_type() -> Any:
         return Union[dict[str, Any], set[type[AbstractConfigOption]]]
 
+    async def aset_value(self, raw_value: Any) -> None:
+        """
+        Async counterpart of set_value(): sibling options render their
+        callbacks, resolve their config and build their children concurrently.
+        Unlike set_value(), options are added to self.options once all the
+        siblings are built, so callbacks cannot read earlier siblings there.
+        """
+        # Options with their own set_value() may build more than options.
+        if type(self).set_value is not AbstractNestedConfigOption.set_value:
+            self.set_value(raw_value)
+            return
+
+        raw_value = super().set_value(raw_value)
+
+        if raw_value is None:
+            return
+
+        await self._acreate_options(config=raw_value)
+
     def dump(self) -> Any:
         return {name: option.dump() for name, option in self.options.items()}
 
@@ -49,7 +119,20 @@ class AbstractNestedConfigOption(AbstractConfigOption):
         providers = self.get_options_providers()
         return [option for provider in providers for option in provider.get_options()]
 
-    def get_allowed_options_registry(self) -> dict[str, type[AbstractConfigOption]]:
+    def get_allowed_options_registry(self) -> OptionsRegistry:
+        return self.get_build_plan().registry
+
+    def get_build_executor(self) -> Executor | None:
+        if self.build_executor is not None:
+            return self.build_executor
+
+        if isinstance(self.parent, AbstractNestedConfigOption):
+            return self.parent.get_build_executor()
+
+        return None
+
+    def get_build_plan(self) -> OptionsBuildPlan:
+        """Build plan of the options of this type, compiled once per providers."""
         # Cache key bound to (type(self), providers) so subclasses with their own
         # overrides get their own cache entry. MUST go through self.get_allowed_options()
         # — subclasses (e.g. ModeOption) override that method to return a fixed list
@@ -58,16 +141,16 @@ class AbstractNestedConfigOption(AbstractConfigOption):
         # provider options instead, producing "Unknown configuration option" errors
         # on perfectly valid configs.
         providers = self.get_options_providers()
-        cache_key = (type(self), tuple(providers))
-        cached = _REGISTRY_CACHE.get(cache_key)
+        cache_key = (type(self), *providers)
+        cached = _BUILD_PLAN_CACHE.get(cache_key)
         if cached is not None:
             return cached
 
-        options_registry = {
-            option.get_name(): option for option in self.get_allowed_options()
-        }
-        _REGISTRY_CACHE[cache_key] = options_registry
-        return options_registry
+        build_plan = OptionsBuildPlan(
+            OptionsRegistry.from_options(self.get_allowed_options())
+        )
+        _BUILD_PLAN_CACHE.set(cache_key, build_plan)
+        return build_plan
 
     def get_option(
         self, option_type: type[AbstractConfigOption] | str
@@ -96,15 +179,23 @@ class AbstractNestedConfigOption(AbstractConfigOption):
 
     def get_option_value(
         self, option_type: type[AbstractConfigOption], default: Any = None
-    ) -> ConfigValue:
-        from wexample_config.config_value.config_value import ConfigValue
-
+    ) -> ConfigValueMixin:
         option = self.get_option(option_type)
         if option:
-            return cast(ConfigValue, option.get_value())
+            return option.get_value()
 
         return ConfigValue(raw=default)
 
+    def get_render_cache(self) -> dict[Hashable, Any]:
+        """Memoized callback results, shared by the whole tree through its root."""
+        root = self.get_root()
+        if root is not self and isinstance(root, AbstractNestedConfigOption):
+            return root.get_render_cache()
+
+        if self._render_cache is None:
+            self._render_cache = {}
+        return self._render_cache
+
     def get_options_providers(self) -> list[type[AbstractOptionsProvider]]:
         if self.parent:
             return self.parent.get_options_providers()
@@ -121,6 +212,69 @@ class AbstractNestedConfigOption(AbstractConfigOption):
             if isinstance(option, AbstractNestedConfigOption):
                 yield from option.iter_options_recursive()
 
+    def reload(self, raw_value: Any) -> ConfigChangeSet:
+        """
+        Apply a new config, rebuilding only the options whose config changed.
+
+        Nested options are reloaded recursively, others are kept when their
+        config equals the one they were built from. Options missing from the
+        new config are removed. Pass a new config rather than mutating the
+        applied one in place, which would hide changes from the comparison.
+        """
+        change_set = ConfigChangeSet()
+        raw_value = super().set_value(raw_value)
+
+        if raw_value is None:
+            return change_set
+
+        build_plan = self.get_build_plan()
+        config = self._prepare_options_config(raw_value, build_plan)
+        previous_options = self.options
+        previous_applied = self._applied_config or {}
+        applied_config = {}
+        new_options = {}
+
+        for option_name, option_config in config.items():
+            option = previous_options.get(option_name)
+
+            if option is None:
+                option = self._create_option(option_name, option_config, build_plan)
+                change_set.added.append(option_name)
+            # Callbacks may render differently and option instances replace
+            # the previous one, so they are never considered unchanged, unless
+            # callbacks declare dependencies, whose values are compared with
+            # the ones the option was built with.
+            elif (
+                isinstance(option_config, AbstractConfigOption)
+                or (
+                    isinstance(option_config, CallbackRenderConfigValue)
+                    and option_config.dependencies is None
+                )
+                or not (previous_applied.get(option_name, _MISSING) == option_config)
+                or self._has_stale_renders(option_name, option)
+            ):
+                option_changes = self._reload_option(option, option_config)
+
+                if option_changes is None:
+                    option = self._create_option(option_name, option_config, build_plan)
+                    change_set.modified.append(option_name)
+                elif option_changes.has_changes():
+                    change_set.merge(option_changes, prefix=option_name)
+
+            applied_config[option_name] = option_config
+            new_options[option.get_key()] = option
+
+        change_set.removed.extend(
+            option_name
+            for option_name in previous_options
+            if option_name not in new_options
+        )
+
+        self._applied_config = applied_config
+        self.options = new_options
+
+        return change_set
+
     def set_value(self, raw_value: Any) -> None:
         # Config might have been modified
         raw_value = super().set_value(raw_value)
@@ -130,82 +284,266 @@ class AbstractNestedConfigOption(AbstractConfigOption):
 
         self._create_options(config=raw_value)
 
-    def _create_options(
+    async def _acreate_option(
+        self,
+        option_name: str,
+        option_config: Any,
+        build_plan: OptionsBuildPlan,
+    ) -> AbstractConfigOption:
+        option_class = build_plan.get_constructor(option_name)
+        # Wrap unknown options, allowed keys have been checked before.
+        if option_class is None and not isinstance(option_config, AbstractConfigOption):
+            return ConfigOption(key=option_name, parent=self, value=option_config)
+
+        if "_render_inputs" in self.__dict__:
+            self.__dict__["_render_inputs"].pop(option_name, None)
+        if isinstance(option_config, CallbackRenderConfigValue):
+            callback = option_config
+            tracer = self.get_tracer()
+            if tracer is None:
+                option_config = await callback.arender(self)
+            else:
+                with tracer.span(option_class, "render"):
+                    option_config = await callback.arender(self)
+            self._record_render(option_name, callback)
+        if isinstance(option_config, AbstractConfigOption):
+            option_config.parent = self
+            return option_config
+
+        return await option_class.acreate(
+            key=option_name,
+            parent=self,
+            value=option_config,
+        )
+
+    async def _acreate_options(
         self, config: DictConfig | set[type[AbstractConfigOption]]
     ) -> list[AbstractConfigOption]:
-        from wexample_config.config_option.config_option import ConfigOption
-        from wexample_config.config_value.callback_render_config_value import (
-            CallbackRenderConfigValue,
-        )
-        from wexample_config.const.types import DictConfig
-        from wexample_config.exception.invalid_option_exception import (
-            InvalidOptionException,
+        import asyncio
+
+        build_plan = self.get_build_plan()
+        config = await self._aprepare_options_config(config, build_plan)
+
+        if self._applied_config is None:
+            self._applied_config = {}
+
+        # gather() keeps the config order and raises the first error as is.
+        new_options = await asyncio.gather(
+            *(
+                self._acreate_option(option_name, option_config, build_plan)
+                for option_name, option_config in config.items()
+            )
         )
 
-        options = self.get_allowed_options_registry()
-        new_options = []
+        for (option_name, option_config), new_option in zip(
+            config.items(), new_options
+        ):
+            self._applied_config[option_name] = option_config
+            self.options[new_option.get_key()] = new_option
 
-        # Normalize: accept a set of option classes and convert to dict[name -> instance]
-        if isinstance(config, set):
-            normalized: dict[str, AbstractConfigOption] = {}
-            for option_class in config:
-                instance = option_class(parent=self)
-                normalized[option_class.get_name()] = instance
+        return new_options
 
-            # Reuse the rest of the logic by working with a dict
-            config = cast(DictConfig, normalized)
-
-        # Loop over all options classes to execute option_class.resolve_config(config)
-        # This will modify config before using it, with extra configuration keys.
-        # For instance, an option defining the content of a file may add the should_exist option to ensure existence.
-        # Skip classes that haven't overridden the base no-op (checked once per class, cached).
-        for option_class in options.values():
-            has_custom = _HAS_CUSTOM_RESOLVE.get(option_class)
-            if has_custom is None:
-                has_custom = (
-                    option_class.resolve_config
-                    is not AbstractConfigOption.resolve_config
-                )
-                _HAS_CUSTOM_RESOLVE[option_class] = has_custom
-            if has_custom:
-                config = option_class.resolve_config(config)
+    async def _aprepare_options_config(
+        self,
+        config: DictConfig | set[type[AbstractConfigOption]],
+        build_plan: OptionsBuildPlan,
+    ) -> DictConfig:
+        tracer = self.get_tracer()
+        with tracer.span(type(self), "prepare") if tracer is not None else _NO_SPAN:
+            config = self._normalize_options_config(config)
+
+            # Hooks modify the config in turn, so they are awaited one by one.
+            for option_class in build_plan.resolve_hooks:
+                if tracer is None:
+                    config = await option_class.aresolve_config(config)
+                else:
+                    with tracer.span(option_class, "resolve"):
+                        config = await option_class.aresolve_config(config)
+
+            self._check_options_config(config, build_plan)
+
+        return config
+
+    def _can_reload(self, raw_value: Any) -> bool:
+        """Whether reload() can apply raw_value in place of a full rebuild."""
+        return (
+            self._applied_config is not None
+            and isinstance(raw_value, dict)
+            # Options with their own set_value() may build more than options.
+            and type(self).set_value is AbstractNestedConfigOption.set_value
+        )
 
+    def _check_options_config(
+        self, config: DictConfig, build_plan: OptionsBuildPlan
+    ) -> None:
         # Accept both dict configs and normalized set-of-types.
         # dict_keys supports set-difference natively — avoids materialising a
         # full set(options.keys()) on every call; the set is only built lazily
-        # inside the (rare) error branch via sorted(options).
-        unknown_keys = config.keys() - options.keys()
-        if unknown_keys:
-            if not self.allow_undefined_keys:
-                raise InvalidOptionException(
-                    message=f"Unknown configuration option \"{', '.join(sorted(unknown_keys))}\", "
-                    f'in "{self.__class__.__name__}", '
-                    f"allowed options are: {', '.join(sorted(options))}"
-                )
+        # inside the (rare) error branch via sorted(options). Only the keys
+        # left are matched against option name patterns.
+        unknown_keys = build_plan.get_unknown_names(config.keys())
+        if unknown_keys and not self.allow_undefined_keys:
+            from wexample_config.exception.invalid_option_exception import (
+                InvalidOptionException,
+            )
+
+            raise InvalidOptionException(
+                message=f"Unknown configuration option \"{', '.join(sorted(unknown_keys))}\", "
+                f'in "{self.__class__.__name__}", '
+                f"allowed options are: {', '.join(sorted(build_plan.registry))}"
+            )
+
+    def _create_option(
+        self,
+        option_name: str,
+        option_config: Any,
+        build_plan: OptionsBuildPlan,
+    ) -> AbstractConfigOption:
+        option_class = build_plan.get_constructor(option_name)
+        # Wrap unknown options, allowed keys have been checked before.
+        if option_class is None and not isinstance(option_config, AbstractConfigOption):
+            return ConfigOption(key=option_name, parent=self, value=option_config)
+
+        if "_render_inputs" in self.__dict__:
+            self.__dict__["_render_inputs"].pop(option_name, None)
+        if isinstance(option_config, CallbackRenderConfigValue):
+            callback = option_config
+            tracer = self.get_tracer()
+            if tracer is None:
+                option_config = callback.render(self)
             else:
-                for option_name in unknown_keys:
-                    if not isinstance(config[option_name], AbstractConfigOption):
-                        # Wrap unknown options
-                        config[option_name] = ConfigOption(
-                            key=option_name, parent=self, value=config[option_name]
-                        )
+                with tracer.span(option_class, "render"):
+                    option_config = callback.render(self)
+            self._record_render(option_name, callback)
+        if isinstance(option_config, AbstractConfigOption):
+            option_config.parent = self
+            return option_config
+
+        # Options named by a pattern take the matching key.
+        return option_class(
+            key=option_name,
+            parent=self,
+            value=option_config,
+        )
+
+    def _create_options(
+        self, config: DictConfig | set[type[AbstractConfigOption]]
+    ) -> list[AbstractConfigOption]:
+        build_plan = self.get_build_plan()
+        config = self._prepare_options_config(config, build_plan)
+        new_options = []
+
+        if self._applied_config is None:
+            self._applied_config = {}
 
         # Resolve callables and create options in a single pass — avoids
         # allocating a list() copy of config.items() and halves the number
         # of iterations over the config dict.
         for option_name, option_config in config.items():
-            if isinstance(option_config, CallbackRenderConfigValue):
-                option_config = option_config.render(self)
-            if isinstance(option_config, AbstractConfigOption):
-                new_option = option_config
-                new_option.parent = self
-            else:
-                new_option = options[option_name](
-                    parent=self,
-                    value=option_config,
-                )
+            new_option = self._create_option(option_name, option_config, build_plan)
 
+            self._applied_config[option_name] = option_config
             self.options[new_option.get_key()] = new_option
             new_options.append(new_option)
 
         return new_options
+
+    def _get_child_options(self) -> list[AbstractConfigOption]:
+        return list(self.options.values())
+
+    def _has_stale_renders(
+        self, option_name: str, option: AbstractConfigOption
+    ) -> bool:
+        """
+        Whether a callback rendered to build the option, or any option under
+        it, declares dependencies whose values changed since its render.
+        """
+        root = self.get_root()
+        if not root.__dict__.get("_has_render_inputs"):
+            return False
+
+        renders = []
+        own_renders = self.__dict__.get("_render_inputs")
+        if own_renders and option_name in own_renders:
+            renders.append(own_renders[option_name])
+
+        options = [option]
+        while options:
+            option = options.pop()
+            if isinstance(option, AbstractNestedConfigOption):
+                renders.extend(option.__dict__.get("_render_inputs", {}).values())
+                options.extend(option._get_child_options())
+
+        return any(callback.get_inputs(root) != inputs for callback, inputs in renders)
+
+    def _normalize_options_config(
+        self, config: DictConfig | set[type[AbstractConfigOption]]
+    ) -> DictConfig:
+        # Normalize: accept a set of option classes and convert to dict[name -> instance]
+        if isinstance(config, set):
+            normalized: dict[str, AbstractConfigOption] = {}
+            for option_class in config:
+                instance = option_class(parent=self)
+                normalized[option_class.get_name()] = instance
+
+            # Reuse the rest of the logic by working with a dict
+            config = cast("DictConfig", normalized)
+
+        return config
+
+    def _prepare_options_config(
+        self,
+        config: DictConfig | set[type[AbstractConfigOption]],
+        build_plan: OptionsBuildPlan,
+    ) -> DictConfig:
+        tracer = self.get_tracer()
+        with tracer.span(type(self), "prepare") if tracer is not None else _NO_SPAN:
+            config = self._normalize_options_config(config)
+
+            # Hooks doing I/O may only be async, they would be skipped here.
+            if build_plan.async_resolve_hooks:
+                raise TypeError(
+                    f"Option {build_plan.async_resolve_hooks[0]!r} only defines "
+                    "aresolve_config(), build the option with aset_value()"
+                )
+
+            # Loop over all options classes to execute option_class.resolve_config(config)
+            # This will modify config before using it, with extra configuration keys.
+            # For instance, an option defining the content of a file may add the should_exist option to ensure existence.
+            for option_class in build_plan.resolve_hooks:
+                if tracer is None:
+                    config = option_class.resolve_config(config)
+                else:
+                    with tracer.span(option_class, "resolve"):
+                        config = option_class.resolve_config(config)
+
+            self._check_options_config(config, build_plan)
+
+        return config
+
+    def _record_render(
+        self, option_name: str, callback: CallbackRenderConfigValue
+    ) -> None:
+        """Keep the inputs of a callback declaring dependencies, for reload()."""
+        if callback.dependencies is None:
+            return
+
+        # Kept out of attrs fields, whose validators would slow down every
+        # attribute assignment of options; callbacks may be shared by trees.
+        root = self.get_root()
+        self.__dict__.setdefault("_render_inputs", {})[option_name] = (
+            callback,
+            callback.get_inputs(root),
+        )
+        root.__dict__["_has_render_inputs"] = True
+
+    def _reload_option(
+        self, option: AbstractConfigOption, option_config: Any
+    ) -> ConfigChangeSet | None:
+        """Reload a changed nested option in place, None if it must be rebuilt."""
+        if isinstance(option, AbstractNestedConfigOption) and option._can_reload(
+            option_config
+        ):
+            return option.reload(option_config)
+
+        return None
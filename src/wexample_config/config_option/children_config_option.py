@@ -7,6 +7,9 @@ from wexample_helpers.decorator.base_class import base_class
 from wexample_config.config_option.abstract_list_config_option import (
     AbstractListConfigOption,
 )
+from wexample_config.config_option.abstract_nested_config_option import (
+    AbstractNestedConfigOption,
+)
 
 if TYPE_CHECKING:
     from types import UnionType
@@ -19,8 +22,4 @@ class ChildrenConfigOption(AbstractListConfigOption):
         return [child.dump() for child in self.children]
 
     def get_item_class_type(self) -> type | UnionType:
-        from wexample_config.config_option.abstract_nested_config_option import (
-            AbstractNestedConfigOption,
-        )
-
         return AbstractNestedConfigOption
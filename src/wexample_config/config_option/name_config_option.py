@@ -6,6 +6,9 @@ from typing import TYPE_CHECKING, Any, Union
 from wexample_helpers.decorator.base_class import base_class
 
 from wexample_config.config_option.abstract_config_option import AbstractConfigOption
+from wexample_config.config_value.callback_render_config_value import (
+    CallbackRenderConfigValue,
+)
 
 if TYPE_CHECKING:
     from wexample_config.const.types import DictConfig
@@ -15,10 +18,6 @@ if TYPE_CHECKING:
 class NameConfigOption(AbstractConfigOption):
     @staticmethod
     def get_raw_value_allowed_type() -> Any:
-        from wexample_config.config_value.callback_render_config_value import (
-            CallbackRenderConfigValue,
-        )
-
         return Union[str, CallbackRenderConfigValue, Callable[..., Any]]
 
     @staticmethod
@@ -29,10 +28,6 @@ class NameConfigOption(AbstractConfigOption):
             value = config[key]
 
             if callable(value):
-                from wexample_config.config_value.callback_render_config_value import (
-                    CallbackRenderConfigValue,
-                )
-
                 config[key] = CallbackRenderConfigValue(raw=value)
 
         return config
@@ -1,20 +1,154 @@
 from __future__ import annotations
 
-from collections.abc import Callable
+import inspect
+from collections.abc import Callable, Hashable
 from typing import TYPE_CHECKING, Any
 
+from wexample_helpers.classes.field import public_field
+from wexample_helpers.decorator.base_class import base_class
+from wexample_helpers.helper.dict import dict_get_item_by_path
+
+from wexample_config.classes.mixin.config_value_mixin import ConfigValueMixin
 from wexample_config.config_value.config_value import ConfigValue
 
 if TYPE_CHECKING:
+    from wexample_config.config_option.abstract_config_option import (
+        AbstractConfigOption,
+    )
     from wexample_config.config_option.abstract_nested_config_option import (
         AbstractNestedConfigOption,
     )
 
+# Maximum number of rendered results memoized by a root option.
+CALLBACK_RENDER_CACHE_SIZE = 4096
+
+# Marks dependency paths missing from the config, as None is a valid value.
+_MISSING = object()
+
+# Rendered results shared between renders, others are built for each option.
+_MEMOIZED_RESULT_TYPES = (bool, bytes, float, int, str, type(None))
 
+
+@base_class
 class CallbackRenderConfigValue(ConfigValue):
+    """
+    A callback rendering the config of an option when the option is built.
+
+    Callbacks declaring their dependencies, as paths in the config of the root
+    option, are rendered once per distinct value of these paths: results are
+    memoized by the root option, and reload() keeps options built from such
+    callbacks while their dependencies don't change. Dependencies must cover
+    everything the callback reads, including from the option it receives.
+    Only immutable results (scalars and tuples of them) are memoized, others
+    such as options are attached to a parent, so they are rendered again.
+
+    Values hold no render state and may be shared by several trees: the
+    option rendering a callback records the inputs it was rendered with.
+
+    Examples:
+        CallbackRenderConfigValue(raw=render_name, dependencies=["env", "region"])
+    """
+
+    dependencies: list[str] | None = public_field(
+        description="Paths of the root option config read by the callback, "
+        "None to render on every build",
+        default=None,
+    )
+
+    def __eq__(self, other: object) -> bool:
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+
+        return self.raw == other.raw and self.dependencies == other.dependencies
+
     @staticmethod
     def get_allowed_types() -> Any:
         return Callable[..., Any]
 
+    async def arender(self, option: AbstractNestedConfigOption) -> str:
+        """Render with a sync callback or with an async one, which is awaited."""
+        cache, key = self._get_render_memo(option)
+        if key in cache:
+            return cache[key]
+
+        rendered = self.raw(option)
+        if inspect.isawaitable(rendered):
+            rendered = await rendered
+
+        return self._memoize(cache, key, rendered)
+
+    def get_inputs(self, root: AbstractConfigOption) -> Hashable:
+        """Frozen values of the dependencies in the config of root."""
+        config = root.get_value().raw
+
+        return tuple(
+            _callback_render_freeze(dict_get_item_by_path(config, path, _MISSING))
+            for path in self.dependencies
+        )
+
     def render(self, option: AbstractNestedConfigOption) -> str:
-        return self.raw(option)
+        cache, key = self._get_render_memo(option)
+        if key in cache:
+            return cache[key]
+
+        rendered = self.raw(option)
+        if inspect.isawaitable(rendered):
+            if inspect.iscoroutine(rendered):
+                rendered.close()
+            raise TypeError(
+                f"Callback {self.raw!r} is async, build the option with aset_value()"
+            )
+
+        return self._memoize(cache, key, rendered)
+
+    def _get_render_memo(
+        self, option: AbstractNestedConfigOption
+    ) -> tuple[dict[Hashable, Any], Hashable]:
+        """Memoized results of the tree and key of this render, a void cache if disabled."""
+        if self.dependencies is None:
+            return {}, None
+
+        # Only nested options have children, so the root of option is nested.
+        root = option.get_root()
+        inputs = self.get_inputs(root)
+
+        return root.get_render_cache(), (self.raw, tuple(self.dependencies), inputs)
+
+    def _memoize(self, cache: dict[Hashable, Any], key: Hashable, rendered: Any) -> Any:
+        if key is not None and _callback_render_is_immutable(rendered):
+            if len(cache) >= CALLBACK_RENDER_CACHE_SIZE:
+                # Dicts keep insertion order, drop the oldest result.
+                del cache[next(iter(cache))]
+            cache[key] = rendered
+
+        return rendered
+
+
+def _callback_render_freeze(value: Any) -> Hashable:
+    """Hashable representation of a config value, to key memoized renders."""
+    if isinstance(value, dict):
+        return (
+            dict,
+            tuple((key, _callback_render_freeze(item)) for key, item in value.items()),
+        )
+    if isinstance(value, (list, tuple)):
+        return (type(value), tuple(_callback_render_freeze(item) for item in value))
+    if isinstance(value, (set, frozenset)):
+        return frozenset(_callback_render_freeze(item) for item in value)
+    if isinstance(value, ConfigValueMixin):
+        return (type(value), _callback_render_freeze(value.raw))
+
+    try:
+        hash(value)
+    except TypeError:
+        return (type(value), id(value))
+
+    return value
+
+
+def _callback_render_is_immutable(value: Any) -> bool:
+    """Whether a rendered result can be shared by every option rendering it."""
+    if type(value) is tuple:
+        return all(_callback_render_is_immutable(item) for item in value)
+
+    return type(value) in _MEMOIZED_RESULT_TYPES
@@ -0,0 +1,311 @@
+from __future__ import annotations
+
+from array import array
+from itertools import repeat
+from typing import TYPE_CHECKING, Any
+
+from wexample_helpers.classes.private_field import private_field
+from wexample_helpers.decorator.base_class import base_class
+
+from wexample_config.config_value.config_value import ConfigValue
+from wexample_config.config_value.config_value_array import ConfigValueArray
+from wexample_config.config_value.config_value_collection import (
+    ConfigValueCollection,
+    T,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator
+
+    from wexample_config.classes.mixin.config_value_mixin import ConfigValueMixin
+
+# Type tags of stored values, also the index of their column.
+_TAG_NONE = 0
+_TAG_BOOL = 1
+_TAG_INT = 2
+_TAG_FLOAT = 3
+_TAG_STR = 4
+_TAG_OBJECT = 5
+
+_COLUMN_TAGS: dict[type, int] = {
+    type(None): _TAG_NONE,
+    bool: _TAG_BOOL,
+    int: _TAG_INT,
+    float: _TAG_FLOAT,
+    str: _TAG_STR,
+}
+_INT_MIN = -(2**63)
+_INT_MAX = 2**63 - 1
+
+
+@base_class
+class ColumnarConfigValueCollection(ConfigValueCollection[T]):
+    """
+    A ConfigValueCollection storing scalar values column-wise: one typed array
+    per type plus an array of type tags, instead of one ConfigValue per item.
+    ConfigValue views are only created when items are accessed, other values
+    are kept as given in an object column.
+
+    Opt-in, for large read-mostly collections of homogeneous scalar values
+    (see is_columnar()). Views of scalar values are copies: changing them,
+    e.g. with set_int(), doesn't change the collection. Items are added with
+    append() or extend(), items is read-only.
+
+    Examples:
+        if ColumnarConfigValueCollection.is_columnar(raw_values):
+            collection = ColumnarConfigValueCollection.from_raw_values(raw_values)
+    """
+
+    _columns: list[Any] = private_field(
+        description="Stored values, one column per type tag",
+        eq=False,
+        repr=False,
+    )
+    _positions: array = private_field(
+        description="Position of each item in the column of its type",
+        eq=False,
+        repr=False,
+    )
+    _tags: array = private_field(
+        description="Type tag of each item",
+        eq=False,
+        repr=False,
+    )
+
+    @property
+    def items(self) -> tuple[ConfigValue, ...]:
+        """
+        Items materialized as ConfigValue views, on each access. A tuple, as
+        changes would not be stored: use append() or extend().
+        """
+        return tuple(self)
+
+    @items.setter
+    def items(self, values: list[ConfigValueMixin]) -> None:
+        self._columns = [None, array("B"), array("q"), array("d"), [], []]
+        self._positions = array("I")
+        self._tags = array("B")
+        self.extend(values)
+
+    def __eq__(self, other: object) -> bool:
+        # Equal to any collection of the same values, whatever its storage.
+        if not isinstance(other, ConfigValueCollection):
+            return NotImplemented
+
+        return list(self) == list(other)
+
+    def __getitem__(self, index: int) -> ConfigValue:
+        if isinstance(index, slice):
+            return [self._get_item(i) for i in range(len(self))[index]]
+
+        return self._get_item(range(len(self))[index])
+
+    def __iter__(self) -> Iterator[ConfigValue]:
+        for index in range(len(self)):
+            yield self._get_item(index)
+
+    def __len__(self) -> int:
+        return len(self._tags)
+
+    @classmethod
+    def from_raw_values(cls, values: list[Any]) -> ColumnarConfigValueCollection:
+        collection = cls()
+        for value in values:
+            collection._append_raw(value)
+
+        return collection
+
+    @classmethod
+    def is_columnar(cls, values: list[Any]) -> bool:
+        """Whether values are scalars of a single type, None entries apart."""
+        types = set(map(type, values))
+        types.discard(type(None))
+
+        return len(types) == 1 and types.pop() in _COLUMN_TAGS
+
+    def append(self, value: ConfigValueMixin) -> None:
+        # Subclasses may override getters, keep them as given.
+        if type(value) is ConfigValue and self._get_tag(value.raw) != _TAG_OBJECT:
+            self._append_raw(value.raw)
+        else:
+            self._append_tagged(_TAG_OBJECT, value)
+
+    def extend(self, values: list[ConfigValueMixin]) -> None:
+        for value in values:
+            self.append(value)
+
+    def get_bool_collection(self) -> list[bool]:
+        return self._get_values_or_super((_TAG_BOOL,), "get_bool_collection")
+
+    def get_bool_or_none_collection(self) -> list[bool | None]:
+        return self._get_values_or_none((_TAG_BOOL,), "get_bool_or_none_collection")
+
+    def get_float_collection(self) -> list[float]:
+        return self._get_values_or_super((_TAG_FLOAT,), "get_float_collection")
+
+    def get_float_or_none_collection(self) -> list[float | None]:
+        return self._get_values_or_none((_TAG_FLOAT,), "get_float_or_none_collection")
+
+    def get_int_collection(self) -> list[int]:
+        return self._get_values_or_super((_TAG_BOOL, _TAG_INT), "get_int_collection")
+
+    def get_int_or_none_collection(self) -> list[int | None]:
+        return self._get_values_or_none(
+            (_TAG_BOOL, _TAG_INT), "get_int_or_none_collection"
+        )
+
+    def get_str_collection(self) -> list[str]:
+        return self._get_values_or_super((_TAG_STR,), "get_str_collection")
+
+    def get_str_or_none_collection(self) -> list[str | None]:
+        return self._get_values_or_none((_TAG_STR,), "get_str_or_none_collection")
+
+    def map(self, func: Callable[[ConfigValue], T]) -> list[T]:
+        return [func(item) for item in self]
+
+    def to_bool_collection(self) -> list[bool]:
+        return self._convert_values(bool, "to_bool_collection")
+
+    def to_float_collection(self) -> list[float]:
+        return self._convert_values(float, "to_float_collection")
+
+    def to_int_collection(self) -> list[int]:
+        return self._convert_values(int, "to_int_collection")
+
+    def to_str_collection(self) -> list[str]:
+        return self._convert_values(str, "to_str_collection")
+
+    def _append_raw(self, raw: Any) -> None:
+        tag = self._get_tag(raw)
+
+        if tag == _TAG_OBJECT:
+            raw = ConfigValue(raw=raw)
+
+        self._append_tagged(tag, raw)
+
+    def _append_tagged(self, tag: int, value: Any) -> None:
+        column = self._columns[tag]
+
+        if column is None:
+            self._positions.append(0)
+        else:
+            self._positions.append(len(column))
+            column.append(value)
+        self._tags.append(tag)
+
+    def _convert_values(self, converter: Callable[[Any], Any], method: str) -> list:
+        """Same as ConfigValue.to_*() on plain scalars: convert the raw value."""
+        if _TAG_OBJECT in self._tags:
+            return getattr(super(), method)()
+
+        return list(map(converter, self._get_raw_values()))
+
+    def _get_item(self, index: int) -> ConfigValue:
+        tag = self._tags[index]
+        if tag == _TAG_OBJECT:
+            return self._columns[_TAG_OBJECT][self._positions[index]]
+
+        return ConfigValue(raw=self._get_raw_value(index))
+
+    def _get_raw_value(self, index: int) -> Any:
+        tag = self._tags[index]
+        if tag == _TAG_NONE:
+            return None
+
+        value = self._columns[tag][self._positions[index]]
+        if tag == _TAG_BOOL:
+            return bool(value)
+        if tag == _TAG_OBJECT:
+            return value._get_nested_raw()
+
+        return value
+
+    def _get_raw_values(self) -> list[Any]:
+        tag = self._get_single_tag()
+
+        if tag == _TAG_NONE:
+            return [None] * len(self)
+        if tag == _TAG_BOOL:
+            return list(map(bool, self._columns[_TAG_BOOL]))
+        if tag in (_TAG_INT, _TAG_FLOAT):
+            return self._columns[tag].tolist()
+        if tag == _TAG_STR:
+            return list(self._columns[_TAG_STR])
+
+        # Columns are filled in items order, so reading each of them
+        # sequentially following the tags restores the items order.
+        columns = self._columns
+        readers = [
+            repeat(None),
+            map(bool, columns[_TAG_BOOL]),
+            iter(columns[_TAG_INT]),
+            iter(columns[_TAG_FLOAT]),
+            iter(columns[_TAG_STR]),
+            (value._get_nested_raw() for value in columns[_TAG_OBJECT]),
+        ]
+
+        return [next(readers[tag]) for tag in self._tags]
+
+    def _get_single_tag(self) -> int | None:
+        """Tag shared by all items, None if mixed or empty."""
+        tags = self._tags
+        if tags and tags.count(tags[0]) == len(tags):
+            return tags[0]
+
+        return None
+
+    def _get_tag(self, raw: Any) -> int:
+        tag = _COLUMN_TAGS.get(type(raw), _TAG_OBJECT)
+        if tag == _TAG_INT and not _INT_MIN <= raw <= _INT_MAX:
+            return _TAG_OBJECT
+
+        return tag
+
+    def _get_typed_array(self, value_type: type, typecode: str) -> ConfigValueArray:
+        tags = self._tags
+        if _TAG_OBJECT in tags:
+            return super()._get_typed_array(value_type, typecode)
+
+        # Map type tags to mask bytes, so the mask is built without a Python loop.
+        table = bytearray(256)
+        for column_type, tag in _COLUMN_TAGS.items():
+            table[tag] = issubclass(column_type, value_type)
+        mask = tags.tobytes().translate(table)
+
+        tag = self._get_single_tag()
+        column = self._columns[tag] if tag is not None else None
+        # Copy the column as is when it already holds the requested type.
+        if isinstance(column, array) and column.typecode == typecode:
+            values = column[:]
+        else:
+            values = self._get_raw_values()
+            if 0 in mask:
+                values = [raw if valid else 0 for valid, raw in zip(mask, values)]
+            values = array(typecode, values)
+
+        return ConfigValueArray(mask=array("B", mask), values=values)
+
+    def _get_values_or_none(
+        self, value_tags: tuple[int, ...], method: str
+    ) -> list[Any]:
+        """Same as get_*_or_none() on each item: values of other types are None."""
+        tags = self._tags
+        if _TAG_OBJECT in tags:
+            return getattr(super(), method)()
+
+        raw_values = self._get_raw_values()
+        if sum(map(tags.count, value_tags)) == len(tags):
+            return raw_values
+
+        return [
+            raw if tag in value_tags else None for tag, raw in zip(tags, raw_values)
+        ]
+
+    def _get_values_or_super(self, value_tags: tuple[int, ...], method: str) -> list:
+        """Raw values if all of them pass the type check of get_*()."""
+        tags = self._tags
+        if sum(map(tags.count, value_tags)) == len(tags):
+            return self._get_raw_values()
+
+        # Let the generic implementation raise the same errors.
+        return getattr(super(), method)()
@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from wexample_config.classes.mixin.config_value_mixin import ConfigValueMixin
+from wexample_config.helper.type import type_compile_validator
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from types import UnionType
+
+
+class CompactConfigValue(ConfigValueMixin):
+    """
+    Same API as ConfigValue, stored in a single slot.
+
+    Drops the per-instance __dict__ of attrs based classes, and the type
+    validation on construction since the allowed type is always Any. Used as
+    leaf class by CompactNestedConfigValue where leaves are the bulk of
+    allocated objects. Its raw slot has no assignment hook, link it to other
+    values with set_*() so that chains memoized by ConfigValue are refreshed.
+    """
+
+    __slots__ = ("raw",)
+
+    def __init__(self, *, raw: Any) -> None:
+        self.raw = raw
+
+    def __eq__(self, other: object) -> bool:
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return self.raw == other.raw
+
+    # Mutable value, same as attrs based ConfigValue.
+    __hash__ = None
+
+    @classmethod
+    def compile_type_validator(cls, allowed_type: Any) -> Callable[[Any], None] | None:
+        """Build a validator of raw values for allowed_type, None if anything is allowed."""
+        return type_compile_validator(allowed_type)
+
+    @classmethod
+    def validate_value_type(
+        cls, raw_value: Any, allowed_type: type | UnionType
+    ) -> None:
+        from wexample_helpers.helper.type import type_validate_or_fail
+
+        type_validate_or_fail(
+            value=raw_value,
+            allowed_type=allowed_type,
+        )
+
+    @staticmethod
+    def get_allowed_types() -> Any:
+        return Any
@@ -0,0 +1,25 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from wexample_helpers.decorator.base_class import base_class
+
+from wexample_config.config_value.compact_config_value import CompactConfigValue
+from wexample_config.config_value.nested_config_value import NestedConfigValue
+
+if TYPE_CHECKING:
+    from wexample_config.classes.mixin.config_value_mixin import ConfigValueMixin
+
+
+@base_class
+class CompactNestedConfigValue(NestedConfigValue):
+    """
+    NestedConfigValue wrapping primitive leaves as slotted CompactConfigValue.
+
+    Containers keep the regular representation, leaves are usually most of
+    the nodes of a config tree and take about half the memory of a ConfigValue.
+    """
+
+    @classmethod
+    def get_leaf_class_type(cls) -> type[ConfigValueMixin]:
+        return CompactConfigValue
@@ -0,0 +1,59 @@
+from __future__ import annotations
+
+from array import array
+from typing import TYPE_CHECKING, Any
+
+from wexample_helpers.classes.base_class import BaseClass
+from wexample_helpers.classes.field import public_field
+from wexample_helpers.decorator.base_class import base_class
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+
+@base_class
+class ConfigValueArray(BaseClass):
+    """
+    Typed values extracted in bulk from a ConfigValueCollection, stored in a
+    compact array.array along with a mask of valid entries. Entries which are
+    None or of another type are masked out and hold 0 in values.
+    """
+
+    mask: array = public_field(
+        description="Unsigned bytes array, 1 for valid entries and 0 for others",
+    )
+    values: array = public_field(
+        description="Typed values, 0 for masked out entries",
+    )
+
+    def __iter__(self) -> Iterator[Any]:
+        """Iterate over values, None for masked out entries."""
+        for valid, value in zip(self.mask, self.values):
+            yield value if valid else None
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def is_valid(self, index: int) -> bool:
+        return bool(self.mask[index])
+
+    def has_invalid(self) -> bool:
+        return 0 in self.mask
+
+    def to_list(self) -> list[Any]:
+        """Values as a list, None for masked out entries."""
+        return list(self)
+
+    def to_numpy(self) -> Any:
+        """
+        Values as a numpy masked array sharing the memory of values.
+        Requires numpy.
+        """
+        import numpy
+
+        typecode = self.values.typecode
+
+        return numpy.ma.MaskedArray(
+            numpy.frombuffer(self.values, dtype=bool if typecode == "B" else typecode),
+            mask=numpy.frombuffer(self.mask, dtype=numpy.uint8) == 0,
+        )
@@ -1,18 +1,20 @@
 from __future__ import annotations
 
+from array import array
 from typing import TYPE_CHECKING, Any, Generic, TypeVar
 
 from wexample_helpers.classes.base_class import BaseClass
 from wexample_helpers.classes.field import public_field
 from wexample_helpers.decorator.base_class import base_class
 
+from wexample_config.classes.mixin.config_value_mixin import ConfigValueMixin
+from wexample_config.config_value.config_value_array import ConfigValueArray
+
 if TYPE_CHECKING:
     from collections.abc import Callable, Iterator
 
     from wexample_helpers.const.types import AnyList
 
-    from wexample_config.config_value.config_value import ConfigValue
-
 T = TypeVar("T")
 
 
@@ -20,7 +22,7 @@ T = TypeVar("T")
 class ConfigValueCollection(BaseClass, Generic[T]):
     """A collection of ConfigValue objects that provides utility methods for working with collections."""
 
-    items: list[ConfigValue] = public_field(
+    items: list[ConfigValueMixin] = public_field(
         factory=list,
         description="List of ConfigValue objects in the collection.",
     )
@@ -29,17 +31,19 @@ class ConfigValueCollection(BaseClass, Generic[T]):
         """Return the number of items in the collection."""
         return len(self.items)
 
-    def __iter__(self) -> Iterator[ConfigValue]:
+    def __iter__(self) -> Iterator[ConfigValueMixin]:
         """Allow iteration over the collection items."""
         return iter(self.items)
 
-    def __getitem__(self, index: int) -> ConfigValue:
+    def __getitem__(self, index: int) -> ConfigValueMixin:
         """Allow indexing to access items directly."""
         return self.items[index]
 
     # Factory methods
     @classmethod
-    def from_config_values(cls, values: list[ConfigValue]) -> ConfigValueCollection:
+    def from_config_values(
+        cls, values: list[ConfigValueMixin]
+    ) -> ConfigValueCollection:
         """Create a ConfigValueCollection from a list of ConfigValue objects."""
         return cls(items=list(values))
 
@@ -50,14 +54,18 @@ class ConfigValueCollection(BaseClass, Generic[T]):
 
         return cls.from_config_values([ConfigValue(raw=value) for value in values])
 
-    def append(self, value: ConfigValue) -> None:
+    def append(self, value: ConfigValueMixin) -> None:
         """Add a ConfigValue to the collection."""
         self.items.append(value)
 
-    def extend(self, values: list[ConfigValue]) -> None:
+    def extend(self, values: list[ConfigValueMixin]) -> None:
         """Add multiple ConfigValue objects to the collection."""
         self.items.extend(values)
 
+    def get_bool_array(self) -> ConfigValueArray:
+        """Extract booleans in a single pass, into a compact array masking other values."""
+        return self._get_typed_array(bool, "B")
+
     def get_bool_collection(self) -> list[bool]:
         """Convert all items in the collection to booleans."""
         return [item.get_bool() for item in self.items]
@@ -74,6 +82,10 @@ class ConfigValueCollection(BaseClass, Generic[T]):
         """Convert all items in the collection to dictionaries or None."""
         return [item.get_dict_or_none() for item in self.items]
 
+    def get_float_array(self) -> ConfigValueArray:
+        """Extract floats in a single pass, into a compact array masking other values."""
+        return self._get_typed_array(float, "d")
+
     def get_float_collection(self) -> list[float]:
         """Convert all items in the collection to floats."""
         return [item.get_float() for item in self.items]
@@ -82,6 +94,13 @@ class ConfigValueCollection(BaseClass, Generic[T]):
         """Convert all items in the collection to floats or None."""
         return [item.get_float_or_none() for item in self.items]
 
+    def get_int_array(self) -> ConfigValueArray:
+        """
+        Extract integers in a single pass, into a compact array masking other
+        values. Raises OverflowError for integers out of the signed 64 bits range.
+        """
+        return self._get_typed_array(int, "q")
+
     def get_int_collection(self) -> list[int]:
         """Convert all items in the collection to integers."""
         return [item.get_int() for item in self.items]
@@ -108,7 +127,7 @@ class ConfigValueCollection(BaseClass, Generic[T]):
         """Convert all items in the collection to strings or None."""
         return [item.get_str_or_none() for item in self.items]
 
-    def map(self, func: Callable[[ConfigValue], T]) -> list[T]:
+    def map(self, func: Callable[[ConfigValueMixin], T]) -> list[T]:
         """Apply a function to each ConfigValue in the collection and return the results."""
         return [func(item) for item in self.items]
 
@@ -136,3 +155,23 @@ class ConfigValueCollection(BaseClass, Generic[T]):
     def to_str_collection(self) -> list[str]:
         """Convert all items in the collection to strings using to_str()."""
         return [item.to_str() for item in self.items]
+
+    def _get_raw_values(self) -> list[Any]:
+        return [
+            raw._get_nested_raw() if isinstance(raw, ConfigValueMixin) else raw
+            for raw in (item.raw for item in self.items)
+        ]
+
+    def _get_typed_array(self, value_type: type, typecode: str) -> ConfigValueArray:
+        raw_values = self._get_raw_values()
+        # Same check as is_of_type(), so masked entries are the ones
+        # get_*_or_none() would return None for.
+        mask = bytes([isinstance(raw, value_type) for raw in raw_values])
+
+        if 0 in mask:
+            raw_values = [raw if valid else 0 for valid, raw in zip(mask, raw_values)]
+
+        return ConfigValueArray(
+            mask=array("B", mask),
+            values=array(typecode, raw_values),
+        )
@@ -0,0 +1,467 @@
+from __future__ import annotations
+
+import mmap
+import os
+import struct
+import tempfile
+import zlib
+from collections.abc import Callable, Mapping, Sequence
+from contextlib import suppress
+from typing import TYPE_CHECKING, Any
+
+from wexample_helpers.helper.dict import DICT_PATH_SEPARATOR_DEFAULT
+
+from wexample_config.classes.config_path import ConfigPath
+from wexample_config.classes.mixin.config_value_mixin import ConfigValueMixin
+from wexample_config.config_value.config_value import ConfigValue
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+MAPPED_CONFIG_MAGIC = b"WXCFGMAP"
+MAPPED_CONFIG_VERSION = 1
+
+# Header: magic, version, offset of the root node, offset of the string table.
+_HEADER = struct.Struct("<8sHQQ")
+# Node tags, followed by the payload of the node.
+_TAG = struct.Struct("<B")
+_TAG_NONE = 0
+_TAG_FALSE = 1
+_TAG_TRUE = 2
+_TAG_INT = 3  # q
+_TAG_BIG_INT = 4  # Q, offset of its decimal string
+_TAG_FLOAT = 5  # d
+_TAG_STR = 6  # Q, offset of the string
+# I count, count * (Q key, Q value) in source order, _slots_capacity(count) * I slots
+_TAG_DICT = 7
+_TAG_LIST = 8  # I count, count * Q value
+_COUNT = struct.Struct("<I")
+_OFFSET = struct.Struct("<Q")
+_ENTRY = struct.Struct("<QQ")
+_INT = struct.Struct("<q")
+_FLOAT = struct.Struct("<d")
+# Strings: I length followed by utf-8 bytes.
+_LENGTH = struct.Struct("<I")
+_CONTAINER_HEADER_SIZE = _TAG.size + _COUNT.size
+# Python type of the decoded value of each tag, for type checks.
+_TAG_TYPES: dict[int, type] = {
+    _TAG_NONE: type(None),
+    _TAG_FALSE: bool,
+    _TAG_TRUE: bool,
+    _TAG_INT: int,
+    _TAG_BIG_INT: int,
+    _TAG_FLOAT: float,
+    _TAG_STR: str,
+    _TAG_DICT: dict,
+    _TAG_LIST: list,
+}
+
+
+class MappedConfigValue(ConfigValueMixin):
+    """
+    Read-only config tree stored in a binary file and memory-mapped, so that
+    every process opening the same file shares a single physical copy.
+
+    Nodes are decoded on access, directly from the mapping: nothing is built
+    when opening the file, and each node only holds its offset. Dicts store
+    their entries in source order along with a hash table of their keys.
+    Strings are deduplicated in a string table. Supports None, bool, int,
+    float, str, dicts with string keys, lists and tuples (read as lists).
+
+    Examples:
+        MappedConfigValue.write_file({"app": {"port": 8080}}, "config.bin")
+        config = MappedConfigValue.open("config.bin")
+        config.search("app.port").get_int()  # 8080
+    """
+
+    __slots__ = ("_offset", "_view")
+
+    def __init__(self, *, view: memoryview, offset: int) -> None:
+        self._offset = offset
+        self._view = view
+
+    def __eq__(self, other: object) -> bool:
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return self.raw == other.raw
+
+    __hash__ = None
+
+    @classmethod
+    def open(cls, path: str) -> MappedConfigValue:
+        """Map the file written by write_file() and return its root node."""
+        with open(path, "rb") as file:
+            mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        if len(mapped) < _HEADER.size:
+            mapped.close()
+            raise ValueError(f"Not a mapped config file: {path}")
+
+        view = memoryview(mapped)
+        magic, version, root_offset, _strings_offset = _HEADER.unpack_from(view)
+        if magic != MAPPED_CONFIG_MAGIC or version != MAPPED_CONFIG_VERSION:
+            raise ValueError(f"Not a mapped config file: {path}")
+
+        return cls(view=view, offset=root_offset)
+
+    @classmethod
+    def write_file(cls, raw: Any, path: str) -> None:
+        """Encode raw (native values or config values) into path, atomically."""
+        encoded = _MappedConfigWriter().encode(raw)
+        directory, name = os.path.split(os.path.abspath(path))
+
+        # Unique per writer, including threads of a process, and removed on errors.
+        with tempfile.NamedTemporaryFile(
+            dir=directory, prefix=f"{name}.", suffix=".tmp", delete=False
+        ) as file:
+            temporary_path = file.name
+        try:
+            with open(temporary_path, "wb") as file:
+                file.write(encoded)
+
+            os.replace(temporary_path, path)
+        finally:
+            with suppress(FileNotFoundError):
+                os.unlink(temporary_path)
+
+    @property
+    def raw(self) -> Any:
+        """Decoded value, containers hold MappedConfigValue children."""
+        tag = self._view[self._offset]
+
+        if tag == _TAG_DICT:
+            return {
+                self._read_string(key_offset): self._child(value_offset)
+                for key_offset, value_offset in self._iter_entries()
+            }
+        if tag == _TAG_LIST:
+            return [self._child(offset) for offset in self._iter_items()]
+
+        return self._read_scalar(tag)
+
+    @raw.setter
+    def raw(self, value: Any) -> None:
+        raise TypeError("MappedConfigValue is read-only")
+
+    def get_config_item(self, key: Any, default: Any = None) -> ConfigValueMixin:
+        if isinstance(key, str):
+            child = self._find_child(key, ConfigPath.parse_index(key))
+        elif isinstance(key, int):
+            child = self._find_child(None, key)
+        else:
+            child = None
+
+        return child if child is not None else self._default(default)
+
+    def is_bool(self) -> bool:
+        return self._is_tag_of_type(bool)
+
+    def is_bytes(self) -> bool:
+        return False
+
+    def is_complex(self) -> bool:
+        return False
+
+    def is_dict(self) -> bool:
+        return self._view[self._offset] == _TAG_DICT
+
+    def is_float(self) -> bool:
+        return self._is_tag_of_type(float)
+
+    def is_int(self) -> bool:
+        return self._is_tag_of_type(int)
+
+    def is_list(self) -> bool:
+        return self._view[self._offset] == _TAG_LIST
+
+    def is_none(self) -> bool:
+        return self._view[self._offset] == _TAG_NONE
+
+    def is_set(self) -> bool:
+        return False
+
+    def is_str(self) -> bool:
+        return self._is_tag_of_type(str)
+
+    def is_tuple(self) -> bool:
+        # Tuples are written as lists.
+        return False
+
+    def search(
+        self,
+        path: str | ConfigPath,
+        separator: str = DICT_PATH_SEPARATOR_DEFAULT,
+        default: Any = None,
+    ) -> ConfigValueMixin:
+        """Same as NestedConfigValue.search(), without decoding traversed nodes."""
+        if not isinstance(path, ConfigPath):
+            path = ConfigPath.from_string(path, separator)
+
+        current = self
+        for key, index in path.segments:
+            current = current._find_child(key, index)
+            if current is None:
+                return self._default(default)
+
+        return current
+
+    def to_dict(self) -> dict[str, Any]:
+        """Recursively decode to a native dict."""
+        return dict(self._assert_tag(_TAG_DICT, self.to_native()))
+
+    def to_list(self) -> list[Any]:
+        """Recursively decode to a native list."""
+        return list(self._assert_tag(_TAG_LIST, self.to_native()))
+
+    def to_native(self) -> Any:
+        """Recursively decode to native values, whatever the type of this node."""
+        tag = self._view[self._offset]
+
+        if tag == _TAG_DICT:
+            return {
+                self._read_string(key_offset): self._child(value_offset).to_native()
+                for key_offset, value_offset in self._iter_entries()
+            }
+        if tag == _TAG_LIST:
+            return [self._child(offset).to_native() for offset in self._iter_items()]
+
+        return self._read_scalar(tag)
+
+    def _assert_tag(self, tag: int, value: Any) -> Any:
+        if self._view[self._offset] != tag:
+            raise TypeError(f"Expected a {'dict' if tag == _TAG_DICT else 'list'}")
+        return value
+
+    def _child(self, offset: int) -> MappedConfigValue:
+        return self.__class__(view=self._view, offset=offset)
+
+    def _default(self, default: Any) -> ConfigValueMixin:
+        return ConfigValue(raw=default)
+
+    def _execute_nested_method(self, method: Callable[[], Any]) -> Any:
+        # Never nested, decode the value only once.
+        return self.raw
+
+    def _find_child(
+        self, key: str | None, index: int | None
+    ) -> MappedConfigValue | None:
+        view = self._view
+        tag = view[self._offset]
+
+        if tag == _TAG_DICT:
+            return self._find_key(key) if key is not None else None
+
+        if tag == _TAG_LIST and index is not None:
+            count = _COUNT.unpack_from(view, self._offset + _TAG.size)[0]
+            if -count <= index < count:
+                return self._child(
+                    _OFFSET.unpack_from(
+                        view,
+                        self._offset
+                        + _CONTAINER_HEADER_SIZE
+                        + (index % count) * _OFFSET.size,
+                    )[0]
+                )
+
+        return None
+
+    def _find_key(self, key: str) -> MappedConfigValue | None:
+        """Look key up in the hash slots of this dict node."""
+        view = self._view
+        count = _COUNT.unpack_from(view, self._offset + _TAG.size)[0]
+        if not count:
+            return None
+
+        entries_offset = self._offset + _CONTAINER_HEADER_SIZE
+        slots_offset = entries_offset + count * _ENTRY.size
+        mask = _slots_capacity(count) - 1
+        encoded = key.encode()
+        slot = zlib.crc32(encoded) & mask
+
+        while True:
+            entry = _COUNT.unpack_from(view, slots_offset + slot * _COUNT.size)[0]
+            if not entry:
+                return None
+
+            key_offset, value_offset = _ENTRY.unpack_from(
+                view, entries_offset + (entry - 1) * _ENTRY.size
+            )
+            length = _LENGTH.unpack_from(view, key_offset)[0]
+            if length == len(encoded):
+                start = key_offset + _LENGTH.size
+                if view[start : start + length] == encoded:
+                    return self._child(value_offset)
+
+            slot = (slot + 1) & mask
+
+    def _iter_entries(self) -> Iterator[tuple[int, int]]:
+        count = _COUNT.unpack_from(self._view, self._offset + _TAG.size)[0]
+        return _ENTRY.iter_unpack(
+            self._view[
+                self._offset
+                + _CONTAINER_HEADER_SIZE : self._offset
+                + _CONTAINER_HEADER_SIZE
+                + count * _ENTRY.size
+            ]
+        )
+
+    def _iter_items(self) -> Iterator[int]:
+        count = _COUNT.unpack_from(self._view, self._offset + _TAG.size)[0]
+        return (
+            offset
+            for (offset,) in _OFFSET.iter_unpack(
+                self._view[
+                    self._offset
+                    + _CONTAINER_HEADER_SIZE : self._offset
+                    + _CONTAINER_HEADER_SIZE
+                    + count * _OFFSET.size
+                ]
+            )
+        )
+
+    def _is_tag_of_type(self, value_type: type) -> bool:
+        """Type check from the tag of the node, without decoding it."""
+        return issubclass(_TAG_TYPES[self._view[self._offset]], value_type)
+
+    def _read_scalar(self, tag: int) -> Any:
+        if tag == _TAG_STR:
+            return self._read_string(
+                _OFFSET.unpack_from(self._view, self._offset + _TAG.size)[0]
+            )
+        if tag == _TAG_INT:
+            return _INT.unpack_from(self._view, self._offset + _TAG.size)[0]
+        if tag == _TAG_NONE:
+            return None
+        if tag == _TAG_TRUE:
+            return True
+        if tag == _TAG_FALSE:
+            return False
+        if tag == _TAG_FLOAT:
+            return _FLOAT.unpack_from(self._view, self._offset + _TAG.size)[0]
+        if tag == _TAG_BIG_INT:
+            return int(
+                self._read_string(
+                    _OFFSET.unpack_from(self._view, self._offset + _TAG.size)[0]
+                )
+            )
+
+        raise ValueError(f"Invalid mapped config node tag {tag} at {self._offset}")
+
+    def _read_string(self, offset: int) -> str:
+        length = _LENGTH.unpack_from(self._view, offset)[0]
+        start = offset + _LENGTH.size
+        return str(self._view[start : start + length], "utf-8")
+
+    def _resolve_nested(self) -> ConfigValueMixin:
+        return self
+
+
+def _slots_capacity(count: int) -> int:
+    """Number of hash slots of a dict, a power of two with a load factor <= 0.5."""
+    return 1 << (2 * count - 1).bit_length() if count else 0
+
+
+class _MappedConfigWriter:
+    """Encode a tree into the MappedConfigValue file format."""
+
+    def __init__(self) -> None:
+        self.nodes = bytearray()
+        # Positions in nodes of string offsets, relative until encode() ends.
+        self.string_patches: list[int] = []
+        self.string_offsets: dict[str, int] = {}
+        self.strings = bytearray()
+
+    def encode(self, raw: Any) -> bytes:
+        # Strings are appended after nodes, their offsets are patched at the end.
+        root_offset = self.write_node(raw)
+        strings_offset = _HEADER.size + len(self.nodes)
+
+        for patch in self.string_patches:
+            relative = _OFFSET.unpack_from(self.nodes, patch)[0]
+            _OFFSET.pack_into(self.nodes, patch, strings_offset + relative)
+
+        header = _HEADER.pack(
+            MAPPED_CONFIG_MAGIC, MAPPED_CONFIG_VERSION, root_offset, strings_offset
+        )
+        return header + bytes(self.nodes) + bytes(self.strings)
+
+    def string_offset(self, value: str) -> int:
+        offset = self.string_offsets.get(value)
+        if offset is None:
+            encoded = value.encode()
+            offset = self.string_offsets[value] = len(self.strings)
+            self.strings += _LENGTH.pack(len(encoded)) + encoded
+        return offset
+
+    def write_node(self, value: Any) -> int:
+        """Write value after its children and return its absolute offset."""
+        if isinstance(value, ConfigValueMixin):
+            return self.write_node(value.raw)
+
+        if isinstance(value, Mapping):
+            keys = list(value.keys())
+            for key in keys:
+                if not isinstance(key, str):
+                    raise TypeError(f"Mapped config keys must be str, got {key!r}")
+            children = [self.write_node(value[key]) for key in keys]
+            # Open addressing with linear probing, slots hold entry index + 1.
+            slots = [0] * _slots_capacity(len(keys))
+            mask = len(slots) - 1
+            for entry, key in enumerate(keys):
+                slot = zlib.crc32(key.encode()) & mask
+                while slots[slot]:
+                    slot = (slot + 1) & mask
+                slots[slot] = entry + 1
+
+            offset = self.start_node(_TAG_DICT)
+            self.nodes += _COUNT.pack(len(keys))
+            for key, child in zip(keys, children):
+                self.write_string_reference(key)
+                self.nodes += _OFFSET.pack(child)
+            for entry in slots:
+                self.nodes += _COUNT.pack(entry)
+            return offset
+
+        if isinstance(value, Sequence) and not isinstance(
+            value, (str, bytes, bytearray)
+        ):
+            children = [self.write_node(item) for item in value]
+            offset = self.start_node(_TAG_LIST)
+            self.nodes += _COUNT.pack(len(children))
+            for child in children:
+                self.nodes += _OFFSET.pack(child)
+            return offset
+
+        if value is None:
+            return self.start_node(_TAG_NONE)
+        if value is True:
+            return self.start_node(_TAG_TRUE)
+        if value is False:
+            return self.start_node(_TAG_FALSE)
+        if isinstance(value, int):
+            if -(2**63) <= value < 2**63:
+                offset = self.start_node(_TAG_INT)
+                self.nodes += _INT.pack(value)
+            else:
+                offset = self.start_node(_TAG_BIG_INT)
+                self.write_string_reference(str(value))
+            return offset
+        if isinstance(value, float):
+            offset = self.start_node(_TAG_FLOAT)
+            self.nodes += _FLOAT.pack(value)
+            return offset
+        if isinstance(value, str):
+            offset = self.start_node(_TAG_STR)
+            self.write_string_reference(value)
+            return offset
+
+        raise TypeError(f"Unsupported mapped config value type: {type(value)}")
+
+    def start_node(self, tag: int) -> int:
+        offset = _HEADER.size + len(self.nodes)
+        self.nodes += _TAG.pack(tag)
+        return offset
+
+    def write_string_reference(self, value: str) -> None:
+        self.string_patches.append(len(self.nodes))
+        self.nodes += _OFFSET.pack(self.string_offset(value))
@@ -1,17 +1,72 @@
 from __future__ import annotations
 
+import copy
 from collections.abc import Mapping, Sequence
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
+from wexample_helpers.classes.field import public_field
+from wexample_helpers.classes.private_field import private_field
 from wexample_helpers.decorator.base_class import base_class
 from wexample_helpers.helper.dict import DICT_PATH_SEPARATOR_DEFAULT
 
+from wexample_config.classes.config_path import ConfigPath
+from wexample_config.classes.mixin.config_value_mixin import ConfigValueMixin
 from wexample_config.config_value.config_value import ConfigValue
 
+if TYPE_CHECKING:
+    from wexample_config.classes.config_subscriptions import (
+        ConfigChangeCallback,
+        ConfigSubscriptions,
+    )
+
 
 @base_class
 class NestedConfigValue(ConfigValue):
+    lazy: bool = public_field(
+        description="Keep children raw and wrap them on first access only. "
+        "Nested containers created from a lazy node are lazy as well.",
+        default=False,
+    )
+    _index: dict[str, ConfigValueMixin] | None = private_field(
+        description="Flat mapping of full leaf paths to leaf values, "
+        "None unless built by indexed()",
+        default=None,
+        eq=False,
+        repr=False,
+    )
+    _index_separator: str = private_field(
+        description="Separator used to build the keys of the flat index",
+        default=DICT_PATH_SEPARATOR_DEFAULT,
+        eq=False,
+        repr=False,
+    )
+    _shared: bool = private_field(
+        description="Whether this node may be reachable from several snapshots, "
+        "in which case it is copied before being modified",
+        default=False,
+        eq=False,
+        repr=False,
+    )
+    _subscriptions: ConfigSubscriptions | None = private_field(
+        description="Subscribers notified of changes made through this node, "
+        "None until the first subscription",
+        default=None,
+        eq=False,
+        repr=False,
+    )
+    _wrapped: bool = private_field(
+        description="Children are already wrapped, skip the wrapping pass",
+        default=False,
+        init=True,
+        eq=False,
+        repr=False,
+    )
+
     def __attrs_post_init__(self) -> None:
+        # Lazy nodes keep their children raw, see _get_child().
+        if self.lazy or self._wrapped:
+            return
+
         # If this ConfigValue holds a dict,
         # replace all nested dict values with NestedConfigValue.
         if self.is_dict():
@@ -29,67 +84,151 @@ class NestedConfigValue(ConfigValue):
             self.raw = tuple(wrapped) if _is_tuple else wrapped
 
     @classmethod
-    def _wrap(cls, val: Any) -> ConfigValue:
+    def from_wrapped(
+        cls, raw: dict[str, Any] | list[Any], lazy: bool = False
+    ) -> NestedConfigValue:
+        """
+        Build a node from a dict or list whose children are already wrapped,
+        skipping the wrapping pass (e.g. trees built bottom-up by a loader).
+        """
+        return cls(raw=raw, lazy=lazy, wrapped=True)
+
+    @classmethod
+    def get_leaf_class_type(cls) -> type[ConfigValueMixin]:
+        """The class used to wrap primitive (non container) children."""
+        return ConfigValue
+
+    @classmethod
+    def indexed(
+        cls, raw: Any, separator: str = DICT_PATH_SEPARATOR_DEFAULT
+    ) -> NestedConfigValue:
+        """
+        Build a fully wrapped value along with a flat index of its leaves,
+        so search() resolves any leaf path with a single dict lookup.
+
+        The index is kept in sync by set_by_path() and update_nested() called
+        on this node; changes made through child nodes are not tracked. Keys
+        containing the separator are left out of the index, so that their
+        joined path never shadows the nested path it spells.
+        """
+        value = cls(raw=raw)
+        value._index = {}
+        value._index_separator = separator
+        value._index_add((), value)
+
+        return value
+
+    @classmethod
+    def _wrap(cls, val: Any, lazy: bool = False) -> ConfigValueMixin:
         """
         Recursively wrap:
         - any dict into NestedConfigValue(raw=dict)
         - lists/tuples into the same type with wrapped elements
         - everything else unchanged
+
+        With lazy=True, containers are wrapped without their children.
         """
         # Case 1: dict / Mapping → wrap in NestedConfigValue
         if isinstance(val, Mapping):
-            return cls(raw=dict(val))
+            return cls(raw=dict(val), lazy=lazy)
 
         # Case 2: sequences (list/tuple), but not str/bytes
         # Return a NestedConfigValue so traversal always hits a node
         # capable of get_config_item. Element wrapping is handled in initialization fields.
         if isinstance(val, Sequence) and not isinstance(val, (str, bytes, bytearray)):
-            return cls(raw=val)
+            if lazy and isinstance(val, list):
+                # Lazy children are cached in place, never in the caller's list.
+                val = list(val)
+            return cls(raw=val, lazy=lazy)
 
         # Case 3: primitive / other types → unchanged
-        return ConfigValue(raw=val)
+        return cls.get_leaf_class_type()(raw=val)
 
-    def get_config_item(self, key: Any, default: Any = None) -> ConfigValue | None:
-        # Dict access by string key
-        if self.is_dict() and isinstance(key, str) and key in self.raw:
-            return self.raw[key]
+    def derive(self, overrides: dict[str, Any] | None = None) -> NestedConfigValue:
+        """
+        Return a copy-on-write snapshot of this dict-based value, with overrides
+        merged as update_nested() would.
+        Example: tenant = base.derive({"db": {"name": "tenant_1"}})
 
-        # List/Tuple access by integer index (also accept str indices like "0")
-        if self.is_list() or self.is_tuple():
-            idx: int | None = None
-            if isinstance(key, int):
-                idx = key
-            elif isinstance(key, str) and (
-                key.isdigit() or (key.startswith("-") and key[1:].isdigit())
-            ):
-                idx = int(key)
-            if idx is not None:
-                seq = self.raw
-                n = len(seq)
-                if -n <= idx < n:
-                    return seq[idx]
-        return ConfigValue(raw=default)
+        Unchanged subtrees are shared with this value and only the nodes along
+        the overridden paths are allocated. Both values stay independent when
+        modified through set_by_path() or update_nested() on their root, which
+        copy shared nodes first. Shared children must not be modified directly.
+        Snapshots are never indexed.
+
+        Raises:
+            ValueError: If this ConfigValue is not a dict
+        """
+        if not self.is_dict():
+            raise ValueError("Can only derive dict-based NestedConfigValue")
+
+        snapshot = self._copy_node()
+        if overrides:
+            snapshot.update_nested(overrides)
+
+        return snapshot
+
+    def get_config_item(self, key: Any, default: Any = None) -> ConfigValueMixin | None:
+        # Dict access by string key,
+        # list/tuple access by integer index (also accept str indices like "0")
+        if isinstance(key, str):
+            index = None if isinstance(self.raw, dict) else ConfigPath.parse_index(key)
+            child = self._find_child(key, index)
+        elif isinstance(key, int):
+            child = self._find_child(None, key)
+        else:
+            child = None
+
+        return child if child is not None else ConfigValue(raw=default)
+
+    def get_subscriptions(self) -> ConfigSubscriptions:
+        """
+        Subscribers notified of set_by_path() and update_nested() calls on this
+        node, with paths relative to it. Use its batch() to coalesce changes.
+        """
+        from wexample_config.classes.config_subscriptions import (
+            ConfigSubscriptions,
+        )
+
+        if self._subscriptions is None:
+            self._subscriptions = ConfigSubscriptions(separator=self._index_separator)
+        return self._subscriptions
 
     def search(
         self,
-        path: str,
+        path: str | ConfigPath,
         separator: str = DICT_PATH_SEPARATOR_DEFAULT,
         default: Any = None,
-    ) -> ConfigValue:
+    ) -> ConfigValueMixin:
         """
         Traverse nested dict/list/tuple values by a separated path.
         Example: search("first.second.0.third").
-        Returns a ConfigValue/NestedConfigValue if found, else None.
+        Returns a leaf value or a NestedConfigValue if found,
+        else a ConfigValue holding the default.
+        The path may also be a precompiled ConfigPath, then separator is ignored.
         Assumes nested containers are wrapped as NestedConfigValue.
         """
-        if not path:
-            return self
-
-        current: ConfigValue | None = self
-        for part in path.split(separator):
+        if self._index is not None:
+            # Leaves are found in a single lookup, containers and
+            # missing paths fall back to the traversal below.
+            if isinstance(path, ConfigPath):
+                if path.separator == self._index_separator:
+                    found = self._index.get(path.path)
+                    if found is not None:
+                        return found
+            elif separator == self._index_separator:
+                found = self._index.get(path)
+                if found is not None:
+                    return found
+
+        if not isinstance(path, ConfigPath):
+            path = ConfigPath.from_string(path, separator)
+
+        current: ConfigValueMixin | None = self
+        for key, index in path.segments:
             if not isinstance(current, NestedConfigValue):
                 return ConfigValue(raw=default)
-            current = current.get_config_item(part)
+            current = current._find_child(key, index)
             if current is None:
                 return ConfigValue(raw=default)
 
@@ -97,7 +236,7 @@ class NestedConfigValue(ConfigValue):
 
     def set_by_path(
         self,
-        path: str,
+        path: str | ConfigPath,
         value: Any,
         separator: str = DICT_PATH_SEPARATOR_DEFAULT,
         create_missing: bool = True,
@@ -107,49 +246,68 @@ class NestedConfigValue(ConfigValue):
         Example: set_by_path("global.version", "0.1.0")
 
         Args:
-            path: Dot-separated path to the value (e.g., "global.version")
+            path: Dot-separated path to the value (e.g., "global.version"),
+                or a precompiled ConfigPath
             value: The value to set
-            separator: Path separator (default: ".")
+            separator: Path separator (default: "."), ignored for a ConfigPath
             create_missing: If True, creates missing intermediate dicts
 
         Raises:
             ValueError: If the path is invalid or intermediate values are not dicts
         """
+        if not isinstance(path, ConfigPath):
+            path = ConfigPath.from_string(path, separator)
+
         if not path:
             raise ValueError("Path cannot be empty")
 
         if not self.is_dict():
             raise ValueError("Can only set values on dict-based NestedConfigValue")
 
-        parts = path.split(separator)
+        parts = path.keys
+        separator = path.separator
         current = self.raw
 
         # Navigate to the parent of the target
         for i, part in enumerate(parts[:-1]):
             if part not in current:
                 if create_missing:
-                    current[part] = self._wrap({})
+                    current[part] = self._wrap({}, lazy=self.lazy)
                 else:
                     raise ValueError(
                         f"Path '{separator.join(parts[:i+1])}' does not exist"
                     )
 
-            next_item = current[part]
+            next_item = self._get_child(part, current)
             if not isinstance(next_item, NestedConfigValue) or not next_item.is_dict():
                 raise ValueError(
                     f"Cannot traverse path at '{separator.join(parts[:i+1])}': "
                     f"not a dict"
                 )
+            if next_item._shared:
+                next_item = current[part] = next_item._copy_node()
             current = next_item.raw
 
         # Set the final value
         final_key = parts[-1]
-        current[final_key] = self._wrap(value)
+        wrapped = self._wrap(value, lazy=self.lazy)
+        if self._index is not None:
+            self._index_replace(parts, current.get(final_key), wrapped)
+        current[final_key] = wrapped
+
+        if self._subscriptions is not None:
+            self._subscriptions.notify([self._subscriptions.separator.join(parts)])
+
+    def subscribe(self, path: str, callback: ConfigChangeCallback) -> None:
+        """Call callback with changed paths matching path, see ConfigSubscriptions."""
+        self.get_subscriptions().subscribe(path, callback)
 
     def to_dict(self) -> dict[str, Any]:
         """Recursively dump to a native dict.
 
         If the underlying value isn't a dict, fallback to the base conversion.
+        Children never touched in lazy mode are still raw and are copied
+        without being wrapped first.
         """
         if not self.is_dict():
             # Fallback – may still contain wrapped values; ensure we unwrap keys
@@ -165,6 +323,9 @@ class NestedConfigValue(ConfigValue):
         base_list = super().to_list()
         return [self._unwrap(v) for v in base_list]
 
+    def unsubscribe(self, path: str, callback: ConfigChangeCallback) -> None:
+        self.get_subscriptions().unsubscribe(path, callback)
+
     def update_nested(self, data: dict[str, Any]) -> None:
         """
         Update the nested structure with values from a dict.
@@ -181,7 +342,110 @@ class NestedConfigValue(ConfigValue):
         if not self.is_dict():
             raise ValueError("Can only update dict-based NestedConfigValue")
 
-        self._update_nested_recursive(self.raw, data)
+        changed: list[tuple[str, ...]] = []
+        self._update_nested_recursive(self.raw, data, (), changed)
+
+        # Notified at once, subscribers are called once per update.
+        if self._subscriptions is not None:
+            separator = self._subscriptions.separator
+            self._subscriptions.notify(separator.join(parts) for parts in changed)
+
+    def _copy_node(self) -> NestedConfigValue:
+        """Unshared copy of this dict node, sharing its children with this one."""
+        raw = dict(self.raw)
+        for child in raw.values():
+            if isinstance(child, NestedConfigValue):
+                child._shared = True
+
+        node = copy.copy(self)
+        node.raw = raw
+        node._index = None
+        node._shared = False
+        node._subscriptions = None
+
+        return node
+
+    def _find_child(
+        self, key: str | None, index: int | None
+    ) -> ConfigValueMixin | None:
+        """Look up a single path segment, by key in dicts or by index in sequences."""
+        raw = self.raw
+        if isinstance(raw, dict):
+            return self._get_child(key) if key in raw else None
+
+        if index is not None and isinstance(raw, (list, tuple)):
+            n = len(raw)
+            if -n <= index < n:
+                return self._get_child(index % n)
+
+        return None
+
+    def _get_child(self, key: Any, container: Any = None) -> ConfigValueMixin:
+        """Return the wrapped child stored under key.
+
+        Children of lazy nodes are stored raw until first access, then
+        wrapped and written back so later lookups reuse the same object.
+        The container defaults to self.raw and is expected to hold the key.
+        """
+        if container is None:
+            container = self.raw
+
+        value = container[key]
+        if isinstance(value, ConfigValueMixin):
+            return value
+
+        wrapped = self._wrap(value, lazy=True)
+        if isinstance(container, tuple):
+            # Tuples are immutable, rebuild the one held by this node.
+            self.raw = container[:key] + (wrapped,) + container[key + 1 :]
+        else:
+            container[key] = wrapped
+        return wrapped
+
+    def _index_add(self, parts: tuple[str, ...], value: ConfigValueMixin) -> None:
+        """Register every leaf under the given path into the flat index."""
+        if isinstance(value, NestedConfigValue):
+            raw = value.raw
+            if isinstance(raw, dict):
+                for key in raw:
+                    if self._index_separator not in key:
+                        self._index_add(parts + (key,), value._get_child(key))
+                return
+            if isinstance(raw, (list, tuple)):
+                for i in range(len(raw)):
+                    self._index_add(parts + (str(i),), value._get_child(i))
+                return
+
+        self._index[self._index_separator.join(parts)] = value
+
+    def _index_remove(self, parts: tuple[str, ...], value: ConfigValueMixin) -> None:
+        """Drop every leaf under the given path from the flat index."""
+        if isinstance(value, NestedConfigValue):
+            raw = value.raw
+            if isinstance(raw, dict):
+                for key, child in raw.items():
+                    if self._index_separator not in key:
+                        self._index_remove(parts + (key,), child)
+                return
+            if isinstance(raw, (list, tuple)):
+                for i, child in enumerate(raw):
+                    self._index_remove(parts + (str(i),), child)
+                return
+
+        self._index.pop(self._index_separator.join(parts), None)
+
+    def _index_replace(
+        self,
+        parts: tuple[str, ...],
+        old_value: ConfigValueMixin | None,
+        new_value: ConfigValueMixin,
+    ) -> None:
+        # Left out of the index, see indexed().
+        if any(self._index_separator in part for part in parts):
+            return
+        if old_value is not None:
+            self._index_remove(parts, old_value)
+        self._index_add(parts, new_value)
 
     def _unwrap(self, value: Any) -> Any:
         """Return a native Python object from any ConfigValue/NestedConfigValue.
@@ -197,7 +461,7 @@ class NestedConfigValue(ConfigValue):
             if value.is_list() or value.is_tuple():
                 return value.to_list()
             return value._get_nested_raw()
-        if isinstance(value, ConfigValue):
+        if isinstance(value, ConfigValueMixin):
             return value._get_nested_raw()
         # Best-effort for unexpected raw containers
         if isinstance(value, Mapping):
@@ -209,7 +473,11 @@ class NestedConfigValue(ConfigValue):
         return value
 
     def _update_nested_recursive(
-        self, target: dict[str, ConfigValue], source: dict[str, Any]
+        self,
+        target: dict[str, ConfigValueMixin],
+        source: dict[str, Any],
+        parts: tuple[str, ...],
+        changed: list[tuple[str, ...]],
     ) -> None:
         """
         Recursively merge source dict into target dict.
@@ -217,20 +485,33 @@ class NestedConfigValue(ConfigValue):
         Args:
             target: Target dict (with ConfigValue values)
             source: Source dict (with raw Python values)
+            parts: Path of target from this node, used to update the index
+            changed: Receives the path of every replaced or added value
         """
         for key, value in source.items():
             if key in target:
                 existing = target[key]
+                if isinstance(existing, Mapping) and isinstance(value, dict):
+                    # Untouched lazy child, wrap it so it can be merged.
+                    existing = self._get_child(key, target)
                 # If both are dicts, merge recursively
                 if (
                     isinstance(existing, NestedConfigValue)
                     and existing.is_dict()
                     and isinstance(value, dict)
                 ):
-                    self._update_nested_recursive(existing.raw, value)
-                else:
-                    # Otherwise, replace with new wrapped value
-                    target[key] = self._wrap(value)
+                    if existing._shared:
+                        existing = target[key] = existing._copy_node()
+                    self._update_nested_recursive(
+                        existing.raw, value, parts + (key,), changed
+                    )
+                    continue
             else:
-                # Key doesn't exist, add it
-                target[key] = self._wrap(value)
+                existing = None
+
+            # Otherwise, replace or add with new wrapped value
+            wrapped = self._wrap(value, lazy=self.lazy)
+            if self._index is not None:
+                self._index_replace(parts + (key,), existing, wrapped)
+            target[key] = wrapped
+            changed.append(parts + (key,))
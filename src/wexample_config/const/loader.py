@@ -0,0 +1,13 @@
+from __future__ import annotations
+
+# Events produced by config parsers and consumed by ConfigValueLoader,
+# as (event, value) pairs where value is only set for keys and scalars.
+LOADER_EVENT_END_ARRAY = "end_array"
+LOADER_EVENT_END_MAP = "end_map"
+LOADER_EVENT_MAP_KEY = "map_key"
+LOADER_EVENT_START_ARRAY = "start_array"
+LOADER_EVENT_START_MAP = "start_map"
+LOADER_EVENT_VALUE = "value"
+
+# Size of the chunks read from text streams by event parsers.
+LOADER_CHUNK_SIZE = 65536
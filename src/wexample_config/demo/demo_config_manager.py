@@ -3,6 +3,9 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 
 from wexample_config.classes.abstract_config_manager import AbstractConfigManager
+from wexample_config.demo.option_provider.demo_options_provider import (
+    DemoOptionsProvider,
+)
 
 if TYPE_CHECKING:
     from wexample_config.options_provider.abstract_options_provider import (
@@ -12,10 +15,6 @@ if TYPE_CHECKING:
 
 class DemoConfigManager(AbstractConfigManager):
     def get_options_providers(self) -> list[type[AbstractOptionsProvider]]:
-        from wexample_config.demo.option_provider.demo_options_provider import (
-            DemoOptionsProvider,
-        )
-
         return [
             DemoOptionsProvider,
         ]
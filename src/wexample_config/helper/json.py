@@ -0,0 +1,203 @@
+from __future__ import annotations
+
+import re
+from json import JSONDecodeError
+from json.decoder import scanstring
+from json.scanner import NUMBER_RE
+from typing import TYPE_CHECKING, Any
+
+from wexample_config.const.loader import (
+    LOADER_CHUNK_SIZE,
+    LOADER_EVENT_END_ARRAY,
+    LOADER_EVENT_END_MAP,
+    LOADER_EVENT_MAP_KEY,
+    LOADER_EVENT_START_ARRAY,
+    LOADER_EVENT_START_MAP,
+    LOADER_EVENT_VALUE,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from typing import TextIO
+
+_WHITESPACE_RE = re.compile(r"[ \t\n\r]*")
+
+# Same constants as accepted by json.loads().
+_LITERALS: tuple[tuple[str, Any], ...] = (
+    ("true", True),
+    ("false", False),
+    ("null", None),
+    ("NaN", float("nan")),
+    ("Infinity", float("inf")),
+    ("-Infinity", float("-inf")),
+)
+_LITERAL_MAX_LENGTH = max(len(literal) for literal, _value in _LITERALS)
+
+# Parser states, what is allowed at the current position.
+_EXPECT_VALUE = 0
+_EXPECT_VALUE_OR_END = 1
+_EXPECT_KEY = 2
+_EXPECT_KEY_OR_END = 3
+_EXPECT_COLON = 4
+_EXPECT_COMMA_OR_END = 5
+_EXPECT_EOF = 6
+
+
+def json_iter_events(
+    stream: TextIO, chunk_size: int = LOADER_CHUNK_SIZE
+) -> Iterator[tuple[str, Any]]:
+    """
+    Parse a JSON document from a text stream into loader events, reading it
+    by chunks so that the document is never held entirely in memory.
+    Raises JSONDecodeError on invalid documents, like json.load().
+    """
+    return _JsonEventReader(stream=stream, chunk_size=chunk_size).iter_events()
+
+
+class _JsonEventReader:
+    def __init__(self, stream: TextIO, chunk_size: int) -> None:
+        self.buffer = ""
+        self.chunk_size = chunk_size
+        self.eof = False
+        self.keys: dict[str, str] = {}
+        self.position = 0
+        self.stream = stream
+
+    def error(self, message: str) -> JSONDecodeError:
+        return JSONDecodeError(message, self.buffer, self.position)
+
+    def fill(self) -> bool:
+        """Append the next chunk to the buffer, False when the stream is exhausted."""
+        if self.eof:
+            return False
+
+        chunk = self.stream.read(self.chunk_size)
+        if not chunk:
+            self.eof = True
+            return False
+
+        self.buffer = self.buffer[self.position :] + chunk
+        self.position = 0
+        return True
+
+    def iter_events(self) -> Iterator[tuple[str, Any]]:
+        # Whether each open container is a map (True) or an array (False).
+        stack: list[bool] = []
+        expect = _EXPECT_VALUE
+
+        while True:
+            char = self.next_char()
+
+            if char is None:
+                if expect != _EXPECT_EOF:
+                    raise self.error("Expecting value")
+                return
+
+            if expect == _EXPECT_EOF:
+                raise self.error("Extra data")
+
+            if expect == _EXPECT_COLON:
+                if char != ":":
+                    raise self.error("Expecting ':' delimiter")
+                self.position += 1
+                expect = _EXPECT_VALUE
+                continue
+
+            if expect == _EXPECT_COMMA_OR_END:
+                self.position += 1
+                if char == ",":
+                    expect = _EXPECT_KEY if stack[-1] else _EXPECT_VALUE
+                    continue
+                if char == ("}" if stack[-1] else "]"):
+                    event = (
+                        LOADER_EVENT_END_MAP if stack.pop() else LOADER_EVENT_END_ARRAY
+                    )
+                    yield event, None
+                    expect = _EXPECT_COMMA_OR_END if stack else _EXPECT_EOF
+                    continue
+                self.position -= 1
+                raise self.error("Expecting ',' delimiter")
+
+            if expect in (_EXPECT_KEY, _EXPECT_KEY_OR_END):
+                if char == "}" and expect == _EXPECT_KEY_OR_END:
+                    self.position += 1
+                    stack.pop()
+                    yield LOADER_EVENT_END_MAP, None
+                    expect = _EXPECT_COMMA_OR_END if stack else _EXPECT_EOF
+                    continue
+                if char != '"':
+                    raise self.error(
+                        "Expecting property name enclosed in double quotes"
+                    )
+                key = self.read_string()
+                # Share repeated keys, as json.loads() does.
+                yield LOADER_EVENT_MAP_KEY, self.keys.setdefault(key, key)
+                expect = _EXPECT_COLON
+                continue
+
+            # A value is expected.
+            if char == "]" and expect == _EXPECT_VALUE_OR_END:
+                self.position += 1
+                stack.pop()
+                yield LOADER_EVENT_END_ARRAY, None
+            elif char == "{":
+                self.position += 1
+                stack.append(True)
+                yield LOADER_EVENT_START_MAP, None
+                expect = _EXPECT_KEY_OR_END
+                continue
+            elif char == "[":
+                self.position += 1
+                stack.append(False)
+                yield LOADER_EVENT_START_ARRAY, None
+                expect = _EXPECT_VALUE_OR_END
+                continue
+            elif char == '"':
+                yield LOADER_EVENT_VALUE, self.read_string()
+            else:
+                yield LOADER_EVENT_VALUE, self.read_scalar()
+
+            expect = _EXPECT_COMMA_OR_END if stack else _EXPECT_EOF
+
+    def next_char(self) -> str | None:
+        """Skip whitespaces and return the next character, None at the end."""
+        while True:
+            self.position = _WHITESPACE_RE.match(self.buffer, self.position).end()
+            if self.position < len(self.buffer):
+                return self.buffer[self.position]
+            if not self.fill():
+                return None
+
+    def read_scalar(self) -> Any:
+        # Make sure numbers and literals are not cut by the end of the buffer.
+        while True:
+            match = NUMBER_RE.match(self.buffer, self.position)
+            end = match.end() if match else self.position
+            if end < len(self.buffer) - _LITERAL_MAX_LENGTH or not self.fill():
+                break
+
+        if match is not None:
+            integer, fraction, exponent = match.groups()
+            self.position = match.end()
+            if fraction or exponent:
+                return float(integer + (fraction or "") + (exponent or ""))
+            return int(integer)
+
+        for literal, value in _LITERALS:
+            if self.buffer.startswith(literal, self.position):
+                self.position += len(literal)
+                return value
+
+        raise self.error("Expecting value")
+
+    def read_string(self) -> str:
+        while True:
+            try:
+                value, end = scanstring(self.buffer, self.position + 1, True)
+            except JSONDecodeError:
+                # The string may continue in the next chunk.
+                if self.fill():
+                    continue
+                raise
+            self.position = end
+            return value
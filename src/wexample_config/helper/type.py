@@ -0,0 +1,171 @@
+from __future__ import annotations
+
+from collections.abc import Callable
+from types import UnionType
+from typing import Any, Union, get_args, get_origin
+
+# Origins handled as generics by type_validate_or_fail, plain classes otherwise.
+_GENERIC_ORIGINS: frozenset = frozenset({list, dict, tuple, Union})
+
+
+def type_compile_validator(allowed_type: Any) -> Callable[[Any], None] | None:
+    """
+    Compile allowed_type into a validator behaving like type_validate_or_fail.
+
+    Returns None when every value is allowed (Any). Otherwise, the validator
+    runs a specialized check (isinstance tuples, per-key/per-item loops) and
+    only calls type_validate_or_fail, which raises the detailed exception,
+    when this check fails or when the type is not supported by the compiler.
+    """
+    from wexample_helpers.helper.type import type_validate_or_fail
+
+    if allowed_type is Any:
+        return None
+
+    check = _type_compile_root_check(allowed_type)
+
+    if check is None:
+
+        def _validate_fallback(value: Any) -> None:
+            type_validate_or_fail(value=value, allowed_type=allowed_type)
+
+        return _validate_fallback
+
+    def _validate(value: Any) -> None:
+        if not check(value):
+            type_validate_or_fail(value=value, allowed_type=allowed_type)
+
+    return _validate
+
+
+def _type_accept(value: Any) -> bool:
+    return True
+
+
+def _type_compile_check(allowed_type: Any) -> Callable[[Any], bool] | None:
+    """
+    Predicate following type_generic_value_is_valid rules, used for nested
+    types. Returns None when the type can't be compiled; a compiled predicate
+    never accepts a value that the reference implementation would reject.
+    """
+    if _type_is_typed_dict(allowed_type):
+        return None
+
+    origin = get_origin(allowed_type) or allowed_type
+    args = get_args(allowed_type)
+
+    if origin is Any:
+        return _type_accept
+
+    if origin is Union or origin is UnionType:
+        checks = []
+        for arg in args:
+            check = _type_compile_check(arg)
+            if check is None:
+                return None
+            if check is _type_accept:
+                return _type_accept
+            checks.append(check)
+
+        classes = tuple(arg for arg in args if _type_is_plain_class(arg))
+        if len(classes) == len(args):
+            return lambda value: isinstance(value, classes)
+
+        checks = tuple(checks)
+        return lambda value: any(check(value) for check in checks)
+
+    if origin is dict:
+        key_check, value_check = (
+            (_type_compile_check(args[0]), _type_compile_check(args[1]))
+            if len(args) == 2
+            else (_type_accept, _type_accept)
+        )
+        if key_check is None or value_check is None:
+            return None
+        if key_check is _type_accept and value_check is _type_accept:
+            return lambda value: isinstance(value, dict)
+        return lambda value: isinstance(value, dict) and all(
+            key_check(k) and value_check(v) for k, v in value.items()
+        )
+
+    if origin is list or origin is set:
+        item_check = _type_compile_check(args[0]) if args else _type_accept
+        if item_check is None:
+            return None
+        if item_check is _type_accept:
+            return lambda value: isinstance(value, origin)
+        return lambda value: isinstance(value, origin) and all(
+            item_check(item) for item in value
+        )
+
+    if origin is tuple:
+        if not args:
+            return lambda value: isinstance(value, tuple)
+        item_checks = tuple(_type_compile_check(arg) for arg in args)
+        if None in item_checks:
+            return None
+        return (
+            lambda value: isinstance(value, tuple)
+            and len(value) == len(item_checks)
+            and all(check(item) for check, item in zip(item_checks, value))
+        )
+
+    if origin is type:
+        if not args or args[0] is Any:
+            return lambda value: isinstance(value, type)
+        # Unions of classes are left to the reference implementation.
+        if not _type_is_plain_class(args[0]):
+            return None
+        param = args[0]
+        return lambda value: isinstance(value, type) and issubclass(value, param)
+
+    if _type_supports_isinstance(origin):
+        return lambda value: isinstance(value, origin)
+
+    return None
+
+
+def _type_compile_root_check(allowed_type: Any) -> Callable[[Any], bool] | None:
+    """Predicate following type_validate_or_fail rules for the top level type."""
+    if _type_is_typed_dict(allowed_type):
+        return None
+
+    if allowed_type is Callable:
+        return callable
+
+    if (get_origin(allowed_type) or allowed_type) in _GENERIC_ORIGINS:
+        return _type_compile_check(allowed_type)
+
+    # Plain classes never accept callables at top level, see type_validate_or_fail.
+    if _type_supports_isinstance(allowed_type):
+        return lambda value: isinstance(value, allowed_type) and not callable(value)
+
+    if isinstance(allowed_type, UnionType):
+        return _type_compile_check(allowed_type)
+
+    return None
+
+
+def _type_is_plain_class(allowed_type: Any) -> bool:
+    return (
+        get_origin(allowed_type) is None
+        and allowed_type is not type
+        and _type_supports_isinstance(allowed_type)
+    )
+
+
+def _type_is_typed_dict(allowed_type: Any) -> bool:
+    return hasattr(allowed_type, "__annotations__") and hasattr(
+        allowed_type, "__total__"
+    )
+
+
+def _type_supports_isinstance(allowed_type: Any) -> bool:
+    """Classes usable with isinstance(), excluding TypedDict and static protocols."""
+    if not isinstance(allowed_type, type) or _type_is_typed_dict(allowed_type):
+        return False
+    try:
+        isinstance(None, allowed_type)
+    except TypeError:
+        return False
+    return True
@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from wexample_config.const.loader import (
+    LOADER_EVENT_END_ARRAY,
+    LOADER_EVENT_END_MAP,
+    LOADER_EVENT_MAP_KEY,
+    LOADER_EVENT_START_ARRAY,
+    LOADER_EVENT_START_MAP,
+    LOADER_EVENT_VALUE,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from typing import TextIO
+
+
+def yaml_iter_events(stream: TextIO) -> Iterator[tuple[str, Any]]:
+    """
+    Parse the first YAML document of a stream into loader events, scalars
+    being resolved as yaml.safe_load() would. Requires PyYAML, aliases and
+    complex mapping keys are not supported.
+    """
+    import yaml
+
+    loader = yaml.SafeLoader(stream)
+    # For each open container, whether the next scalar is a map key (True),
+    # a map value (False), or an array item (None).
+    stack: list[bool | None] = []
+    keys: dict[str, str] = {}
+
+    try:
+        while loader.check_event():
+            event = loader.get_event()
+            expect_key = stack[-1] if stack else None
+
+            if isinstance(event, (yaml.MappingStartEvent, yaml.SequenceStartEvent)):
+                if expect_key:
+                    raise ValueError(
+                        f"Complex mapping keys are not supported {event.start_mark}"
+                    )
+                if stack:
+                    stack[-1] = None if expect_key is None else True
+
+                if isinstance(event, yaml.MappingStartEvent):
+                    stack.append(True)
+                    yield LOADER_EVENT_START_MAP, None
+                else:
+                    stack.append(None)
+                    yield LOADER_EVENT_START_ARRAY, None
+            elif isinstance(event, yaml.MappingEndEvent):
+                stack.pop()
+                yield LOADER_EVENT_END_MAP, None
+            elif isinstance(event, yaml.SequenceEndEvent):
+                stack.pop()
+                yield LOADER_EVENT_END_ARRAY, None
+            elif isinstance(event, yaml.ScalarEvent):
+                value = _yaml_construct_scalar(loader, event)
+                if expect_key:
+                    stack[-1] = False
+                    # Share repeated keys, as json.loads() does.
+                    if isinstance(value, str):
+                        value = keys.setdefault(value, value)
+                    yield LOADER_EVENT_MAP_KEY, value
+                else:
+                    if expect_key is not None:
+                        stack[-1] = True
+                    yield LOADER_EVENT_VALUE, value
+            elif isinstance(event, yaml.AliasEvent):
+                raise ValueError(f"YAML aliases are not supported {event.start_mark}")
+            elif isinstance(event, yaml.DocumentEndEvent):
+                return
+    finally:
+        loader.dispose()
+
+
+def _yaml_construct_scalar(loader: Any, event: Any) -> Any:
+    import yaml
+
+    tag = event.tag
+    if tag is None or tag == "!":
+        tag = loader.resolve(yaml.ScalarNode, event.value, event.implicit)
+
+    node = yaml.ScalarNode(
+        tag, event.value, event.start_mark, event.end_mark, style=event.style
+    )
+    value = loader.construct_object(node)
+    # Scalars are never referenced again, don't keep them in the loader.
+    loader.constructed_objects.pop(node, None)
+
+    return value
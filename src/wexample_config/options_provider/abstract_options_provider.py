@@ -6,6 +6,8 @@ from wexample_helpers.classes.abstract_method import abstract_method
 from wexample_helpers.classes.base_class import BaseClass
 from wexample_helpers.decorator.base_class import base_class
 
+from wexample_config.classes.options_registry import OptionsRegistry
+
 if TYPE_CHECKING:
     from wexample_config.config_option.abstract_config_option import (
         AbstractConfigOption,
@@ -24,11 +26,11 @@ class AbstractOptionsProvider(BaseClass):
         pass
 
     @classmethod
-    def get_options_registry(cls) -> dict[str, type[AbstractConfigOption]]:
+    def get_options_registry(cls) -> OptionsRegistry:
         if "_options_registry" not in cls.__dict__:
             setattr(
                 cls,
                 "_options_registry",
-                {option.get_name(): option for option in cls.get_options()},
+                OptionsRegistry.from_options(cls.get_options()),
             )
         return cls.__dict__["_options_registry"]
@@ -12,6 +12,179 @@ class TestConfigManager:
 
         self.config_manager = DemoConfigManager()
 
+    def test_aset_value(self) -> None:
+        import asyncio
+        import time
+
+        from wexample_config.config_option.children_config_option import (
+            ChildrenConfigOption,
+        )
+        from wexample_config.exception.invalid_option_exception import (
+            InvalidOptionException,
+        )
+
+        async def _name(option: Any) -> str:
+            await asyncio.sleep(0.05)
+            return f"child_{len(option.parent.children)}"
+
+        children = [{"name": _name, "children": []} for _ in range(50)]
+        start = time.perf_counter()
+        asyncio.run(
+            self.config_manager.aset_value({"name": "root", "children": children})
+        )
+
+        # Callbacks of sibling options wait concurrently.
+        assert time.perf_counter() - start < 50 * 0.05 / 2
+        option = self.config_manager.get_option(ChildrenConfigOption)
+        assert [child.parent for child in option.children] == [option] * 50
+        assert self.config_manager.dump() == {
+            "name": "root",
+            "children": [{"name": "child_0", "children": []}] * 50,
+        }
+
+        with pytest.raises(InvalidOptionException):
+            asyncio.run(
+                self.config_manager.aset_value(
+                    {"children": [{"name": _name, "unexpected_option": "yes"}]}
+                )
+            )
+
+        # Sync builds refuse async callbacks instead of storing coroutines.
+        with pytest.raises(TypeError):
+            self.config_manager.set_value({"name": _name})
+
+    def test_aset_value_hooks(self) -> None:
+        import asyncio
+
+        from wexample_config.classes.abstract_config_manager import (
+            AbstractConfigManager,
+        )
+        from wexample_config.config_option.abstract_config_option import (
+            AbstractConfigOption,
+        )
+        from wexample_config.config_option.name_config_option import NameConfigOption
+
+        added = []
+
+        class LabelConfigOption(AbstractConfigOption):
+            @classmethod
+            async def aresolve_config(cls, config: dict[str, Any]) -> dict[str, Any]:
+                config.setdefault("label", "resolved")
+                return config
+
+            @staticmethod
+            def get_raw_value_allowed_type() -> Any:
+                return str
+
+        class LabelConfigManager(AbstractConfigManager):
+            def add_child(self, child: AbstractConfigOption) -> None:
+                added.append(child.dump())
+
+            def get_allowed_options(self) -> list[type[AbstractConfigOption]]:
+                return [LabelConfigOption, NameConfigOption]
+
+        manager = LabelConfigManager()
+        asyncio.run(manager.aset_value({"name": "root"}))
+
+        assert manager.dump() == {"name": "root", "label": "resolved"}
+        # Parents are notified of children with their value set.
+        assert sorted(added) == ["resolved", "root"]
+
+        # Sync builds refuse async only hooks instead of skipping them.
+        with pytest.raises(TypeError):
+            LabelConfigManager().set_value({"name": "root"})
+
+    def test_build_report(self) -> None:
+        from wexample_config.classes.config_build_tracer import ConfigBuildTracer
+        from wexample_config.config_option.children_config_option import (
+            ChildrenConfigOption,
+        )
+        from wexample_config.config_option.name_config_option import NameConfigOption
+        from wexample_config.demo.demo_config_manager import DemoConfigManager
+
+        def _name(option: Any) -> str:
+            return "child"
+
+        assert self.config_manager.get_build_report() == []
+
+        manager = DemoConfigManager(tracer=ConfigBuildTracer())
+        manager.set_value(
+            {"name": "root", "children": [{"name": _name} for _ in range(10)]}
+        )
+
+        report = {
+            (entry["option_class"], entry["phase"]): entry
+            for entry in manager.get_build_report()
+        }
+        assert report[(NameConfigOption, "create")]["count"] == 11
+        assert report[(NameConfigOption, "render")]["count"] == 10
+        assert report[(NameConfigOption, "resolve")]["count"] == 11
+        assert report[(ChildrenConfigOption, "create")]["count"] == 1
+        assert report[(DemoConfigManager, "prepare")]["count"] == 1
+        # Children are built within their parent.
+        assert (
+            report[(ChildrenConfigOption, "create")]["seconds"]
+            >= report[(NameConfigOption, "render")]["seconds"]
+        )
+        assert "ChildrenConfigOption" in manager.get_tracer().format_report()
+
+    def test_build_report_scoped(self) -> None:
+        from wexample_config.classes.config_build_tracer import ConfigBuildTracer
+        from wexample_config.config_option.name_config_option import NameConfigOption
+        from wexample_config.config_value.callback_render_config_value import (
+            CallbackRenderConfigValue,
+        )
+        from wexample_config.demo.demo_config_manager import DemoConfigManager
+
+        traced = DemoConfigManager(tracer=ConfigBuildTracer())
+        config = {
+            "name": CallbackRenderConfigValue(
+                raw=lambda option: NameConfigOption(value="x")
+            )
+        }
+
+        # Options returned by callbacks are attached to the tree afterwards,
+        # whether or not another manager traces its build.
+        for manager in (DemoConfigManager(), traced):
+            manager.set_value(config)
+            option = manager.get_option(NameConfigOption)
+            assert option.get_root() is manager
+            assert option.get_tracer() is manager.tracer
+
+    def test_build_many(self) -> None:
+        from wexample_config.demo.demo_config_manager import DemoConfigManager
+        from wexample_config.exception.invalid_option_exception import (
+            InvalidOptionException,
+        )
+
+        configs = [
+            {"name": "tenant", "children": [{"name": "worker"}]},
+            {"name": "tenant", "unexpected": True},
+            {"name": "tenant", "children": [{"name": "worker"}, {"name": "other"}]},
+        ]
+
+        batch = DemoConfigManager.build_many(iter(configs))
+
+        assert batch.has_errors()
+        assert list(batch.errors) == [1]
+        assert isinstance(batch.errors[1], InvalidOptionException)
+        assert batch.managers[1] is None
+
+        first, last = batch.get_managers()
+        assert [first.dump(), last.dump()] == [configs[0], configs[2]]
+        # Managers own their values unless sharing is requested.
+        assert batch.shared_values == 0
+        first.get_option("name").get_value().set_str("changed")
+        assert last.dump()["name"] == "tenant"
+
+        batch = DemoConfigManager.build_many(configs[::2], share_leaf_values=True)
+        first, last = batch.get_managers()
+        # Equal names are a single value shared by both managers.
+        assert batch.shared_values == 2
+        assert last.get_option("name").get_value() is (
+            first.get_option("name").get_value()
+        )
+
     def test_configure_callback(self) -> None:
         from wexample_config.config_value.callback_render_config_value import (
             CallbackRenderConfigValue,
@@ -24,6 +197,116 @@ class TestConfigManager:
 
         assert self.config_manager.get_option("name").get_value().is_str()
 
+    def test_configure_callback_dependencies(self) -> None:
+        from wexample_config.config_option.children_config_option import (
+            ChildrenConfigOption,
+        )
+        from wexample_config.config_value.callback_render_config_value import (
+            CallbackRenderConfigValue,
+        )
+        from wexample_config.demo.demo_config_manager import DemoConfigManager
+
+        calls = []
+
+        def _name(option: Any) -> str:
+            env = option.get_root().get_value().get_dict()["env"]
+            calls.append(env)
+            return f"child_{env}"
+
+        def _config(env: str) -> dict[str, Any]:
+            return {
+                "env": env,
+                "children": [
+                    {"name": CallbackRenderConfigValue(raw=_name, dependencies=["env"])}
+                    for _ in range(20)
+                ],
+            }
+
+        manager = DemoConfigManager(allow_undefined_keys=True)
+        manager.set_value(_config("prod"))
+
+        # Rendered once for all children sharing the same dependencies.
+        assert calls == ["prod"]
+        children = manager.get_option(ChildrenConfigOption)
+
+        change_set = manager.reload(_config("prod"))
+        assert change_set.has_changes() is False
+        assert manager.get_option(ChildrenConfigOption) is children
+        assert calls == ["prod"]
+
+        # Children are reloaded in place, changes are named by child index.
+        names = [f"children.{index}.name" for index in range(20)]
+        change_set = manager.reload(_config("dev"))
+        assert change_set.modified == ["env", *names]
+        assert calls == ["prod", "dev"]
+        assert manager.dump()["children"] == [{"name": "child_dev"}] * 20
+        assert manager.get_option(ChildrenConfigOption) is children
+
+        change_set = manager.reload(_config("prod"))
+        assert change_set.modified == ["env", *names]
+        assert calls == ["prod", "dev"]
+
+    def test_configure_callback_dependencies_options(self) -> None:
+        from wexample_config.config_option.children_config_option import (
+            ChildrenConfigOption,
+        )
+        from wexample_config.config_option.name_config_option import NameConfigOption
+        from wexample_config.config_value.callback_render_config_value import (
+            CallbackRenderConfigValue,
+        )
+        from wexample_config.demo.demo_config_manager import DemoConfigManager
+
+        calls = []
+
+        def _name(option: Any) -> NameConfigOption:
+            calls.append(option)
+            return NameConfigOption(value="name")
+
+        callback = CallbackRenderConfigValue(raw=_name, dependencies=["env"])
+        manager = DemoConfigManager(allow_undefined_keys=True)
+        manager.set_value(
+            {
+                "env": "prod",
+                "name": callback,
+                "children": [{"name": callback}, {"name": callback}],
+            }
+        )
+
+        # Options are attached to their parent, they are never memoized.
+        children = manager.get_option(ChildrenConfigOption).children
+        parents = [manager, *children]
+        options = [parent.get_option(NameConfigOption) for parent in parents]
+        assert calls == parents
+        assert len({id(option) for option in options}) == 3
+        assert [option.parent for option in options] == parents
+
+    def test_configure_callback_dependencies_shared(self) -> None:
+        from wexample_config.config_value.callback_render_config_value import (
+            CallbackRenderConfigValue,
+        )
+        from wexample_config.demo.demo_config_manager import DemoConfigManager
+
+        def _name(option: Any) -> str:
+            return f"child_{option.get_root().get_value().get_dict()['env']}"
+
+        # A single callback value used by the configs of both managers.
+        callback = CallbackRenderConfigValue(raw=_name, dependencies=["env"])
+
+        def _config(env: str) -> dict[str, Any]:
+            return {"env": env, "children": [{"name": callback}]}
+
+        first = DemoConfigManager(allow_undefined_keys=True)
+        first.set_value(_config("prod"))
+        second = DemoConfigManager(allow_undefined_keys=True)
+        second.set_value(_config("dev"))
+
+        assert callback == CallbackRenderConfigValue(raw=_name, dependencies=["env"])
+
+        change_set = first.reload(_config("dev"))
+        assert change_set.modified == ["env", "children.0.name"]
+        assert first.dump()["children"] == [{"name": "child_dev"}]
+        assert second.reload(_config("dev")).has_changes() is False
+
     def test_configure_custom_value_type(self) -> None:
         from wexample_helpers.exception.not_allowed_variable_type_exception import (
             NotAllowedVariableTypeException,
@@ -159,6 +442,25 @@ class TestConfigManager:
         assert isinstance(option, DemoDictConfigOption)
         assert isinstance(option.get_value().get_dict().get("lorem"), dict)
 
+    def test_subscriptions(self) -> None:
+        calls = []
+
+        self.config_manager.subscribe("demo_nested", calls.append)
+        self.config_manager.set_value(
+            {"name": "first", "demo_nested": {"name": "nested"}}
+        )
+        assert calls == [["demo_nested"]]
+
+        self.config_manager.reload(
+            {"name": "second", "demo_nested": {"name": "nested", "demo_union": "a"}}
+        )
+        assert calls[-1] == ["demo_nested.demo_union"]
+
+        self.config_manager.reload(
+            {"name": "third", "demo_nested": {"name": "nested", "demo_union": "a"}}
+        )
+        assert len(calls) == 2
+
     def test_configure_unexpected(self) -> None:
         from wexample_config.exception.invalid_option_exception import (
             InvalidOptionException,
@@ -202,6 +504,122 @@ class TestConfigManager:
             self.config_manager.get_option(DemoUnionConfigOption).get_value().is_dict()
         )
 
+    def test_parallel_children(self) -> None:
+        from concurrent.futures import ThreadPoolExecutor
+
+        from wexample_config.config_option.children_config_option import (
+            ChildrenConfigOption,
+        )
+        from wexample_config.demo.demo_config_manager import DemoConfigManager
+        from wexample_config.exception.invalid_option_exception import (
+            InvalidOptionException,
+        )
+
+        children = [{"name": f"child_{i}", "children": []} for i in range(200)]
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            manager = DemoConfigManager(build_executor=executor)
+            manager.set_value({"children": children})
+
+            with pytest.raises(InvalidOptionException):
+                DemoConfigManager(build_executor=executor).set_value(
+                    {"children": children + [{"unexpected_option": "yes"}]}
+                )
+
+        option = manager.get_option(ChildrenConfigOption)
+        assert option.get_build_executor() is executor
+        assert [child.parent for child in option.children] == [option] * 200
+        assert option.dump() == [
+            {"name": f"child_{i}", "children": []} for i in range(200)
+        ]
+
+    def test_reload(self) -> None:
+        from wexample_config.demo.config_option.demo_dict_config_option import (
+            DemoDictConfigOption,
+        )
+        from wexample_config.demo.config_option.demo_nested_config_option import (
+            DemoNestedConfigOption,
+        )
+
+        self.config_manager.set_value(
+            {
+                "name": "first",
+                "demo_union": "hey",
+                "demo_nested": {
+                    "name": "nested",
+                    "demo_dict": {"lorem": {"other": 123}},
+                },
+                "demo_extensible": {"unexpected_option": "yes"},
+            }
+        )
+        nested = self.config_manager.get_option(DemoNestedConfigOption)
+        demo_dict = nested.get_option(DemoDictConfigOption)
+        union = self.config_manager.get_option("demo_union")
+
+        change_set = self.config_manager.reload(
+            {
+                "name": "second",
+                "demo_nested": {
+                    "name": "nested",
+                    "demo_dict": {"lorem": {"other": 123}},
+                    "demo_union": "new",
+                },
+                "demo_extensible": {"unexpected_option": "no"},
+                "demo_list": [],
+            }
+        )
+
+        assert change_set.added == ["demo_nested.demo_union", "demo_list"]
+        assert change_set.modified == ["name", "demo_extensible"]
+        assert change_set.removed == ["demo_union"]
+        assert self.config_manager.get_option("demo_union") is None
+        assert union.get_value().get_str() == "hey"
+
+        # Unchanged options are kept as is.
+        assert self.config_manager.get_option(DemoNestedConfigOption) is nested
+        assert nested.get_option(DemoDictConfigOption) is demo_dict
+        assert nested.get_option("demo_union").get_value().get_str() == "new"
+        assert self.config_manager.get_option("name").get_value().get_str() == (
+            "second"
+        )
+        assert self.config_manager.dump()["demo_extensible"] == {
+            "unexpected_option": "no"
+        }
+
+        assert not self.config_manager.reload(self.config_manager.dump()).has_changes()
+
+    def test_reload_children(self) -> None:
+        from wexample_config.config_option.children_config_option import (
+            ChildrenConfigOption,
+        )
+
+        self.config_manager.set_value(
+            {"children": [{"name": "first"}, {"name": "second", "children": []}]}
+        )
+        option = self.config_manager.get_option(ChildrenConfigOption)
+        first, second = option.children
+
+        change_set = self.config_manager.reload(
+            {"children": [{"name": "first"}, {"name": "changed", "children": []}]}
+        )
+        assert change_set.modified == ["children.1.name"]
+        assert self.config_manager.get_option(ChildrenConfigOption) is option
+        assert option.children[0] is first and option.children[1] is second
+        assert second.get_option("name").get_value().get_str() == "changed"
+
+        change_set = self.config_manager.reload(
+            {"children": [{"name": "first"}, {"name": "added"}, {"name": "third"}]}
+        )
+        assert change_set.added == ["children.2"]
+        assert change_set.modified == ["children.1.name"]
+        assert change_set.removed == ["children.1.children"]
+        assert option.children[0] is first and option.children[1] is second
+
+        change_set = self.config_manager.reload({"children": [{"name": "first"}]})
+        assert change_set.removed == ["children.1", "children.2"]
+        assert len(option.children) == 1 and option.children[0] is first
+        assert self.config_manager.dump() == {"children": [{"name": "first"}]}
+
     def test_setup(self) -> None:
         from wexample_config.demo.demo_config_manager import DemoConfigManager
 
@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+
+def _config() -> dict[str, Any]:
+    from wexample_config.config_value.custom_type_config_value import (
+        CustomTypeConfigValue,
+    )
+
+    return {
+        "name": "root",
+        "children": [{"name": f"child_{i}"} for i in range(10)],
+        "demo_custom_value": CustomTypeConfigValue(raw="yeah"),
+        "demo_nested": {"name": "nested"},
+    }
+
+
+class TestConfigSnapshot:
+    def test_load_or_build(self, tmp_path: Path) -> None:
+        from wexample_config.classes.config_snapshot import ConfigSnapshot
+        from wexample_config.demo.demo_config_manager import DemoConfigManager
+
+        snapshot = ConfigSnapshot(path=str(tmp_path / "config.snapshot"))
+        built = snapshot.load_or_build(DemoConfigManager, _config())
+        restored = snapshot.load_or_build(DemoConfigManager, _config())
+
+        assert restored is not built
+        assert isinstance(restored, DemoConfigManager)
+        assert restored.dump() == built.dump()
+        assert restored.get_option("demo_custom_value").get_value().get_str() == (
+            "yeah"
+        )
+        child = restored.get_option("children").children[3]
+        assert child.get_root() is restored
+        assert child.get_option("name").get_value().get_str() == "child_3"
+
+    def test_key(self, tmp_path: Path) -> None:
+        from wexample_config.classes.config_snapshot import ConfigSnapshot
+        from wexample_config.demo.demo_config_manager import DemoConfigManager
+
+        manager = DemoConfigManager()
+        snapshot = ConfigSnapshot(path=str(tmp_path / "config.snapshot"))
+        key = snapshot.get_key(manager, _config())
+
+        assert key == snapshot.get_key(manager, _config())
+        assert key != snapshot.get_key(manager, {**_config(), "name": "other"})
+        assert key != ConfigSnapshot(path=snapshot.path, salt="2.0").get_key(
+            manager, _config()
+        )
+
+        assert snapshot.load(key) is None
+        manager.set_value(_config())
+        snapshot.write(manager, key)
+
+        assert snapshot.load(key) is not None
+        assert snapshot.load(snapshot.get_key(manager, {"name": "other"})) is None
+
+    def test_key_callbacks(self, tmp_path: Path) -> None:
+        from wexample_config.classes.config_snapshot import ConfigSnapshot
+        from wexample_config.demo.demo_config_manager import DemoConfigManager
+
+        def _callback(suffix: str) -> Any:
+            return lambda option: f"name_{suffix}"
+
+        manager = DemoConfigManager()
+        snapshot = ConfigSnapshot(path=str(tmp_path / "config.snapshot"))
+
+        # Lambdas share their name, not their code or closure.
+        assert snapshot.get_key(manager, {"name": lambda option: "a"}) != (
+            snapshot.get_key(manager, {"name": lambda option: "b"})
+        )
+        assert snapshot.get_key(manager, {"name": _callback("a")}) != (
+            snapshot.get_key(manager, {"name": _callback("b")})
+        )
+        assert snapshot.get_key(manager, {"name": _callback("a")}) == (
+            snapshot.get_key(manager, {"name": _callback("a")})
+        )
+
+    def test_unreadable(self, tmp_path: Path) -> None:
+        import pickle
+
+        from wexample_config.classes.config_snapshot import ConfigSnapshot
+        from wexample_config.demo.demo_config_manager import DemoConfigManager
+
+        path = tmp_path / "config.snapshot"
+        snapshot = ConfigSnapshot(path=str(path))
+        built = snapshot.load_or_build(DemoConfigManager, _config())
+        key = snapshot.get_key(DemoConfigManager(), _config())
+        content = path.read_bytes()
+
+        # Files left empty or truncated by a crash are rebuilt and overwritten.
+        for broken in (b"", content[: len(content) // 2]):
+            path.write_bytes(broken)
+            assert snapshot.load(key) is None
+
+            rebuilt = snapshot.load_or_build(DemoConfigManager, _config())
+            assert rebuilt.dump() == built.dump()
+            assert snapshot.load(key) is not None
+
+        # Failed writes leave no temporary file behind.
+        with pytest.raises((AttributeError, pickle.PicklingError)):
+            snapshot.write(DemoConfigManager(value={"name": lambda o: "x"}), key)
+        assert [file.name for file in tmp_path.iterdir()] == ["config.snapshot"]
@@ -0,0 +1,136 @@
+from __future__ import annotations
+
+from typing import Any, Union
+
+import pytest
+
+
+class TestConfigValue:
+    def test_type_validator_per_class(self) -> None:
+        from wexample_helpers.exception.not_allowed_variable_type_exception import (
+            NotAllowedVariableTypeException,
+        )
+
+        from wexample_config.config_value.config_value import ConfigValue
+        from wexample_config.config_value.custom_type_config_value import (
+            CustomTypeConfigValue,
+        )
+
+        # Any is never validated.
+        assert ConfigValue._get_type_validator() is None
+        assert ConfigValue(raw=object()).raw is not None
+
+        assert CustomTypeConfigValue(raw="yes").get_str() == "yes"
+        assert CustomTypeConfigValue._get_type_validator() is not None
+        with pytest.raises(NotAllowedVariableTypeException):
+            CustomTypeConfigValue(raw=123)
+
+    def test_type_validator_custom_validation(self) -> None:
+        from wexample_config.config_value.config_value import ConfigValue
+
+        class PositiveConfigValue(ConfigValue):
+            @classmethod
+            def validate_value_type(cls, raw_value: Any, allowed_type: Any) -> None:
+                if raw_value < 0:
+                    raise ValueError("Negative value")
+
+        assert PositiveConfigValue(raw=1).get_int() == 1
+        with pytest.raises(ValueError):
+            PositiveConfigValue(raw=-1)
+
+    @pytest.mark.parametrize(
+        ("allowed_type", "values"),
+        [
+            (
+                Union[str, dict[str, Any]],
+                ["a", {"a": 1}, {1: "a"}, 1, None, ["a"]],
+            ),
+            (
+                dict[str, dict[str, Any]],
+                [{"a": {"b": 1}}, {"a": 1}, {}, [], "a"],
+            ),
+            (list, [[], [1, "a"], (1,), {}, "a"]),
+            (list[dict[str, Any]], [[{"a": 1}], [{"a": 1}, 1], [], {}]),
+            (
+                Union[str, int, bool, float, None],
+                ["a", 1, True, 1.5, None, [], str.upper],
+            ),
+            (str, ["a", 1, None]),
+            (
+                Union[dict[str, Any], set[type[int]]],
+                [{"a": 1}, {bool}, {str}, set(), "a", {1}],
+            ),
+        ],
+    )
+    def test_compiled_validator_matches_reference(
+        self, allowed_type: Any, values: list[Any]
+    ) -> None:
+        from wexample_helpers.exception.not_allowed_variable_type_exception import (
+            NotAllowedVariableTypeException,
+        )
+        from wexample_helpers.helper.type import type_validate_or_fail
+
+        from wexample_config.helper.type import type_compile_validator
+
+        validator = type_compile_validator(allowed_type)
+
+        for value in values:
+            try:
+                type_validate_or_fail(value=value, allowed_type=allowed_type)
+                expected = None
+            except NotAllowedVariableTypeException:
+                expected = NotAllowedVariableTypeException
+
+            if expected is None:
+                validator(value)
+            else:
+                with pytest.raises(expected):
+                    validator(value)
+
+    def test_option_validator_per_class(self) -> None:
+        from wexample_config.config_value.config_value import ConfigValue
+        from wexample_config.demo.config_option.demo_dict_config_option import (
+            DemoDictConfigOption,
+        )
+
+        validator = DemoDictConfigOption._get_raw_value_validator(ConfigValue)
+        assert validator is not None
+        assert DemoDictConfigOption._get_raw_value_validator(ConfigValue) is validator
+
+    def test_resolve_nested_memo(self) -> None:
+        from wexample_config.config_value.config_value import ConfigValue
+
+        last = ConfigValue(raw="leaf")
+        middle = ConfigValue(raw=last)
+        chain = ConfigValue(raw=ConfigValue(raw=middle))
+
+        assert chain._resolve_nested() is last
+        assert chain.get_str() == "leaf"
+
+        # Terminal value changes are read through the memo.
+        last.set_str("other")
+        assert chain.get_str() == "other"
+
+        # Relinking any node of the chain invalidates the memo.
+        relinked = ConfigValue(raw=3)
+        middle.set_int(relinked, type_check=False)
+        assert chain._resolve_nested() is relinked
+        assert chain.get_int() == 3
+
+        middle.set_int(5)
+        assert chain._resolve_nested() is middle
+        assert chain.to_str() == "5"
+
+        # So does replacing the raw value of the chain head.
+        chain.raw = ConfigValue(raw=1.5)
+        assert chain.get_float() == 1.5
+
+        # Or assigning raw of an intermediate node directly.
+        first = ConfigValue(raw=1)
+        second = ConfigValue(raw=first)
+        chain = ConfigValue(raw=second)
+        assert chain.get_int() == 1
+        second.raw = ConfigValue(raw=9)
+        assert chain.get_int() == 9
+        second.raw = 7
+        assert chain._resolve_nested() is second
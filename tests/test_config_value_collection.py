@@ -0,0 +1,139 @@
+from __future__ import annotations
+
+from typing import Any
+
+import pytest
+
+_RAW_VALUES: list[Any] = [1, 2.5, None, "3", True, -(2**63), 0.0, False]
+
+
+class TestConfigValueCollection:
+    @pytest.mark.parametrize(
+        "getter,typecode",
+        [("bool", "B"), ("float", "d"), ("int", "q")],
+    )
+    def test_typed_array(self, getter: str, typecode: str) -> None:
+        from wexample_config.config_value.config_value import ConfigValue
+        from wexample_config.config_value.config_value_collection import (
+            ConfigValueCollection,
+        )
+
+        collection = ConfigValueCollection.from_raw_values(_RAW_VALUES)
+        # Nested values are resolved as get_*_or_none() does.
+        collection.append(ConfigValue(raw=ConfigValue(raw=_RAW_VALUES[0])))
+
+        result = getattr(collection, f"get_{getter}_array")()
+        expected = getattr(collection, f"get_{getter}_or_none_collection")()
+
+        assert result.values.typecode == typecode
+        assert result.to_list() == expected
+        assert list(result.mask) == [value is not None for value in expected]
+        assert result.has_invalid()
+
+    def test_typed_array_overflow(self) -> None:
+        from wexample_config.config_value.config_value_collection import (
+            ConfigValueCollection,
+        )
+
+        collection = ConfigValueCollection.from_raw_values([1, 2**64])
+
+        with pytest.raises(OverflowError):
+            collection.get_int_array()
+
+    def test_typed_array_numpy(self) -> None:
+        numpy = pytest.importorskip("numpy")
+
+        from wexample_config.config_value.config_value_collection import (
+            ConfigValueCollection,
+        )
+
+        result = ConfigValueCollection.from_raw_values(
+            [1.5, None, 3.0]
+        ).get_float_array()
+        masked = result.to_numpy()
+
+        assert masked.dtype == numpy.float64
+        assert masked.mask.tolist() == [False, True, False]
+        assert masked.sum() == 4.5
+
+    @pytest.mark.parametrize(
+        "raw_values",
+        [
+            [1, None, 3, -(2**63)],
+            [0.5, 1.5],
+            [True, False, None],
+            ["a", None, "b"],
+            [None, None],
+            [1, "a", 2.5, True, None, {"a": 1}],
+        ],
+    )
+    def test_columnar(self, raw_values: list[Any]) -> None:
+        from wexample_config.config_value.columnar_config_value_collection import (
+            ColumnarConfigValueCollection,
+        )
+        from wexample_config.config_value.config_value import ConfigValue
+        from wexample_config.config_value.config_value_collection import (
+            ConfigValueCollection,
+        )
+
+        columnar = ColumnarConfigValueCollection.from_raw_values(raw_values)
+        reference = ConfigValueCollection.from_config_values(
+            [ConfigValue(raw=raw) for raw in raw_values]
+        )
+
+        assert len(columnar) == len(reference)
+        assert columnar == reference
+        assert list(columnar.items) == reference.items
+        assert columnar[-1] == reference[-1]
+        assert columnar[1:] == reference[1:]
+        assert columnar.map(lambda item: item.raw) == raw_values
+
+        for name in ("bool", "float", "int", "str"):
+            for method in (
+                f"get_{name}_collection",
+                f"get_{name}_or_none_collection",
+                f"to_{name}_collection",
+            ):
+                try:
+                    expected = getattr(reference, method)()
+                except (TypeError, ValueError) as error:
+                    with pytest.raises(type(error)):
+                        getattr(columnar, method)()
+                else:
+                    assert getattr(columnar, method)() == expected
+
+        for name in ("bool", "float", "int"):
+            assert (
+                getattr(columnar, f"get_{name}_array")().to_list()
+                == getattr(reference, f"get_{name}_array")().to_list()
+            )
+
+    def test_columnar_selection(self) -> None:
+        from wexample_config.config_value.columnar_config_value_collection import (
+            ColumnarConfigValueCollection,
+        )
+        from wexample_config.config_value.config_value import ConfigValue
+        from wexample_config.config_value.config_value_collection import (
+            ConfigValueCollection,
+        )
+
+        # Opt-in: collections of raw values keep their items by default.
+        assert not isinstance(
+            ConfigValueCollection.from_raw_values([1, None, 2]),
+            ColumnarConfigValueCollection,
+        )
+        assert ColumnarConfigValueCollection.is_columnar([1, None, 2])
+        for raw_values in ([], [1, 2.5], [{"a": 1}]):
+            assert not ColumnarConfigValueCollection.is_columnar(raw_values)
+
+        collection = ColumnarConfigValueCollection.from_raw_values([1, None, 2])
+        assert collection == ConfigValueCollection.from_raw_values([1, None, 2])
+
+        # Values appended as given are returned as is.
+        value = ConfigValue(raw=[1])
+        collection.append(value)
+        assert collection[-1] is value
+
+        # Items are views, changes to them would not be stored.
+        with pytest.raises(AttributeError):
+            collection.items.append(value)
@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+import io
+import json
+from typing import Any
+
+import pytest
+
+_RAW: dict[str, Any] = {
+    "app": {
+        "server": {"host": "localhost", "port": 8080, "ratio": 0.5},
+        "handlers": ["console", {"name": "file", "path": '/tmp/"log"\n'}],
+    },
+    "debug": True,
+    "cache": None,
+    "empty": {},
+    "unicode": "éሴ",
+}
+
+
+class TestConfigValueLoader:
+    @pytest.mark.parametrize("chunk_size", [1, 3, 64, 65536])
+    def test_load_json(self, chunk_size: int) -> None:
+        from wexample_config.classes.config_value_loader import ConfigValueLoader
+        from wexample_config.config_value.nested_config_value import (
+            NestedConfigValue,
+        )
+        from wexample_config.helper.json import json_iter_events
+
+        stream = io.StringIO(json.dumps(_RAW, indent=2))
+        value = ConfigValueLoader().load_events(
+            json_iter_events(stream, chunk_size=chunk_size)
+        )
+
+        assert isinstance(value, NestedConfigValue)
+        assert isinstance(value.search("app.handlers"), NestedConfigValue)
+        assert value.search("app.handlers.1.name").get_str() == "file"
+        assert value.to_dict() == _RAW
+
+    @pytest.mark.parametrize(
+        "text", ['{"a": 1,}', '{"a" 1}', "[1 2]", '{"a": 1} x', "[", "[tru]"]
+    )
+    def test_load_json_invalid(self, text: str) -> None:
+        from wexample_config.classes.config_value_loader import ConfigValueLoader
+
+        with pytest.raises(json.JSONDecodeError):
+            ConfigValueLoader().load_json(io.StringIO(text))
+
+    def test_load_filtered(self) -> None:
+        from wexample_config.classes.config_value_loader import ConfigValueLoader
+
+        text = json.dumps(_RAW)
+
+        value = ConfigValueLoader(paths=["app.server", "debug"]).load_json(
+            io.StringIO(text)
+        )
+        assert value.to_dict() == {
+            "app": {"server": _RAW["app"]["server"]},
+            "debug": True,
+        }
+
+        value = ConfigValueLoader(paths=["app/handlers/1"], separator="/").load_json(
+            io.StringIO(text)
+        )
+        # Skipped items are kept as placeholders, loaded ones keep their index.
+        assert value.to_dict() == {
+            "app": {"handlers": [None, _RAW["app"]["handlers"][1]]}
+        }
+        assert value.search("app.handlers.1.name").get_str() == "file"
+
+        value = ConfigValueLoader(paths=["a.h.1.n"]).load_json(
+            io.StringIO('{"a": {"h": [{"n": "e"}, {"n": "f"}, {"n": "g"}]}}')
+        )
+        assert value.to_dict() == {"a": {"h": [None, {"n": "f"}]}}
+        assert value.search("a.h.1.n").get_str() == "f"
+        assert value.search("a.h.0").is_none()
+
+        value = ConfigValueLoader(max_depth=1).load_json(io.StringIO(text))
+        assert value.to_dict() == {
+            "app": {},
+            "debug": True,
+            "cache": None,
+            "empty": {},
+            "unicode": _RAW["unicode"],
+        }
+
+    def test_load_yaml(self) -> None:
+        yaml = pytest.importorskip("yaml")
+
+        from wexample_config.classes.config_value_loader import ConfigValueLoader
+
+        text = yaml.safe_dump(_RAW)
+
+        assert ConfigValueLoader().load_yaml(io.StringIO(text)).to_dict() == _RAW
+        assert ConfigValueLoader(paths=["app.server.port"]).load_yaml(
+            io.StringIO(text)
+        ).to_dict() == {"app": {"server": {"port": 8080}}}
+
+        with pytest.raises(ValueError):
+            ConfigValueLoader().load_yaml(io.StringIO("a: &x 1\nb: *x\n"))
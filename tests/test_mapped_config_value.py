@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+_RAW: dict[str, Any] = {
+    "app": {
+        "server": {"host": "localhost", "port": 8080, "ratio": 0.5},
+        "handlers": ["console", {"name": "file"}],
+    },
+    "debug": True,
+    "cache": None,
+    "big": 2**70,
+    "unicode": "éሴ",
+}
+
+
+class TestMappedConfigValue:
+    def test_read(self, tmp_path: Path) -> None:
+        from wexample_config.config_value.mapped_config_value import (
+            MappedConfigValue,
+        )
+
+        path = str(tmp_path / "config.bin")
+        MappedConfigValue.write_file(_RAW, path)
+        value = MappedConfigValue.open(path)
+
+        assert value.to_dict() == _RAW
+        assert value.search("app.server.port").get_int() == 8080
+        assert value.search("app.server.ratio").get_float() == 0.5
+        assert value.search("app.handlers.-1.name").get_str() == "file"
+        assert value.search("app/server/host", separator="/").get_str() == ("localhost")
+        assert value.search("app.missing", default=5).get_int() == 5
+        assert value.get_config_item("big").get_int() == 2**70
+        assert value.get_config_item("cache").is_none()
+        assert value.get_config_item("debug").is_true()
+        assert value.get_config_item("unicode").get_str() == "éሴ"
+        assert value.search("app.handlers").to_list() == _RAW["app"]["handlers"]
+        assert list(value.get_dict()) == list(_RAW)
+
+        with pytest.raises(TypeError):
+            value.search("app.server.port").set_int(9090)
+        with pytest.raises(TypeError):
+            value.search("app.server.port").get_str()
+
+    def test_type_checks(self, tmp_path: Path, monkeypatch: Any) -> None:
+        from wexample_config.config_value.mapped_config_value import (
+            MappedConfigValue,
+        )
+
+        path = str(tmp_path / "config.bin")
+        MappedConfigValue.write_file(_RAW, path)
+        value = MappedConfigValue.open(path)
+        native = {key: value.get_config_item(key) for key in _RAW}
+
+        # Type checks read the tag of the node, nothing is decoded.
+        monkeypatch.setattr(MappedConfigValue, "raw", property(pytest.fail))
+        assert value.is_dict() and not value.is_list() and not value.is_str()
+        assert value.search("app.handlers").is_list()
+        assert not value.search("app.handlers").is_tuple()
+        assert value.search("app.server.ratio").is_float()
+        assert native["debug"].is_bool() and native["debug"].is_int()
+        assert native["big"].is_int() and not native["big"].is_bool()
+        assert native["cache"].is_none() and not native["unicode"].is_none()
+        assert native["unicode"].is_str()
+
+    def test_write_config_value(self, tmp_path: Path) -> None:
+        from wexample_config.config_value.mapped_config_value import (
+            MappedConfigValue,
+        )
+        from wexample_config.config_value.nested_config_value import (
+            NestedConfigValue,
+        )
+
+        path = str(tmp_path / "config.bin")
+        MappedConfigValue.write_file(NestedConfigValue(raw=dict(_RAW)), path)
+
+        assert MappedConfigValue.open(path).to_dict() == _RAW
+
+        with pytest.raises(TypeError):
+            MappedConfigValue.write_file({"set": {1, 2}}, path)
+        # Failed writes leave the previous file, and no temporary file.
+        assert list(tmp_path.iterdir()) == [tmp_path / "config.bin"]
+        assert MappedConfigValue.open(path).to_dict() == _RAW
+
+    def test_open_invalid(self, tmp_path: Path) -> None:
+        from wexample_config.config_value.mapped_config_value import (
+            MappedConfigValue,
+        )
+
+        path = tmp_path / "config.bin"
+        for content in (b"short", b"x" * 64):
+            path.write_bytes(content)
+            with pytest.raises(ValueError):
+                MappedConfigValue.open(str(path))
@@ -0,0 +1,239 @@
+from __future__ import annotations
+
+from typing import Any
+
+import pytest
+
+_RAW: dict[str, Any] = {
+    "app": {
+        "server": {"host": "localhost", "port": 8080},
+        "handlers": ["console", {"name": "file"}],
+    },
+    "debug": True,
+}
+
+
+def _raw() -> dict[str, Any]:
+    import copy
+
+    return copy.deepcopy(_RAW)
+
+
+class TestNestedConfigValue:
+    def test_lazy_keeps_children_raw(self) -> None:
+        from wexample_config.config_value.nested_config_value import (
+            NestedConfigValue,
+        )
+
+        value = NestedConfigValue(raw=_raw(), lazy=True)
+
+        assert isinstance(value.raw["app"], dict)
+        assert value.search("app.server.port").get_int() == 8080
+        # Touched path is wrapped and cached, siblings stay raw.
+        app = value.raw["app"]
+        assert isinstance(app, NestedConfigValue)
+        assert app.lazy
+        assert isinstance(app.raw["handlers"], list)
+        assert value.search("app") is app
+        assert value.search("app.handlers.1.name").get_str() == "file"
+        assert value.search("app.handlers.-1.name").get_str() == "file"
+
+    def test_lazy_mutations(self) -> None:
+        from wexample_config.config_value.nested_config_value import (
+            NestedConfigValue,
+        )
+
+        value = NestedConfigValue(raw=_raw(), lazy=True)
+        value.set_by_path("app.server.port", 9090)
+        value.update_nested({"app": {"server": {"host": "example.com"}}})
+
+        expected = _raw()
+        expected["app"]["server"] = {"host": "example.com", "port": 9090}
+        assert value.to_dict() == expected
+
+    def test_lazy_to_dict_matches_eager(self) -> None:
+        from wexample_config.config_value.nested_config_value import (
+            NestedConfigValue,
+        )
+
+        raw = _raw()
+        app = raw["app"]
+        lazy = NestedConfigValue(raw=raw, lazy=True)
+        lazy.search("app.handlers.1.name")
+
+        assert lazy.to_dict() == NestedConfigValue(raw=_raw()).to_dict()
+        # Nested source containers are never modified by lazy caching.
+        assert app == _RAW["app"]
+
+    def test_search_compiled_path(self) -> None:
+        from wexample_config.classes.config_path import ConfigPath
+        from wexample_config.config_value.nested_config_value import (
+            NestedConfigValue,
+        )
+
+        value = NestedConfigValue(raw={**_raw(), "0": "zero"})
+        path = ConfigPath.from_string("app/handlers/1/name", "/")
+
+        assert path is ConfigPath.from_string("app/handlers/1/name", "/")
+        assert path.segments[2] == ("1", 1)
+        assert value.search(path).get_str() == "file"
+        # Numeric keys are still plain keys on dicts.
+        assert value.search("0").get_str() == "zero"
+        assert value.search("app.missing", default=5).get_int() == 5
+        assert value.search("") is value
+
+        value.set_by_path(ConfigPath.from_string("app.server.port"), 9090)
+        assert value.get_config_item("app").get_config_item("server").to_dict() == {
+            "host": "localhost",
+            "port": 9090,
+        }
+
+    def test_derive(self) -> None:
+        from wexample_config.config_value.nested_config_value import (
+            NestedConfigValue,
+        )
+
+        base = NestedConfigValue(raw=_raw())
+        tenant = base.derive({"app": {"server": {"port": 9090}}})
+
+        assert tenant.search("app.server.port").get_int() == 9090
+        assert base.search("app.server.port").get_int() == 8080
+        # Only the overridden path is copied.
+        assert tenant.search("app.handlers") is base.search("app.handlers")
+        assert tenant.search("debug") is base.search("debug")
+        assert tenant.search("app") is not base.search("app")
+
+        other = tenant.derive()
+        other.set_by_path("app.handlers", [])
+        base.set_by_path("app.server.host", "example.com")
+
+        assert other.search("app.server.host").get_str() == "localhost"
+        assert tenant.search("app.server.host").get_str() == "localhost"
+        assert tenant.search("app.handlers.0").get_str() == "console"
+        assert other.to_dict()["app"]["handlers"] == []
+        assert tenant.to_dict() == {
+            **_raw(),
+            "app": {**_RAW["app"], "server": {"host": "localhost", "port": 9090}},
+        }
+
+    def test_subscriptions(self) -> None:
+        from wexample_config.config_value.nested_config_value import (
+            NestedConfigValue,
+        )
+
+        value = NestedConfigValue(raw=_raw())
+        calls: dict[str, list[list[str]]] = {"server": [], "app": [], "all": []}
+
+        def _server(paths: list[str]) -> None:
+            calls["server"].append(paths)
+
+        value.subscribe("app.server", _server)
+        value.subscribe("app", lambda paths: calls["app"].append(paths))
+        value.subscribe("", lambda paths: calls["all"].append(paths))
+
+        # Descendants, ancestors and the path itself match.
+        value.set_by_path("app.server.port", 9090)
+        value.set_by_path("app", {"server": {"port": 1}})
+        value.set_by_path("debug", False)
+        assert calls["server"] == [["app.server.port"], ["app"]]
+        assert calls["app"] == [["app.server.port"], ["app"]]
+        assert calls["all"] == [["app.server.port"], ["app"], ["debug"]]
+
+        # One call per update, and per batch.
+        value.update_nested({"app": {"server": {"host": "a", "port": 2}}})
+        assert calls["server"][-1] == ["app.server.host", "app.server.port"]
+
+        subscriptions = value.get_subscriptions()
+        with subscriptions.batch():
+            value.set_by_path("app.server.host", "b")
+            value.update_nested({"app": {"server": {"host": "c"}}, "debug": True})
+            assert len(calls["all"]) == 4
+        assert calls["all"][-1] == ["app.server.host", "debug"]
+        assert calls["server"][-1] == ["app.server.host"]
+
+        value.unsubscribe("app.server", _server)
+        assert "server" not in subscriptions._root.children["app"].children
+        value.set_by_path("app.server.port", 3)
+        assert len(calls["server"]) == 4
+
+        # Snapshots don't notify the subscribers of their base.
+        value.derive({"debug": False}).set_by_path("app.server.port", 4)
+        assert len(calls["all"]) == 6
+
+    def test_indexed(self) -> None:
+        from wexample_config.config_value.nested_config_value import (
+            NestedConfigValue,
+        )
+
+        value = NestedConfigValue.indexed(_raw())
+
+        assert value.search("app.handlers.1.name").get_str() == "file"
+        assert value.search("app.server").to_dict() == _RAW["app"]["server"]
+        assert value.search("app.server.missing", default=1).get_int() == 1
+
+        value.set_by_path("app.server", {"url": "https://example.com"})
+        assert value.search("app.server.port").is_none()
+        assert value.search("app.server.url").get_str() == "https://example.com"
+
+        value.update_nested({"app": {"handlers": ["console"]}, "debug": False})
+        assert value.search("app.handlers.1.name").is_none()
+        assert value.search("debug").get_bool() is False
+        assert value._index is not None
+        assert sorted(value._index) == [
+            "app.handlers.0",
+            "app.server.url",
+            "debug",
+        ]
+
+        # Keys containing the separator never shadow the nested path.
+        value = NestedConfigValue.indexed({"a": {"b": 2}, "a.b": 1})
+        assert value.search("a.b").get_int() == 2
+        value.update_nested({"a.b": 3})
+        value.set_by_path("x/a.b", 4, create_missing=True, separator="/")
+        assert value.search("a.b").get_int() == 2
+        assert sorted(value._index) == ["a.b"]
+
+    def test_compact(self) -> None:
+        from wexample_config.config_value.compact_config_value import (
+            CompactConfigValue,
+        )
+        from wexample_config.config_value.compact_nested_config_value import (
+            CompactNestedConfigValue,
+        )
+        from wexample_config.config_value.nested_config_value import (
+            NestedConfigValue,
+        )
+
+        value = CompactNestedConfigValue(raw=_raw())
+        port = value.search("app.server.port")
+
+        assert isinstance(port, CompactConfigValue)
+        assert not hasattr(port, "__dict__")
+        assert port.is_int() and port.get_int() == 8080 and port.to_str() == "8080"
+        assert isinstance(value.search("app.handlers"), CompactNestedConfigValue)
+        assert value.to_dict() == NestedConfigValue(raw=_raw()).to_dict()
+
+        port.set_int(9090)
+        assert value.search("app.server.port").get_int() == 9090
+
+    def test_compact_option(self) -> None:
+        from wexample_helpers.exception.not_allowed_variable_type_exception import (
+            NotAllowedVariableTypeException,
+        )
+
+        from wexample_config.config_option.config_option import ConfigOption
+        from wexample_config.config_value.compact_config_value import (
+            CompactConfigValue,
+        )
+
+        # Compact values are config values for options, not opaque raw values.
+        option = ConfigOption(value=CompactConfigValue(raw="value"))
+        assert option.get_value().get_str() == "value"
+        assert option.dump() == "value"
+
+        validator = CompactConfigValue.compile_type_validator(int)
+        validator(1)
+        with pytest.raises(NotAllowedVariableTypeException):
+            validator("value")
+        with pytest.raises(NotAllowedVariableTypeException):
+            CompactConfigValue.validate_value_type("value", int)
@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+from typing import Any
+
+
+class TestOptionsBuildPlan:
+    def test_compile(self) -> None:
+        from wexample_config.classes.options_build_plan import OptionsBuildPlan
+        from wexample_config.classes.options_registry import OptionsRegistry
+        from wexample_config.config_option.abstract_config_option import (
+            AbstractConfigOption,
+        )
+        from wexample_config.config_option.children_config_option import (
+            ChildrenConfigOption,
+        )
+        from wexample_config.config_option.name_config_option import NameConfigOption
+
+        class CacheConfigOption(AbstractConfigOption):
+            @classmethod
+            def get_name(cls) -> str:
+                return "cache_*"
+
+            @classmethod
+            async def aresolve_config(cls, config: dict[str, Any]) -> dict[str, Any]:
+                return config
+
+        plan = OptionsBuildPlan(
+            OptionsRegistry.from_options(
+                [ChildrenConfigOption, NameConfigOption, CacheConfigOption]
+            )
+        )
+
+        # Only classes overriding a resolve hook are run.
+        assert plan.resolve_hooks == (NameConfigOption, CacheConfigOption)
+        assert plan.async_resolve_hooks == (CacheConfigOption,)
+        assert plan.get_constructor("name") is NameConfigOption
+        assert plan.get_constructor("cache_files") is CacheConfigOption
+        assert plan.get_constructor("other") is None
+        assert plan.get_unknown_names({"name", "cache_files", "other"}) == {"other"}
+
+    def test_manager(self) -> None:
+        from wexample_config.config_option.children_config_option import (
+            ChildrenConfigOption,
+        )
+        from wexample_config.demo.demo_config_manager import DemoConfigManager
+
+        manager = DemoConfigManager(allow_undefined_keys=True)
+        manager.set_value(
+            {
+                "name": lambda option: "app",
+                "children": [{"name": "child"}],
+                "undefined": {"key": "value"},
+            }
+        )
+
+        # Compiled once per option type and providers, shared by every build.
+        plan = manager.get_build_plan()
+        assert DemoConfigManager().get_build_plan() is plan
+        assert manager.get_allowed_options_registry() is plan.registry
+
+        children = manager.get_option(ChildrenConfigOption)
+        assert children.children[0].get_build_plan() is not plan
+        assert manager.dump() == {
+            "name": "app",
+            "children": [{"name": "child"}],
+            "undefined": {"key": "value"},
+        }
@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+from typing import Any
+
+import pytest
+
+
+def _pattern_classes() -> tuple[type, type, type]:
+    from wexample_config.config_option.abstract_config_option import (
+        AbstractConfigOption,
+    )
+
+    class CacheConfigOption(AbstractConfigOption):
+        @classmethod
+        def get_name(cls) -> str:
+            return "cache_*"
+
+    class CacheRedisConfigOption(AbstractConfigOption):
+        @classmethod
+        def get_name(cls) -> str:
+            return "cache_redis_*"
+
+    class WorkerConfigOption(AbstractConfigOption):
+        @classmethod
+        def get_name(cls) -> str:
+            return "worker_[0-9]"
+
+    return CacheConfigOption, CacheRedisConfigOption, WorkerConfigOption
+
+
+class TestOptionsRegistry:
+    def test_match(self) -> None:
+        from wexample_config.classes.options_registry import OptionsRegistry
+        from wexample_config.config_option.name_config_option import NameConfigOption
+
+        cache, cache_redis, worker = _pattern_classes()
+        registry = OptionsRegistry.from_options(
+            [NameConfigOption, cache, cache_redis, worker]
+        )
+
+        assert registry["name"] is NameConfigOption
+        assert registry["cache_files"] is cache
+        # The longest literal prefix wins.
+        assert registry["cache_redis_main"] is cache_redis
+        assert registry["worker_1"] is worker
+        assert "worker_10" not in registry
+        assert "Cache_files" not in registry
+        assert registry.get("other") is None
+        with pytest.raises(KeyError):
+            registry["other"]
+
+        assert list(registry.values()) == [NameConfigOption, cache, cache_redis, worker]
+        assert registry.get_unknown_names({"name", "cache_a", "other"}) == {"other"}
+
+    def test_manager(self) -> None:
+        import gc
+
+        from wexample_config.config_option.abstract_nested_config_option import (
+            _BUILD_PLAN_CACHE,
+        )
+        from wexample_config.demo.demo_config_manager import DemoConfigManager
+        from wexample_config.exception.invalid_option_exception import (
+            InvalidOptionException,
+        )
+        from wexample_config.options_provider.abstract_options_provider import (
+            AbstractOptionsProvider,
+        )
+
+        cache, cache_redis, _worker = _pattern_classes()
+
+        class CacheOptionsProvider(AbstractOptionsProvider):
+            @classmethod
+            def get_options(cls) -> list[type[Any]]:
+                return [cache, cache_redis]
+
+        class CacheConfigManager(DemoConfigManager):
+            def get_options_providers(self) -> list[type[AbstractOptionsProvider]]:
+                return super().get_options_providers() + [CacheOptionsProvider]
+
+        manager = CacheConfigManager()
+        manager.set_value({"name": "app", "cache_files": "a", "cache_redis_main": "b"})
+
+        assert isinstance(manager.get_option("cache_files"), cache)
+        assert isinstance(manager.get_option("cache_redis_main"), cache_redis)
+        assert manager.dump() == {
+            "name": "app",
+            "cache_files": "a",
+            "cache_redis_main": "b",
+        }
+
+        with pytest.raises(InvalidOptionException):
+            CacheConfigManager().set_value({"other": "c"})
+
+        # Build plans cached for a collected provider are dropped.
+        size = len(_BUILD_PLAN_CACHE)
+        del manager, CacheConfigManager, CacheOptionsProvider
+        gc.collect()
+        assert len(_BUILD_PLAN_CACHE) == size - 1
@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+
+class TestWeakLruCache:
+    def test_lru(self) -> None:
+        from wexample_config.classes.weak_lru_cache import WeakLruCache
+
+        classes = [type(f"Class{i}", (), {}) for i in range(4)]
+        cache = WeakLruCache(max_size=3)
+
+        for i, class_type in enumerate(classes[:3]):
+            cache.set(class_type, i)
+        assert cache.get(classes[0]) == 0
+
+        # Class1 is the least recently used.
+        cache.set(classes[3], 3)
+        assert cache.get(classes[1]) is None
+        assert [cache.get(class_type) for class_type in classes] == [0, None, 2, 3]
+        assert cache.get_stats() == {
+            "collections": 0,
+            "evictions": 1,
+            "hits": 4,
+            "max_size": 3,
+            "misses": 2,
+            "size": 3,
+        }
+
+    def test_collected_keys(self) -> None:
+        import gc
+
+        from wexample_config.classes.weak_lru_cache import WeakLruCache
+
+        cache = WeakLruCache(max_size=10)
+        manager_type = type("Manager", (), {})
+        provider_type = type("Provider", (), {})
+        other_type = type("Other", (), {})
+
+        cache.set((manager_type, provider_type), "registry")
+        cache.set((manager_type, other_type), "other registry")
+        cache.set(provider_type, False)
+        cache.set((provider_type, other_type), None)
+        assert cache.get((manager_type, provider_type)) == "registry"
+        assert cache.get(provider_type) is False
+
+        del provider_type
+        gc.collect()
+
+        assert len(cache) == 1
+        assert cache.get((manager_type, other_type)) == "other registry"
+        # Cached None values are counted as well.
+        assert cache.get_stats()["collections"] == 3
+
+    def test_nested_option_caches(self) -> None:
+        from wexample_config.config_option.abstract_nested_config_option import (
+            AbstractNestedConfigOption,
+        )
+        from wexample_config.demo.demo_config_manager import DemoConfigManager
+
+        DemoConfigManager().set_value({"name": "first"})
+        before = AbstractNestedConfigOption.get_cache_stats()
+        DemoConfigManager().set_value({"name": "second"})
+        after = AbstractNestedConfigOption.get_cache_stats()
+
+        assert after["build_plan"]["hits"] > before["build_plan"]["hits"]
+        assert after["build_plan"]["misses"] == before["build_plan"]["misses"]